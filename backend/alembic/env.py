@@ -9,8 +9,14 @@ from alembic import context
 from app.core.database import Base
 from app.models.user import User
 from app.models.workout import Workout, Exercise
-from app.models.nutrition import Meal, WaterLog
-from app.models.shopping import ShoppingItem
+from app.models.nutrition import Meal, WaterLog, MealSuggestion
+from app.models.shopping import ShoppingItem, ShoppingCategoryOverride
+from app.models.food import Food
+from app.models.recipe import Recipe, RecipeIngredient
+from app.models.progress import DailyRollup, UserStreak
+from app.models.archive import HistoryArchive
+from app.models.job import Job
+from app.models.rate_limit import RateLimitBucket
 from app.core.config import settings
 
 # this is the Alembic Config object
@@ -0,0 +1,46 @@
+"""Food catalog with trigram search
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_table(
+        'foods',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('brand', sa.String(255), nullable=True),
+        sa.Column('barcode', sa.String(64), nullable=True),
+        sa.Column('calories', sa.Float(), nullable=False),
+        sa.Column('protein', sa.Float(), nullable=True),
+        sa.Column('carbs', sa.Float(), nullable=True),
+        sa.Column('fat', sa.Float(), nullable=True),
+        sa.Column('fiber', sa.Float(), nullable=True),
+        sa.Column('source', sa.String(50), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_foods_barcode', 'foods', ['barcode'])
+    op.execute('CREATE INDEX ix_foods_name_trgm ON foods USING gin (name gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_foods_name_trgm', table_name='foods')
+    op.drop_index('ix_foods_barcode', table_name='foods')
+    op.drop_table('foods')
@@ -0,0 +1,47 @@
+"""Meal suggestions index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'meal_suggestions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('meal_type', postgresql.ENUM(name='mealtype', create_type=False), nullable=False),
+        sa.Column('signature', sa.String(40), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('calories', sa.Integer(), nullable=True),
+        sa.Column('protein', sa.Float(), nullable=True),
+        sa.Column('carbs', sa.Float(), nullable=True),
+        sa.Column('fat', sa.Float(), nullable=True),
+        sa.Column('fiber', sa.Float(), nullable=True),
+        sa.Column('serving_size', sa.String(100), nullable=True),
+        sa.Column('score', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('use_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('mean_hour', sa.Float(), nullable=False, server_default='12'),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'meal_type', 'signature')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('meal_suggestions')
@@ -0,0 +1,66 @@
+"""Recipes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'recipes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('meal_type', postgresql.ENUM(name='mealtype', create_type=False), nullable=True),
+        sa.Column('servings', sa.Float(), nullable=False, server_default='1'),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('calories', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('protein', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('carbs', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fat', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fiber', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recipes_user_id'), 'recipes', ['user_id'], unique=False)
+
+    op.create_table(
+        'recipe_ingredients',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('recipe_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('quantity', sa.String(100), nullable=True),
+        sa.Column('category', postgresql.ENUM(name='shoppingcategory', create_type=False), nullable=False),
+        sa.Column('calories', sa.Integer(), nullable=True),
+        sa.Column('protein', sa.Float(), nullable=True),
+        sa.Column('carbs', sa.Float(), nullable=True),
+        sa.Column('fat', sa.Float(), nullable=True),
+        sa.Column('fiber', sa.Float(), nullable=True),
+        sa.Column('order', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recipe_ingredients_recipe_id'), 'recipe_ingredients', ['recipe_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_recipe_ingredients_recipe_id'), table_name='recipe_ingredients')
+    op.drop_table('recipe_ingredients')
+    op.drop_index(op.f('ix_recipes_user_id'), table_name='recipes')
+    op.drop_table('recipes')
@@ -0,0 +1,28 @@
+"""Shopping pending item name index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX ix_shopping_items_pending_name '
+        'ON shopping_items (user_id, lower(name)) WHERE NOT is_purchased'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_shopping_items_pending_name', table_name='shopping_items')
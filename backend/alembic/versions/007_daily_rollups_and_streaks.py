@@ -0,0 +1,77 @@
+"""Daily rollups and streaks
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('calories', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('protein', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('carbs', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fat', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('fiber', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('meals_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('water_glasses', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('workouts_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('workout_minutes', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'day')
+    )
+
+    op.create_table(
+        'user_streaks',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('goal', sa.String(20), nullable=False),
+        sa.Column('current_start', sa.Date(), nullable=True),
+        sa.Column('current_end', sa.Date(), nullable=True),
+        sa.Column('longest', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'goal')
+    )
+
+    # Backfill rollups from existing history
+    op.execute("""
+        INSERT INTO daily_rollups (user_id, day, calories, protein, carbs, fat, fiber, meals_count,
+                                   water_glasses, workouts_count, workout_minutes)
+        SELECT user_id, day, sum(calories), sum(protein), sum(carbs), sum(fat), sum(fiber), sum(meals_count),
+               sum(water_glasses), sum(workouts_count), sum(workout_minutes)
+        FROM (
+            SELECT user_id, meal_date AS day, coalesce(calories, 0) AS calories, coalesce(protein, 0) AS protein,
+                   coalesce(carbs, 0) AS carbs, coalesce(fat, 0) AS fat, coalesce(fiber, 0) AS fiber,
+                   1 AS meals_count, 0 AS water_glasses, 0 AS workouts_count, 0 AS workout_minutes
+            FROM meals
+            UNION ALL
+            SELECT user_id, log_date, 0, 0, 0, 0, 0, 0, glasses, 0, 0 FROM water_logs
+            UNION ALL
+            SELECT user_id, workout_date, 0, 0, 0, 0, 0, 0, 0, 1, duration_minutes FROM workouts
+        ) AS entries
+        GROUP BY user_id, day
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_streaks')
+    op.drop_table('daily_rollups')
@@ -0,0 +1,124 @@
+"""Partition meals, water_logs and workouts by month
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> partition key column
+TABLES = {
+    'meals': 'meal_date',
+    'water_logs': 'log_date',
+    'workouts': 'workout_date',
+}
+
+# Months created beyond the current one; the app keeps this window moving
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition(table: str, column: str) -> None:
+    old = f'{table}_unpartitioned'
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    op.execute(f'ALTER INDEX {table}_pkey RENAME TO {old}_pkey')
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {table}_user_id_fkey TO {old}_user_id_fkey')
+
+    # The primary key of a partitioned table has to include the partition key
+    op.execute(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE ({column})'
+    )
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, {column})')
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey '
+        f'FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE'
+    )
+    op.execute(f'CREATE INDEX ix_{table}_user_id_{column} ON {table} (user_id, {column})')
+    # Keep the id sequence alive when the old table is dropped
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+
+    first = op.get_bind().execute(sa.text(f'SELECT min({column}) FROM {old}')).scalar()
+    current = date.today().replace(day=1)
+    month = min(first.replace(day=1), current) if first else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = end
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+
+
+def upgrade() -> None:
+    # Exercises can't keep a foreign key to workouts.id once it is no longer
+    # unique on its own; deletes cascade through a trigger instead
+    op.drop_constraint('exercises_workout_id_fkey', 'exercises', type_='foreignkey')
+    op.create_index('ix_exercises_workout_id', 'exercises', ['workout_id'])
+
+    for table, column in TABLES.items():
+        _partition(table, column)
+        op.execute(f'DROP TABLE {table}_unpartitioned')
+
+    # A statement trigger with a transition table, so rows moved between
+    # partitions by a date change (a delete plus an insert) keep their exercises
+    op.execute("""
+        CREATE FUNCTION delete_workout_exercises() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM exercises WHERE workout_id IN (SELECT id FROM deleted_workouts);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER workouts_delete_exercises
+        AFTER DELETE ON workouts
+        REFERENCING OLD TABLE AS deleted_workouts
+        FOR EACH STATEMENT EXECUTE FUNCTION delete_workout_exercises()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER workouts_delete_exercises ON workouts')
+    op.execute('DROP FUNCTION delete_workout_exercises()')
+
+    for table in TABLES:
+        old = f'{table}_partitioned'
+        op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {old}_pkey')
+        op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {table}_user_id_fkey TO {old}_user_id_fkey')
+        op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)')
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fkey '
+            f'FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE'
+        )
+        op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+        # Drops every partition with it
+        op.execute(f'DROP TABLE {old}')
+
+    op.execute('DELETE FROM exercises WHERE workout_id NOT IN (SELECT id FROM workouts)')
+    op.drop_index('ix_exercises_workout_id', table_name='exercises')
+    op.create_foreign_key(
+        'exercises_workout_id_fkey', 'exercises', 'workouts', ['workout_id'], ['id'], ondelete='CASCADE'
+    )
@@ -0,0 +1,37 @@
+"""Shared rate limit buckets
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Unlogged: bucket state is disposable and written on every API request
+    op.create_table(
+        'rate_limit_buckets',
+        sa.Column('key', sa.String(200), nullable=False),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('allowed', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('key'),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index('ix_rate_limit_buckets_updated_at', 'rate_limit_buckets', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rate_limit_buckets_updated_at', table_name='rate_limit_buckets')
+    op.drop_table('rate_limit_buckets')
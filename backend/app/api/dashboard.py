@@ -0,0 +1,71 @@
+import asyncio
+from datetime import date
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import APIRouter
+
+from app.core.coalesce import coalesced
+from app.core.database import async_session_maker, engine
+from app.core.deps import CurrentUser, DbSession
+from app.schemas.dashboard import DashboardResponse
+from app.services.summaries import (
+    daily_nutrition_summary,
+    shopping_list_summary,
+    user_goals,
+    weekly_workout_summary,
+)
+
+router = APIRouter()
+
+
+def fan_out_limit() -> int:
+    """
+    Extra connections all dashboard requests may hold at once.
+    
+    Half the pool's steady size, so concurrent home screens can't take
+    every connection from the other endpoints (pools without a size, like
+    SQLite's, get two).
+    """
+    size = getattr(engine.pool, "size", None)
+    return max(1, size() // 2) if size else 2
+
+
+fan_out = asyncio.Semaphore(fan_out_limit())
+
+
+async def in_own_session(aggregate: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Run a read-only aggregate on a session (and pooled connection) of its own."""
+    async with fan_out, async_session_maker() as session:
+        return await aggregate(session, *args)
+
+
+@router.get("", response_model=DashboardResponse)
+@coalesced(DashboardResponse)
+async def get_dashboard(
+    user: CurrentUser,
+    db: DbSession,
+    summary_date: Optional[date] = None,
+):
+    """
+    Get the home screen data in one call.
+    
+    The user is authenticated once; the aggregates then run concurrently,
+    the first on the request's session and the rest on their own pooled
+    connections (at most ``fan_out_limit()`` across requests).
+    ``summary_date`` is the client's local today.
+    """
+    summary_date = summary_date or date.today()
+    nutrition, workouts, shopping = await asyncio.gather(
+        daily_nutrition_summary(db, user, summary_date),
+        in_own_session(weekly_workout_summary, user.id, summary_date),
+        in_own_session(shopping_list_summary, user.id),
+    )
+    
+    return DashboardResponse(
+        date=summary_date,
+        goals=user_goals(user),
+        nutrition=nutrition,
+        water_glasses=nutrition.water_glasses,
+        weekly_workouts=workouts,
+        shopping=shopping,
+    )
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.deps import DbSession, resolve_user
+from app.core.events import broker, format_sse
+
+router = APIRouter()
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    db: DbSession,
+    init_data: Optional[str] = Query(default=None),
+    x_telegram_init_data: Annotated[Optional[str], Header()] = None,
+):
+    """
+    Stream the user's change events as Server-Sent Events.
+    
+    Browsers' EventSource cannot set headers, so init data may also be
+    passed as the ``init_data`` query parameter.
+    """
+    user = await resolve_user(db, x_telegram_init_data or init_data)
+    user_id = user.id
+    
+    # Release the pooled connection, the stream can stay open for hours
+    await db.commit()
+    
+    queue = broker.subscribe(user_id)
+    
+    async def event_stream():
+        try:
+            yield "retry: 3000\n: connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.events_heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    # Comment lines keep proxies from closing idle streams
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event)
+        finally:
+            broker.unsubscribe(user_id, queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
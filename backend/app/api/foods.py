@@ -0,0 +1,43 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import select
+
+from app.core.deps import CurrentUser, DbSession
+from app.models.food import Food
+from app.schemas.food import FoodResponse, FoodSearchResult
+from app.services.foods import search_foods
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=List[FoodSearchResult])
+async def search_food_catalog(
+    user: CurrentUser,
+    db: DbSession,
+    # pg_trgm can't use its index for patterns under three characters
+    q: str = Query(min_length=3, max_length=100),
+    limit: int = Query(default=20, le=50),
+):
+    """Search the food catalog by name, best matches first."""
+    matches = await search_foods(db, q, limit)
+    return [
+        FoodSearchResult(**FoodResponse.model_validate(food).model_dump(), score=round(score, 3))
+        for food, score in matches
+    ]
+
+
+@router.get("/{food_id}", response_model=FoodResponse)
+async def get_food(
+    user: CurrentUser,
+    db: DbSession,
+    food_id: int,
+):
+    """Get a specific catalog food."""
+    result = await db.execute(select(Food).where(Food.id == food_id))
+    food = result.scalar_one_or_none()
+    
+    if not food:
+        raise HTTPException(status_code=404, detail="Food not found")
+    
+    return food
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, UploadFile, status
+
+from app.core.deps import CurrentUser, DbSession
+from app.core.events import publish_event
+from app.schemas.importer import ImportFormat, ImportKind, ImportReport
+from app.services.importer import detect_format, import_records, read_records
+
+router = APIRouter()
+
+
+@router.post("/{kind}", response_model=ImportReport, status_code=status.HTTP_201_CREATED)
+async def import_history(
+    user: CurrentUser,
+    db: DbSession,
+    kind: ImportKind,
+    file: UploadFile,
+    format: Optional[ImportFormat] = None,
+):
+    """Import meal or workout history from a CSV, JSON or JSON Lines file."""
+    import_format = format or detect_format(file.filename)
+    if not import_format:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported file format, expected .csv, .json or .jsonl",
+        )
+    
+    try:
+        report = await import_records(db, user.id, kind, read_records(file.file, import_format))
+    except ValueError as exc:
+        # Raised for file-level problems such as bad encoding or a non-array JSON document
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    
+    await publish_event(user.id, "import.completed", kind=kind, imported_rows=report.imported_rows)
+    
+    return report
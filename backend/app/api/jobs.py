@@ -0,0 +1,47 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import select
+
+from app.core.deps import CurrentUser, DbSession
+from app.models.job import Job
+from app.schemas.job import JobResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    user: CurrentUser,
+    db: DbSession,
+    limit: int = Query(default=20, le=100),
+):
+    """List the user's most recent background jobs."""
+    result = await db.execute(
+        select(Job)
+        .where(Job.user_id == user.id)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    user: CurrentUser,
+    db: DbSession,
+    job_id: int,
+):
+    """Get the status of a background job."""
+    result = await db.execute(
+        select(Job).where(Job.id == job_id, Job.user_id == user.id)
+    )
+    job = result.scalar_one_or_none()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    
+    return job
@@ -1,19 +1,29 @@
-from datetime import date
+from datetime import date, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select, func
+from sqlalchemy import select
 
+from app.core.coalesce import coalesced
 from app.core.deps import CurrentUser, DbSession
-from app.models.nutrition import Meal, WaterLog
+from app.core.events import publish_event
+from app.models.nutrition import Meal, MealType, WaterLog
 from app.schemas.nutrition import (
     MealCreate,
     MealUpdate,
     MealResponse,
+    MealRepeat,
+    MealSuggestionResponse,
     WaterLogCreate,
     WaterLogResponse,
     DailyNutritionSummary,
+    NutritionTrends,
 )
+from app.services.archive import list_with_archive
+from app.services.bulk import insert_meals
+from app.services.meal_suggestions import record_meals, top_suggestions
+from app.services.rollups import apply_rollup_deltas, meal_delta, water_delta
+from app.services.summaries import daily_nutrition_summary, water_glasses
 
 router = APIRouter()
 
@@ -24,23 +34,27 @@ async def list_meals(
     user: CurrentUser,
     db: DbSession,
     meal_date: Optional[date] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
     limit: int = Query(default=50, le=100),
     offset: int = 0,
 ):
-    """List user's meals with optional date filtering."""
+    """List user's meals with optional date filtering, including archived history."""
+    if meal_date:
+        start_date = end_date = meal_date
+    
     query = (
         select(Meal)
         .where(Meal.user_id == user.id)
         .order_by(Meal.meal_date.desc(), Meal.created_at.desc())
-        .limit(limit)
-        .offset(offset)
     )
     
-    if meal_date:
-        query = query.where(Meal.meal_date == meal_date)
+    if start_date:
+        query = query.where(Meal.meal_date >= start_date)
+    if end_date:
+        query = query.where(Meal.meal_date <= end_date)
     
-    result = await db.execute(query)
-    return result.scalars().all()
+    return await list_with_archive(db, "meals", user.id, query, start_date, end_date, limit, offset)
 
 
 @router.post("/meals", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
@@ -64,9 +78,90 @@ async def create_meal(
         meal_date=meal_data.meal_date,
     )
     db.add(meal)
+    await record_meals(db, user.id, [meal_data])
+    await apply_rollup_deltas(db, user, [meal_delta(meal)])
     await db.commit()
     await db.refresh(meal)
     
+    await publish_event(user.id, "meal.created", id=meal.id, meal_date=meal.meal_date)
+    
+    return meal
+
+
+@router.post("/meals/bulk", response_model=List[MealResponse], status_code=status.HTTP_201_CREATED)
+async def create_meals_bulk(
+    user: CurrentUser,
+    db: DbSession,
+    meals_data: List[MealCreate],
+):
+    """Log multiple meals at once."""
+    meal_ids = await insert_meals(db, user.id, meals_data)
+    await record_meals(db, user.id, meals_data)
+    await apply_rollup_deltas(db, user, [meal_delta(meal_data) for meal_data in meals_data])
+    await db.commit()
+    
+    await publish_event(user.id, "meal.created", ids=meal_ids)
+    
+    result = await db.execute(select(Meal).where(Meal.id.in_(meal_ids)))
+    meals_by_id = {meal.id: meal for meal in result.scalars()}
+    
+    return [meals_by_id[meal_id] for meal_id in meal_ids]
+
+
+@router.get("/meals/suggestions", response_model=List[MealSuggestionResponse])
+async def suggest_meals(
+    user: CurrentUser,
+    db: DbSession,
+    meal_type: MealType,
+    hour: Optional[float] = Query(default=None, ge=0, lt=24, description="UTC hour of day, defaults to now"),
+    limit: int = Query(default=10, ge=1, le=50),
+):
+    """Suggest recent and frequent meals of a type for the time of day."""
+    ranked = await top_suggestions(db, user.id, meal_type, hour=hour, limit=limit)
+    
+    return [
+        MealSuggestionResponse.model_validate(suggestion).model_copy(update={"score": round(score, 4)})
+        for suggestion, score in ranked
+    ]
+
+
+@router.post("/meals/{meal_id}/repeat", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
+async def repeat_meal(
+    user: CurrentUser,
+    db: DbSession,
+    meal_id: int,
+    repeat: Optional[MealRepeat] = None,
+):
+    """Log a copy of an earlier meal, today by default."""
+    result = await db.execute(
+        select(Meal).where(Meal.id == meal_id, Meal.user_id == user.id)
+    )
+    original = result.scalar_one_or_none()
+    
+    if not original:
+        raise HTTPException(status_code=404, detail="Meal not found")
+    
+    meal = Meal(
+        user_id=user.id,
+        name=original.name,
+        meal_type=original.meal_type,
+        calories=original.calories,
+        protein=original.protein,
+        carbs=original.carbs,
+        fat=original.fat,
+        fiber=original.fiber,
+        serving_size=original.serving_size,
+        notes=original.notes,
+        meal_date=(repeat and repeat.meal_date) or date.today(),
+    )
+    db.add(meal)
+    await record_meals(db, user.id, [meal])
+    await apply_rollup_deltas(db, user, [meal_delta(meal)])
+    await db.commit()
+    await db.refresh(meal)
+    
+    await publish_event(user.id, "meal.created", id=meal.id, meal_date=meal.meal_date)
+    
     return meal
 
 
@@ -104,13 +199,17 @@ async def update_meal(
     if not meal:
         raise HTTPException(status_code=404, detail="Meal not found")
     
+    previous = meal_delta(meal, sign=-1)
     update_data = meal_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(meal, field, value)
     
+    await apply_rollup_deltas(db, user, [previous, meal_delta(meal)])
     await db.commit()
     await db.refresh(meal)
     
+    await publish_event(user.id, "meal.updated", id=meal.id, meal_date=meal.meal_date)
+    
     return meal
 
 
@@ -130,7 +229,10 @@ async def delete_meal(
         raise HTTPException(status_code=404, detail="Meal not found")
     
     await db.delete(meal)
+    await apply_rollup_deltas(db, user, [meal_delta(meal, sign=-1)])
     await db.commit()
+    
+    await publish_event(user.id, "meal.deleted", id=meal_id, meal_date=meal.meal_date)
 
 
 # Water endpoints
@@ -139,19 +241,25 @@ async def list_water_logs(
     user: CurrentUser,
     db: DbSession,
     log_date: Optional[date] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
 ):
-    """List water logs."""
+    """List water logs, including archived history."""
+    if log_date:
+        start_date = end_date = log_date
+    
     query = (
         select(WaterLog)
         .where(WaterLog.user_id == user.id)
         .order_by(WaterLog.log_date.desc(), WaterLog.created_at.desc())
     )
     
-    if log_date:
-        query = query.where(WaterLog.log_date == log_date)
+    if start_date:
+        query = query.where(WaterLog.log_date >= start_date)
+    if end_date:
+        query = query.where(WaterLog.log_date <= end_date)
     
-    result = await db.execute(query)
-    return result.scalars().all()
+    return await list_with_archive(db, "water_logs", user.id, query, start_date, end_date)
 
 
 @router.post("/water", response_model=WaterLogResponse, status_code=status.HTTP_201_CREATED)
@@ -167,76 +275,60 @@ async def log_water(
         log_date=water_data.log_date,
     )
     db.add(water_log)
+    await apply_rollup_deltas(db, user, [water_delta(water_log.log_date, water_log.glasses)])
     await db.commit()
     await db.refresh(water_log)
     
+    await publish_event(
+        user.id, "water.logged", glasses=water_log.glasses, log_date=water_log.log_date
+    )
+    
     return water_log
 
 
 @router.get("/water/today", response_model=int)
+@coalesced(int)
 async def get_today_water(
     user: CurrentUser,
     db: DbSession,
 ):
     """Get total water intake for today."""
-    result = await db.execute(
-        select(func.coalesce(func.sum(WaterLog.glasses), 0))
-        .where(WaterLog.user_id == user.id, WaterLog.log_date == date.today())
-    )
-    return result.scalar()
+    return await water_glasses(db, user.id, date.today())
 
 
 # Daily summary
 @router.get("/summary/{summary_date}", response_model=DailyNutritionSummary)
+@coalesced(DailyNutritionSummary)
 async def get_daily_summary(
     user: CurrentUser,
     db: DbSession,
     summary_date: date,
 ):
     """Get nutrition summary for a specific date."""
-    # Get meals for the day
-    result = await db.execute(
-        select(Meal).where(Meal.user_id == user.id, Meal.meal_date == summary_date)
-    )
-    meals = result.scalars().all()
-    
-    # Calculate totals
-    total_calories = sum(m.calories or 0 for m in meals)
-    total_protein = sum(m.protein or 0 for m in meals)
-    total_carbs = sum(m.carbs or 0 for m in meals)
-    total_fat = sum(m.fat or 0 for m in meals)
-    total_fiber = sum(m.fiber or 0 for m in meals)
-    
-    # Get water intake
-    water_result = await db.execute(
-        select(func.coalesce(func.sum(WaterLog.glasses), 0))
-        .where(WaterLog.user_id == user.id, WaterLog.log_date == summary_date)
-    )
-    water_glasses = water_result.scalar()
-    
-    # Calculate progress percentages
-    def calc_progress(current: float, goal: float) -> float:
-        if goal <= 0:
-            return 0
-        return min(round((current / goal) * 100, 1), 100)
-    
-    return DailyNutritionSummary(
-        date=summary_date,
-        total_calories=total_calories,
-        total_protein=total_protein,
-        total_carbs=total_carbs,
-        total_fat=total_fat,
-        total_fiber=total_fiber,
-        water_glasses=water_glasses,
-        meals_count=len(meals),
-        calorie_goal=user.daily_calorie_goal,
-        protein_goal=user.daily_protein_goal,
-        carbs_goal=user.daily_carbs_goal,
-        fat_goal=user.daily_fat_goal,
-        water_goal=user.daily_water_goal,
-        calorie_progress=calc_progress(total_calories, user.daily_calorie_goal),
-        protein_progress=calc_progress(total_protein, user.daily_protein_goal),
-        carbs_progress=calc_progress(total_carbs, user.daily_carbs_goal),
-        fat_progress=calc_progress(total_fat, user.daily_fat_goal),
-        water_progress=calc_progress(water_glasses, user.daily_water_goal),
-    )
+    return await daily_nutrition_summary(db, user, summary_date)
+
+
+# Longest range served in one call
+MAX_TREND_DAYS = 5 * 366
+
+
+@router.get("/trends", response_model=NutritionTrends)
+async def get_nutrition_trends(
+    user: CurrentUser,
+    db: DbSession,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Get rolling averages, goal deltas and weekday patterns for calories and macros."""
+    # NumPy is imported on the first trends request rather than at startup
+    from app.services.trends import nutrition_trends
+    
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=89)
+    
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+    if (end_date - start_date).days >= MAX_TREND_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_TREND_DAYS} days")
+    
+    return await nutrition_trends(db, user, start_date, end_date)
@@ -0,0 +1,37 @@
+from typing import List
+
+from fastapi import APIRouter, status
+
+from app.core.deps import CurrentUser, DbSession
+from app.schemas.job import JobResponse
+from app.schemas.progress import StreakResponse
+from app.services.jobs import enqueue_progress_rebuild
+from app.services.streaks import get_streaks
+
+router = APIRouter()
+
+
+@router.get("/streaks", response_model=List[StreakResponse])
+async def list_streaks(
+    user: CurrentUser,
+    db: DbSession,
+):
+    """Get current and longest streaks and recent adherence per goal."""
+    streaks = await get_streaks(db, user)
+    
+    # Streak rows are created on first view
+    await db.commit()
+    
+    return streaks
+
+
+@router.post("/rebuild", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_progress(
+    user: CurrentUser,
+    db: DbSession,
+):
+    """Recompute rollups and streaks from history in the background."""
+    job = await enqueue_progress_rebuild(db, user.id)
+    await db.commit()
+    
+    return job
@@ -0,0 +1,224 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.deps import CurrentUser, DbSession
+from app.core.events import publish_event
+from app.models.nutrition import Meal
+from app.models.recipe import Recipe, RecipeIngredient
+from app.models.shopping import ShoppingCategory
+from app.schemas.nutrition import MealResponse
+from app.schemas.recipe import (
+    RecipeCreate,
+    RecipeUpdate,
+    RecipeResponse,
+    RecipeIngredientCreate,
+    RecipeLog,
+    RecipeShop,
+)
+from app.schemas.shopping import ShoppingItemResponse
+from app.services.meal_suggestions import record_meals
+from app.services.rollups import apply_rollup_deltas, meal_delta
+from app.services.shopping import add_shopping_items, publish_shopping_merge
+
+router = APIRouter()
+
+
+def build_ingredients(ingredients_data: List[RecipeIngredientCreate]) -> List[RecipeIngredient]:
+    return [
+        RecipeIngredient(**{**ingredient_data.model_dump(), "order": ingredient_data.order or i})
+        for i, ingredient_data in enumerate(ingredients_data)
+    ]
+
+
+async def get_user_recipe(db: DbSession, user_id: int, recipe_id: int) -> Recipe:
+    result = await db.execute(
+        select(Recipe)
+        .where(Recipe.id == recipe_id, Recipe.user_id == user_id)
+        .options(selectinload(Recipe.ingredients))
+    )
+    recipe = result.scalar_one_or_none()
+    
+    if not recipe:
+        raise HTTPException(status_code=404, detail="Recipe not found")
+    
+    return recipe
+
+
+@router.get("", response_model=List[RecipeResponse])
+async def list_recipes(
+    user: CurrentUser,
+    db: DbSession,
+):
+    """List user's recipes."""
+    result = await db.execute(
+        select(Recipe)
+        .where(Recipe.user_id == user.id)
+        .options(selectinload(Recipe.ingredients))
+        .order_by(Recipe.name)
+    )
+    return result.scalars().all()
+
+
+@router.post("", response_model=RecipeResponse, status_code=status.HTTP_201_CREATED)
+async def create_recipe(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_data: RecipeCreate,
+):
+    """Create a recipe with its ingredients."""
+    recipe = Recipe(
+        user_id=user.id,
+        name=recipe_data.name,
+        meal_type=recipe_data.meal_type,
+        servings=recipe_data.servings,
+        notes=recipe_data.notes,
+        ingredients=build_ingredients(recipe_data.ingredients),
+    )
+    recipe.recompute_totals()
+    db.add(recipe)
+    await db.commit()
+    
+    await publish_event(user.id, "recipe.created", id=recipe.id)
+    
+    return await get_user_recipe(db, user.id, recipe.id)
+
+
+@router.get("/{recipe_id}", response_model=RecipeResponse)
+async def get_recipe(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_id: int,
+):
+    """Get a specific recipe."""
+    return await get_user_recipe(db, user.id, recipe_id)
+
+
+@router.patch("/{recipe_id}", response_model=RecipeResponse)
+async def update_recipe(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_id: int,
+    recipe_update: RecipeUpdate,
+):
+    """Update a recipe; a given ingredient list replaces the current one."""
+    recipe = await get_user_recipe(db, user.id, recipe_id)
+    
+    update_data = recipe_update.model_dump(exclude_unset=True, exclude={"ingredients"})
+    for field, value in update_data.items():
+        setattr(recipe, field, value)
+    
+    if recipe_update.ingredients is not None:
+        recipe.ingredients = build_ingredients(recipe_update.ingredients)
+        recipe.recompute_totals()
+    
+    await db.commit()
+    
+    await publish_event(user.id, "recipe.updated", id=recipe.id)
+    
+    # Expire so the reload picks up the new ingredient ids and timestamps
+    db.expire(recipe)
+    return await get_user_recipe(db, user.id, recipe_id)
+
+
+@router.delete("/{recipe_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recipe(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_id: int,
+):
+    """Delete a recipe."""
+    recipe = await get_user_recipe(db, user.id, recipe_id)
+    
+    await db.delete(recipe)
+    await db.commit()
+    
+    await publish_event(user.id, "recipe.deleted", id=recipe_id)
+
+
+@router.post("/{recipe_id}/log", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
+async def log_recipe(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_id: int,
+    log_data: Optional[RecipeLog] = None,
+):
+    """Log servings of a recipe as a meal with scaled macros."""
+    log_data = log_data or RecipeLog()
+    result = await db.execute(
+        select(Recipe).where(Recipe.id == recipe_id, Recipe.user_id == user.id)
+    )
+    recipe = result.scalar_one_or_none()
+    
+    if not recipe:
+        raise HTTPException(status_code=404, detail="Recipe not found")
+    
+    meal_type = log_data.meal_type or recipe.meal_type
+    if meal_type is None:
+        raise HTTPException(status_code=400, detail="meal_type is required for this recipe")
+    
+    scale = log_data.servings / recipe.servings
+    meal = Meal(
+        user_id=user.id,
+        name=recipe.name,
+        meal_type=meal_type,
+        calories=round(recipe.calories * scale),
+        protein=round(recipe.protein * scale, 1),
+        carbs=round(recipe.carbs * scale, 1),
+        fat=round(recipe.fat * scale, 1),
+        fiber=round(recipe.fiber * scale, 1),
+        serving_size=f"{log_data.servings:g} serving{'' if log_data.servings == 1 else 's'}",
+        meal_date=log_data.meal_date,
+    )
+    db.add(meal)
+    await record_meals(db, user.id, [meal])
+    await apply_rollup_deltas(db, user, [meal_delta(meal)])
+    await db.commit()
+    await db.refresh(meal)
+    
+    await publish_event(user.id, "meal.created", id=meal.id, meal_date=meal.meal_date)
+    
+    return meal
+
+
+@router.post("/{recipe_id}/shopping", response_model=List[ShoppingItemResponse], status_code=status.HTTP_201_CREATED)
+async def add_recipe_to_shopping(
+    user: CurrentUser,
+    db: DbSession,
+    recipe_id: int,
+    shop_data: Optional[RecipeShop] = None,
+):
+    """
+    Add a recipe's ingredients to the shopping list.
+    
+    Ingredients already pending on the list are merged into those items
+    instead of being added twice.
+    """
+    recipe = await get_user_recipe(db, user.id, recipe_id)
+    
+    ingredients = recipe.ingredients
+    if shop_data and shop_data.ingredient_ids is not None:
+        wanted = set(shop_data.ingredient_ids)
+        ingredients = [i for i in ingredients if i.id in wanted]
+    
+    merge = await add_shopping_items(
+        db,
+        user.id,
+        [
+            {
+                "name": ingredient.name,
+                "quantity": ingredient.quantity,
+                # Let the classifier pick a category for uncategorized ingredients
+                "category": None if ingredient.category == ShoppingCategory.OTHER else ingredient.category,
+                "notes": recipe.name,
+            }
+            for ingredient in ingredients
+        ],
+    )
+    await db.commit()
+    
+    await publish_shopping_merge(user.id, merge)
+    
+    return merge.items
@@ -1,9 +1,11 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import select, delete
 
+from app.core.coalesce import coalesced
 from app.core.deps import CurrentUser, DbSession
+from app.core.events import publish_event
 from app.models.shopping import ShoppingItem, ShoppingCategory
 from app.schemas.shopping import (
     ShoppingItemCreate,
@@ -11,11 +13,15 @@ from app.schemas.shopping import (
     ShoppingItemResponse,
     ShoppingListSummary,
 )
+from app.services.categorizer import remember_category
+from app.services.shopping import add_shopping_items, normalize_item_name, publish_shopping_merge
+from app.services.summaries import shopping_list_summary
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[ShoppingItemResponse])
+@coalesced(List[ShoppingItemResponse])
 async def list_shopping_items(
     user: CurrentUser,
     db: DbSession,
@@ -44,19 +50,16 @@ async def create_shopping_item(
     db: DbSession,
     item_data: ShoppingItemCreate,
 ):
-    """Add a new shopping item."""
-    item = ShoppingItem(
-        user_id=user.id,
-        name=item_data.name,
-        quantity=item_data.quantity,
-        category=item_data.category,
-        notes=item_data.notes,
-    )
-    db.add(item)
+    """Add a shopping item, merging it into a matching pending item."""
+    merge = await add_shopping_items(db, user.id, [item_data.model_dump()])
+    if not merge.items:
+        raise HTTPException(status_code=400, detail="Item name is required")
+    
     await db.commit()
-    await db.refresh(item)
     
-    return item
+    await publish_shopping_merge(user.id, merge)
+    
+    return merge.items[0]
 
 
 @router.post("/bulk", response_model=List[ShoppingItemResponse], status_code=status.HTTP_201_CREATED)
@@ -65,53 +68,23 @@ async def create_shopping_items_bulk(
     db: DbSession,
     items_data: List[ShoppingItemCreate],
 ):
-    """Add multiple shopping items at once."""
-    items = []
-    for item_data in items_data:
-        item = ShoppingItem(
-            user_id=user.id,
-            name=item_data.name,
-            quantity=item_data.quantity,
-            category=item_data.category,
-            notes=item_data.notes,
-        )
-        db.add(item)
-        items.append(item)
-    
+    """Add multiple shopping items at once, merging duplicates."""
+    merge = await add_shopping_items(db, user.id, [item_data.model_dump() for item_data in items_data])
     await db.commit()
     
-    for item in items:
-        await db.refresh(item)
+    await publish_shopping_merge(user.id, merge)
     
-    return items
+    return merge.items
 
 
 @router.get("/summary", response_model=ShoppingListSummary)
+@coalesced(ShoppingListSummary)
 async def get_shopping_summary(
     user: CurrentUser,
     db: DbSession,
 ):
     """Get shopping list summary."""
-    result = await db.execute(
-        select(ShoppingItem).where(ShoppingItem.user_id == user.id)
-    )
-    items = result.scalars().all()
-    
-    purchased = sum(1 for item in items if item.is_purchased)
-    pending = len(items) - purchased
-    
-    items_by_category = {}
-    for item in items:
-        if not item.is_purchased:
-            cat = item.category.value
-            items_by_category[cat] = items_by_category.get(cat, 0) + 1
-    
-    return ShoppingListSummary(
-        total_items=len(items),
-        purchased_items=purchased,
-        pending_items=pending,
-        items_by_category=items_by_category,
-    )
+    return await shopping_list_summary(db, user.id)
 
 
 @router.get("/{item_id}", response_model=ShoppingItemResponse)
@@ -155,12 +128,19 @@ async def update_shopping_item(
         raise HTTPException(status_code=404, detail="Item not found")
     
     update_data = item_update.model_dump(exclude_unset=True)
+    recategorized = update_data.get("category") not in (None, item.category)
     for field, value in update_data.items():
         setattr(item, field, value)
     
+    # Learn manual recategorizations for future items with this name
+    if recategorized:
+        await remember_category(db, user.id, normalize_item_name(item.name), item.category)
+    
     await db.commit()
     await db.refresh(item)
     
+    await publish_event(user.id, "shopping.updated", id=item.id)
+    
     return item
 
 
@@ -186,6 +166,8 @@ async def toggle_shopping_item(
     await db.commit()
     await db.refresh(item)
     
+    await publish_event(user.id, "shopping.updated", id=item.id, is_purchased=item.is_purchased)
+    
     return item
 
 
@@ -209,6 +191,8 @@ async def delete_shopping_item(
     
     await db.delete(item)
     await db.commit()
+    
+    await publish_event(user.id, "shopping.deleted", id=item_id)
 
 
 @router.delete("/clear/purchased", status_code=status.HTTP_204_NO_CONTENT)
@@ -217,15 +201,12 @@ async def clear_purchased_items(
     db: DbSession,
 ):
     """Clear all purchased items from the list."""
-    result = await db.execute(
-        select(ShoppingItem).where(
+    await db.execute(
+        delete(ShoppingItem).where(
             ShoppingItem.user_id == user.id,
             ShoppingItem.is_purchased == True,
         )
     )
-    items = result.scalars().all()
-    
-    for item in items:
-        await db.delete(item)
-    
     await db.commit()
+    
+    await publish_event(user.id, "shopping.cleared")
@@ -1,7 +1,10 @@
 from fastapi import APIRouter
 
 from app.core.deps import CurrentUser, DbSession
+from app.core.events import publish_event
 from app.schemas.user import UserResponse, UserUpdate, UserGoals
+from app.services.streaks import rebuild_streaks
+from app.services.summaries import user_goals
 
 router = APIRouter()
 
@@ -27,19 +30,15 @@ async def update_current_user(
     await db.commit()
     await db.refresh(user)
     
+    await publish_event(user.id, "user.updated")
+    
     return user
 
 
 @router.get("/me/goals", response_model=UserGoals)
 async def get_user_goals(user: CurrentUser):
     """Get user's daily goals."""
-    return UserGoals(
-        daily_calorie_goal=user.daily_calorie_goal,
-        daily_protein_goal=user.daily_protein_goal,
-        daily_carbs_goal=user.daily_carbs_goal,
-        daily_fat_goal=user.daily_fat_goal,
-        daily_water_goal=user.daily_water_goal,
-    )
+    return user_goals(user)
 
 
 @router.put("/me/goals", response_model=UserGoals)
@@ -55,7 +54,11 @@ async def update_user_goals(
     user.daily_fat_goal = goals.daily_fat_goal
     user.daily_water_goal = goals.daily_water_goal
     
+    # Past days are judged against the new goals
+    await rebuild_streaks(db, user)
     await db.commit()
     await db.refresh(user)
     
+    await publish_event(user.id, "user.updated")
+    
     return goals
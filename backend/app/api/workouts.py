@@ -1,26 +1,50 @@
-from datetime import date, timedelta
+from datetime import date
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 
+from app.core.coalesce import coalesced
 from app.core.deps import CurrentUser, DbSession
+from app.core.events import publish_event
 from app.models.workout import Workout, Exercise
 from app.schemas.workout import (
     WorkoutCreate,
     WorkoutUpdate,
     WorkoutResponse,
+    WorkoutListItem,
     WorkoutSummary,
+    WORKOUT_LIST_FIELDS,
+    WORKOUT_LIST_INCLUDES,
     ExerciseCreate,
     ExerciseUpdate,
     ExerciseResponse,
+    ExerciseAnalytics,
 )
+from app.services.bulk import insert_workouts
+from app.services.exercise_cache import invalidate_exercise_analytics, record_exercise_set
+from app.services.rollups import apply_rollup_deltas, workout_delta
+from app.services.summaries import weekly_workout_summary
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[WorkoutResponse])
+def parse_list_param(value: Optional[str], allowed: tuple, name: str) -> Optional[List[str]]:
+    """Split a comma-separated query parameter, rejecting unknown names."""
+    if value is None:
+        return None
+    names = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = [part for part in names if part not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown {name}: {', '.join(unknown)}; expected any of {', '.join(allowed)}",
+        )
+    return names
+
+
+@router.get("", response_model=List[WorkoutListItem], response_model_exclude_unset=True)
 async def list_workouts(
     user: CurrentUser,
     db: DbSession,
@@ -28,12 +52,37 @@ async def list_workouts(
     end_date: Optional[date] = None,
     limit: int = Query(default=50, le=100),
     offset: int = 0,
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated workout fields to return (id is always included); all by default",
+    ),
+    include: Optional[str] = Query(
+        default=None, description="Comma-separated: exercises, exercise_count; exercises unless fields is given",
+    ),
 ):
-    """List user's workouts with optional date filtering."""
+    """
+    List user's workouts with optional date filtering.
+    
+    Only the requested columns are selected, and ``exercise_count`` is a
+    COUNT subquery, so narrow listings don't load exercises at all.
+    """
+    selected = parse_list_param(fields, ("id",) + WORKOUT_LIST_FIELDS, "fields") or list(WORKOUT_LIST_FIELDS)
+    includes = parse_list_param(include, WORKOUT_LIST_INCLUDES, "include")
+    if includes is None:
+        includes = [] if fields else ["exercises"]
+    
+    columns = [Workout.id] + [getattr(Workout, name) for name in selected if name != "id"]
+    if "exercise_count" in includes:
+        columns.append(
+            select(func.count(Exercise.id))
+            .where(Exercise.workout_id == Workout.id)
+            .correlate(Workout)
+            .scalar_subquery()
+            .label("exercise_count")
+        )
+    
     query = (
-        select(Workout)
+        select(*columns)
         .where(Workout.user_id == user.id)
-        .options(selectinload(Workout.exercises))
         .order_by(Workout.workout_date.desc(), Workout.created_at.desc())
         .limit(limit)
         .offset(offset)
@@ -45,7 +94,21 @@ async def list_workouts(
         query = query.where(Workout.workout_date <= end_date)
     
     result = await db.execute(query)
-    return result.scalars().all()
+    workouts = [dict(row) for row in result.mappings()]
+    
+    if "exercises" in includes and workouts:
+        result = await db.execute(
+            select(Exercise)
+            .where(Exercise.workout_id.in_([workout["id"] for workout in workouts]))
+            .order_by(Exercise.id)
+        )
+        exercises = {}
+        for exercise in result.scalars():
+            exercises.setdefault(exercise.workout_id, []).append(exercise)
+        for workout in workouts:
+            workout["exercises"] = exercises.get(workout["id"], [])
+    
+    return workouts
 
 
 @router.post("", response_model=WorkoutResponse, status_code=status.HTTP_201_CREATED)
@@ -68,6 +131,7 @@ async def create_workout(
     await db.flush()
     
     # Add exercises
+    exercises = []
     for i, exercise_data in enumerate(workout_data.exercises):
         exercise = Exercise(
             workout_id=workout.id,
@@ -81,9 +145,16 @@ async def create_workout(
             order=exercise_data.order or i,
         )
         db.add(exercise)
+        exercises.append(exercise)
     
+    await apply_rollup_deltas(db, user, [workout_delta(workout)])
     await db.commit()
     
+    for exercise in exercises:
+        record_exercise_set(user.id, workout.workout_date, exercise)
+    
+    await publish_event(user.id, "workout.created", id=workout.id, workout_date=workout.workout_date)
+    
     # Reload with exercises
     result = await db.execute(
         select(Workout)
@@ -93,6 +164,61 @@ async def create_workout(
     return result.scalar_one()
 
 
+@router.post("/bulk", response_model=List[WorkoutResponse], status_code=status.HTTP_201_CREATED)
+async def create_workouts_bulk(
+    user: CurrentUser,
+    db: DbSession,
+    workouts_data: List[WorkoutCreate],
+):
+    """Create multiple workouts with their exercises at once."""
+    workout_ids = await insert_workouts(db, user.id, workouts_data)
+    await apply_rollup_deltas(db, user, [workout_delta(workout_data) for workout_data in workouts_data])
+    await db.commit()
+    
+    invalidate_exercise_analytics(user.id)
+    
+    await publish_event(user.id, "workout.created", ids=workout_ids)
+    
+    result = await db.execute(
+        select(Workout)
+        .where(Workout.id.in_(workout_ids))
+        .options(selectinload(Workout.exercises))
+    )
+    workouts_by_id = {workout.id: workout for workout in result.scalars()}
+    
+    return [workouts_by_id[workout_id] for workout_id in workout_ids]
+
+
+@router.get("/analytics/exercises/{name}", response_model=ExerciseAnalytics)
+async def get_exercise_analytics(
+    user: CurrentUser,
+    db: DbSession,
+    name: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """Get per-session volume, top set, estimated 1RM and records for an exercise."""
+    # NumPy is imported on the first analytics request rather than at startup
+    from app.services.exercise_analytics import get_exercise_series, personal_records, series_points
+    
+    series = await get_exercise_series(db, user.id, name)
+    
+    if not len(series.days):
+        raise HTTPException(status_code=404, detail="No weighted sets logged for this exercise")
+    
+    # Records span the whole history; the date range only trims the sessions
+    sessions = [
+        point for point in series_points(series)
+        if (not start_date or point["date"] >= start_date) and (not end_date or point["date"] <= end_date)
+    ]
+    
+    return ExerciseAnalytics(
+        name=name,
+        sessions=sessions,
+        personal_records=personal_records(series),
+    )
+
+
 @router.get("/{workout_id}", response_model=WorkoutResponse)
 async def get_workout(
     user: CurrentUser,
@@ -131,13 +257,20 @@ async def update_workout(
     if not workout:
         raise HTTPException(status_code=404, detail="Workout not found")
     
+    previous = workout_delta(workout, sign=-1)
     update_data = workout_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(workout, field, value)
     
+    await apply_rollup_deltas(db, user, [previous, workout_delta(workout)])
     await db.commit()
     await db.refresh(workout)
     
+    if "workout_date" in update_data:
+        invalidate_exercise_analytics(user.id)
+    
+    await publish_event(user.id, "workout.updated", id=workout.id, workout_date=workout.workout_date)
+    
     return workout
 
 
@@ -157,7 +290,12 @@ async def delete_workout(
         raise HTTPException(status_code=404, detail="Workout not found")
     
     await db.delete(workout)
+    await apply_rollup_deltas(db, user, [workout_delta(workout, sign=-1)])
     await db.commit()
+    
+    invalidate_exercise_analytics(user.id)
+    
+    await publish_event(user.id, "workout.deleted", id=workout_id, workout_date=workout.workout_date)
 
 
 @router.post("/{workout_id}/exercises", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
@@ -191,6 +329,10 @@ async def add_exercise(
     await db.commit()
     await db.refresh(exercise)
     
+    record_exercise_set(user.id, workout.workout_date, exercise)
+    
+    await publish_event(user.id, "workout.updated", id=workout.id, workout_date=workout.workout_date)
+    
     return exercise
 
 
@@ -217,6 +359,7 @@ async def update_exercise(
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
     
+    previous_name = exercise.name
     update_data = exercise_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(exercise, field, value)
@@ -224,6 +367,11 @@ async def update_exercise(
     await db.commit()
     await db.refresh(exercise)
     
+    invalidate_exercise_analytics(user.id, previous_name)
+    invalidate_exercise_analytics(user.id, exercise.name)
+    
+    await publish_event(user.id, "workout.updated", id=workout_id)
+    
     return exercise
 
 
@@ -251,40 +399,17 @@ async def delete_exercise(
     
     await db.delete(exercise)
     await db.commit()
+    
+    invalidate_exercise_analytics(user.id, exercise.name)
+    
+    await publish_event(user.id, "workout.updated", id=workout_id)
 
 
 @router.get("/summary/weekly", response_model=WorkoutSummary)
+@coalesced(WorkoutSummary)
 async def get_weekly_summary(
     user: CurrentUser,
     db: DbSession,
 ):
     """Get workout summary for the current week."""
-    today = date.today()
-    week_start = today - timedelta(days=today.weekday())
-    
-    result = await db.execute(
-        select(Workout)
-        .where(
-            Workout.user_id == user.id,
-            Workout.workout_date >= week_start,
-            Workout.workout_date <= today,
-        )
-    )
-    workouts = result.scalars().all()
-    
-    workouts_by_type = {}
-    total_duration = 0
-    total_calories = 0
-    
-    for workout in workouts:
-        workout_type = workout.workout_type.value
-        workouts_by_type[workout_type] = workouts_by_type.get(workout_type, 0) + 1
-        total_duration += workout.duration_minutes
-        total_calories += workout.calories_burned or 0
-    
-    return WorkoutSummary(
-        total_workouts=len(workouts),
-        total_duration_minutes=total_duration,
-        total_calories_burned=total_calories,
-        workouts_by_type=workouts_by_type,
-    )
+    return await weekly_workout_summary(db, user.id)
@@ -1,3 +1,7 @@
+import functools
+import time
+from typing import Optional
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
 from telegram.ext import (
     Application,
@@ -7,13 +11,53 @@ from telegram.ext import (
     ContextTypes,
     filters,
 )
+from telegram.request import BaseRequest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import async_session_maker
+from app.core.events import publish_event
+from app.core.metrics import (
+    BOT_HANDLER_DB_QUERIES,
+    BOT_HANDLER_DURATION,
+    BOT_HANDLER_ERRORS,
+    track_db,
+)
 from app.models.user import User
 from app.models.shopping import ShoppingItem
+from app.services.rollups import apply_rollup_deltas, water_delta
+from app.services.shopping import add_shopping_items, publish_shopping_merge
+from app.services.streaks import get_streaks
+
+
+# Callback data values reported as their own metric label
+CALLBACK_ACTIONS = {"today", "shopping", "water_add", "menu", "settings"}
+
+
+def instrumented(command: str):
+    """Record latency, DB queries and failures of a bot handler."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+            label = command
+            if update.callback_query:
+                data = update.callback_query.data
+                label = f"callback:{data if data in CALLBACK_ACTIONS else 'other'}"
+
+            start = time.perf_counter()
+            try:
+                with track_db() as stats:
+                    await handler(update, context)
+            except Exception:
+                BOT_HANDLER_ERRORS.inc(command=label)
+                raise
+            finally:
+                BOT_HANDLER_DURATION.observe(time.perf_counter() - start, command=label)
+                BOT_HANDLER_DB_QUERIES.observe(stats.queries, command=label)
+
+        return wrapper
+    return decorator
 
 
 async def get_or_create_user(session: AsyncSession, telegram_user) -> User:
@@ -99,6 +143,7 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 /shop - View shopping list
 /add - Quick add items (e.g., /add milk, eggs)
 /water - Log water intake
+/streaks - Goal streaks and adherence
 /help - Show this help message
 
 **Quick Actions:**
@@ -221,18 +266,17 @@ async def add_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     async with async_session_maker() as session:
         user = await get_or_create_user(session, telegram_user)
         
-        for item_name in items:
-            item = ShoppingItem(
-                user_id=user.id,
-                name=item_name,
-            )
-            session.add(item)
-        
+        merge = await add_shopping_items(session, user.id, [{"name": item_name} for item_name in items])
         await session.commit()
     
+    await publish_shopping_merge(user.id, merge)
+    
+    merged = len(merge.merged_ids)
+    merged_note = f"\n\n🔁 {merged} already on your list, quantities merged." if merged else ""
     await update.message.reply_text(
-        f"✅ Added {len(items)} item(s) to your shopping list:\n" +
-        "\n".join(f"• {item}" for item in items)
+        f"✅ Added {len(merge.items)} item(s) to your shopping list:\n" +
+        "\n".join(f"• {item.name}" + (f" ({item.quantity})" if item.quantity else "") for item in merge.items) +
+        merged_note
     )
 
 
@@ -260,6 +304,7 @@ async def water_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             log_date=date.today(),
         )
         session.add(water_log)
+        await apply_rollup_deltas(session, user, [water_delta(water_log.log_date, glasses)])
         await session.commit()
         
         # Get total for today
@@ -271,12 +316,44 @@ async def water_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         total = result.scalar() or 0
     
+    await publish_event(user.id, "water.logged", glasses=glasses, log_date=date.today())
+    
     await update.message.reply_text(
         f"💧 Logged {glasses} glass(es) of water!\n\n"
         f"Today's total: {total} / {user.daily_water_goal} glasses"
     )
 
 
+STREAK_LABELS = {
+    "calories": "🔥 Calories on target",
+    "protein": "🥩 Protein goal",
+    "water": "💧 Water goal",
+    "logging": "📝 Meals logged",
+    "workouts": "🏋️ Workout weeks",
+}
+
+
+async def streaks_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle /streaks command - show goal streaks."""
+    telegram_user = update.effective_user
+    
+    async with async_session_maker() as session:
+        user = await get_or_create_user(session, telegram_user)
+        streaks = await get_streaks(session, user)
+        await session.commit()
+    
+    text = "📈 **Your Streaks**\n\n"
+    for streak in streaks:
+        unit = "wk" if streak["period"] == "week" else "d"
+        text += (
+            f"{STREAK_LABELS.get(streak['goal'], streak['goal'])}: "
+            f"{streak['current']}{unit} (best {streak['longest']}{unit}, "
+            f"{round(streak['adherence'] * 100)}% last 30 days)\n"
+        )
+    
+    await update.message.reply_text(text, parse_mode="Markdown")
+
+
 async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle callback queries from inline buttons."""
     query = update.callback_query
@@ -304,6 +381,7 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 log_date=date.today(),
             )
             session.add(water_log)
+            await apply_rollup_deltas(session, user, [water_delta(water_log.log_date, 1)])
             await session.commit()
             
             from sqlalchemy import func
@@ -314,6 +392,8 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             )
             total = result.scalar() or 0
         
+        await publish_event(user.id, "water.logged", glasses=1, log_date=date.today())
+        
         await query.edit_message_text(
             f"💧 +1 glass of water!\n\nToday's total: {total} glasses",
             reply_markup=InlineKeyboardMarkup([
@@ -344,17 +424,26 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         )
 
 
-def create_bot_application() -> Application:
-    """Create and configure the Telegram bot application."""
-    application = Application.builder().token(settings.telegram_bot_token).build()
+def create_bot_application(request: Optional[BaseRequest] = None) -> Application:
+    """
+    Create and configure the Telegram bot application.
+    
+    A custom ``request`` replaces the HTTP transport to the Bot API, e.g. the
+    fake transport used by the bot benchmarks.
+    """
+    builder = Application.builder().token(settings.telegram_bot_token)
+    if request is not None:
+        builder = builder.request(request).get_updates_request(request)
+    application = builder.build()
     
     # Add handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("today", today_command))
-    application.add_handler(CommandHandler("shop", shop_command))
-    application.add_handler(CommandHandler("add", add_command))
-    application.add_handler(CommandHandler("water", water_command))
-    application.add_handler(CallbackQueryHandler(callback_handler))
+    application.add_handler(CommandHandler("start", instrumented("start")(start_command)))
+    application.add_handler(CommandHandler("help", instrumented("help")(help_command)))
+    application.add_handler(CommandHandler("today", instrumented("today")(today_command)))
+    application.add_handler(CommandHandler("shop", instrumented("shop")(shop_command)))
+    application.add_handler(CommandHandler("add", instrumented("add")(add_command)))
+    application.add_handler(CommandHandler("water", instrumented("water")(water_command)))
+    application.add_handler(CommandHandler("streaks", instrumented("streaks")(streaks_command)))
+    application.add_handler(CallbackQueryHandler(instrumented("callback")(callback_handler)))
     
     return application
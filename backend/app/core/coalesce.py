@@ -0,0 +1,86 @@
+"""
+Single-flight coalescing of identical concurrent reads.
+
+When the Mini App and the bot (or several tabs) ask for the same
+summary at the same moment, the first request runs the endpoint and
+serializes its response; identical requests arriving while it is in
+flight wait for that result instead of querying the database again.
+Nothing is cached once the leader finishes. Change events for a user
+detach that user's in-flight reads, so a request made after a write
+never joins a read that started before it.
+"""
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from pydantic import TypeAdapter
+
+from app.core.metrics import HTTP_COALESCED_REQUESTS
+
+# Endpoint arguments that identify the caller rather than the request
+CONTEXT_ARGS = ("user", "db")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            HTTP_COALESCED_REQUESTS.inc(endpoint=key[0])
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # The leader's client went away; run it ourselves unless we were cancelled too
+                if not task.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await fn()
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await task
+
+    def _forget(self, key: Tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def forget_user(self, user_id: int) -> None:
+        """Let later reads of a user start fresh (in-flight ones still finish)."""
+        for key in [key for key in self._inflight if key[1] == user_id]:
+            del self._inflight[key]
+
+
+single_flight = SingleFlight()
+
+
+def coalesced(response_type: Any):
+    """
+    Share one in-flight execution among identical concurrent calls of a read endpoint.
+
+    Calls are identical when user and every other argument match. The
+    result is validated against ``response_type`` and serialized once;
+    every caller gets the same JSON body.
+    """
+    # Imported here so the bot, which only needs ``single_flight`` via the
+    # event broker, doesn't load FastAPI
+    from fastapi import Response
+
+    adapter = TypeAdapter(response_type)
+
+    def decorate(endpoint: Callable[..., Awaitable[Any]]):
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs: Any):
+            params = tuple(sorted((name, value) for name, value in kwargs.items() if name not in CONTEXT_ARGS))
+
+            async def run() -> bytes:
+                result = await endpoint(**kwargs)
+                return adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+
+            body = await single_flight.do((endpoint.__name__, kwargs["user"].id, params), run)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorate
@@ -1,3 +1,4 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -23,6 +24,16 @@ class Base(DeclarativeBase):
     pass
 
 
+def upsert_insert(db: AsyncSession, model):
+    """
+    ``INSERT`` for the session's dialect, with ``on_conflict_do_update``.
+    
+    PostgreSQL in production, SQLite in tests and local tooling.
+    """
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
 async def get_db() -> AsyncSession:
     """Dependency for getting async database session"""
     async with async_session_maker() as session:
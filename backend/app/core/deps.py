@@ -9,23 +9,19 @@ from app.core.security import get_telegram_user_from_init_data
 from app.models.user import User
 
 
-async def get_current_user(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    x_telegram_init_data: Annotated[Optional[str], Header()] = None,
-) -> User:
+async def resolve_user(db: AsyncSession, init_data: Optional[str]) -> User:
     """
-    Get current user from Telegram init data.
+    Validate Telegram init data and return the corresponding user.
     
-    The webapp sends init data in the X-Telegram-Init-Data header.
-    We validate it and return the corresponding user.
+    Users are created on first sight.
     """
-    if not x_telegram_init_data:
+    if not init_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Telegram init data required",
         )
 
-    telegram_user = get_telegram_user_from_init_data(x_telegram_init_data)
+    telegram_user = get_telegram_user_from_init_data(init_data)
     if not telegram_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,6 +56,19 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    x_telegram_init_data: Annotated[Optional[str], Header()] = None,
+) -> User:
+    """
+    Get current user from Telegram init data.
+    
+    The webapp sends init data in the X-Telegram-Init-Data header.
+    We validate it and return the corresponding user.
+    """
+    return await resolve_user(db, x_telegram_init_data)
+
+
 # Type alias for dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
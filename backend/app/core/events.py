@@ -0,0 +1,103 @@
+"""
+Per-user change events for live updates in open Mini App sessions.
+
+Write paths publish compact events (``{"type": "water.logged", ...}``)
+which are fanned out to the user's Server-Sent Events subscribers. With
+the ``postgres`` backend events travel through LISTEN/NOTIFY so every
+worker process delivers them to its own subscribers.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Set
+
+from app.core.coalesce import single_flight
+from app.core.config import settings
+
+logger = logging.getLogger("lifeguard.events")
+
+NOTIFY_CHANNEL = "lifeguard_events"
+
+# Slow consumers drop events instead of growing memory without bound
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class EventBroker:
+    """In-process pub/sub of user events with optional Postgres fan-out."""
+
+    def __init__(self, backend: str = "memory"):
+        self.backend = backend
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._connection = None
+        self._lock = asyncio.Lock()
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    def deliver(self, user_id: int, event: dict) -> None:
+        """Hand an event to this process's subscribers of a user."""
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Dropping event for slow subscriber of user %s", user_id)
+
+    async def publish(self, user_id: int, event: dict) -> None:
+        # Reads after this write must not join reads that started before it
+        single_flight.forget_user(user_id)
+        if self._connection is None:
+            self.deliver(user_id, event)
+            return
+
+        payload = json.dumps({"user_id": user_id, "event": event}, separators=(",", ":"), default=str)
+        try:
+            # One asyncpg connection cannot run concurrent operations
+            async with self._lock:
+                await self._connection.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, payload)
+        except Exception:
+            logger.exception("Failed to publish event, delivering locally only")
+            self.deliver(user_id, event)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        message = json.loads(payload)
+        single_flight.forget_user(message["user_id"])
+        self.deliver(message["user_id"], message["event"])
+
+    async def start(self) -> None:
+        """Open the LISTEN connection when the Postgres backend is configured."""
+        if self.backend != "postgres":
+            return
+
+        import asyncpg
+
+        dsn = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+        self._connection = await asyncpg.connect(dsn)
+        await self._connection.add_listener(NOTIFY_CHANNEL, self._on_notification)
+
+    async def stop(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+
+broker = EventBroker(settings.events_backend)
+
+
+async def publish_event(user_id: int, event_type: str, **data: Any) -> None:
+    """Publish a change event to all live sessions of a user."""
+    await broker.publish(user_id, {"type": event_type, **data})
+
+
+def format_sse(event: dict) -> str:
+    """Encode an event as a Server-Sent Events message."""
+    data = json.dumps(event, separators=(",", ":"), default=str)
+    return f"event: {event['type']}\ndata: {data}\n\n"
@@ -0,0 +1,232 @@
+"""
+Background job queue on the ``jobs`` table.
+
+Handlers are registered per job type with a cluster-wide concurrency
+limit. Workers poll for due jobs and claim them with ``SELECT ... FOR
+UPDATE SKIP LOCKED``, so any number of worker processes can share the
+table. Claims for one type are serialized with an advisory lock so the
+concurrency limit holds across processes. Failed attempts are retried
+with exponential backoff and jitter; jobs whose worker died are
+reclaimed once their lock times out.
+"""
+import asyncio
+import logging
+import os
+import random
+import socket
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.job import Job
+
+logger = logging.getLogger("lifeguard.jobs")
+
+JobHandler = Callable[[AsyncSession, Job], Awaitable[Optional[dict]]]
+
+
+@dataclass(frozen=True)
+class JobType:
+    name: str
+    handler: JobHandler
+    concurrency: int
+    max_attempts: int
+    timeout_seconds: float
+
+
+_job_types: Dict[str, JobType] = {}
+
+
+def job_handler(name: str, concurrency: int = 1, max_attempts: int = 5, timeout_seconds: float = 600):
+    """Register ``async def handler(db, job) -> Optional[dict]`` for a job type."""
+    def register(handler: JobHandler) -> JobHandler:
+        _job_types[name] = JobType(name, handler, concurrency, max_attempts, timeout_seconds)
+        return handler
+    return register
+
+
+async def enqueue(
+    db: AsyncSession,
+    job_type: str,
+    payload: Optional[dict] = None,
+    user_id: Optional[int] = None,
+    run_at: Optional[datetime] = None,
+) -> Job:
+    """Queue a job. It becomes visible to workers when the caller commits."""
+    if job_type not in _job_types:
+        raise ValueError(f"Unknown job type: {job_type}")
+
+    job = Job(
+        job_type=job_type,
+        payload=payload or {},
+        user_id=user_id,
+        max_attempts=_job_types[job_type].max_attempts,
+        run_at=run_at or datetime.utcnow(),
+    )
+    db.add(job)
+    await db.flush()
+    return job
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter, in seconds, after ``attempts`` failures."""
+    delay = min(settings.jobs_retry_base_seconds * 2 ** (attempts - 1), settings.jobs_retry_max_seconds)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobWorker:
+    """Polls the jobs table and runs claimed jobs as tasks of this process."""
+
+    def __init__(self, poll_seconds: float = 1.0):
+        self.poll_seconds = poll_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+        self._running: Dict[str, Set[asyncio.Task]] = {}
+        self._last_purge = datetime.min
+
+    async def _claim(self, job_type: JobType, slots: int) -> List[Job]:
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=settings.jobs_lock_timeout_seconds)
+
+        async with async_session_maker() as db:
+            if db.bind.dialect.name == "postgresql":
+                await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"jobs:{job_type.name}"))))
+
+            running = await db.execute(
+                select(func.count()).select_from(Job).where(
+                    Job.job_type == job_type.name, Job.status == "running", Job.locked_at >= stale
+                )
+            )
+            slots = min(slots, job_type.concurrency - running.scalar())
+            if slots <= 0:
+                return []
+
+            result = await db.execute(
+                select(Job)
+                .where(
+                    Job.job_type == job_type.name,
+                    or_(
+                        and_(Job.status == "queued", Job.run_at <= now),
+                        # The worker holding it went away
+                        and_(Job.status == "running", Job.locked_at < stale),
+                    ),
+                )
+                .order_by(Job.run_at)
+                .limit(slots)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = list(result.scalars())
+            for job in jobs:
+                job.status = "running"
+                job.attempts += 1
+                job.locked_at = now
+                job.locked_by = self.worker_id
+            await db.commit()
+            return jobs
+
+    async def _execute(self, job_type: JobType, job: Job) -> None:
+        try:
+            async with async_session_maker() as db:
+                result = await asyncio.wait_for(job_type.handler(db, job), job_type.timeout_seconds)
+                await db.commit()
+        except Exception as exc:
+            logger.warning("Job %s (%s) attempt %s failed: %r", job.id, job.job_type, job.attempts, exc)
+            error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+            await self._finish(job, error=error)
+            return
+        await self._finish(job, result=result)
+
+    async def _finish(self, job: Job, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+        async with async_session_maker() as db:
+            row = await db.get(Job, job.id)
+            if row is None or row.locked_by != self.worker_id or row.attempts != job.attempts:
+                # Reclaimed by another worker after our lock timed out
+                return
+
+            row.locked_at = row.locked_by = None
+            if error is None:
+                row.status = "succeeded"
+                row.result = result
+                row.last_error = None
+                row.finished_at = datetime.utcnow()
+            elif row.attempts < row.max_attempts:
+                row.status = "queued"
+                row.last_error = error
+                row.run_at = datetime.utcnow() + timedelta(seconds=retry_delay(row.attempts))
+            else:
+                row.status = "failed"
+                row.last_error = error
+                row.finished_at = datetime.utcnow()
+            await db.commit()
+
+    async def _purge(self) -> None:
+        """Drop finished jobs past their retention, at most hourly."""
+        now = datetime.utcnow()
+        if now - self._last_purge < timedelta(hours=1):
+            return
+        self._last_purge = now
+        async with async_session_maker() as db:
+            await db.execute(
+                delete(Job).where(
+                    Job.status.in_(("succeeded", "failed")),
+                    Job.finished_at < now - timedelta(days=settings.jobs_retention_days),
+                )
+            )
+            await db.commit()
+
+    async def poll(self) -> int:
+        """Claim and start due jobs for every type with free slots; returns how many."""
+        started = 0
+        for job_type in list(_job_types.values()):
+            running = self._running.setdefault(job_type.name, set())
+            free = job_type.concurrency - len(running)
+            if free <= 0:
+                continue
+            for job in await self._claim(job_type, free):
+                task = asyncio.create_task(self._execute(job_type, job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                started += 1
+        return started
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._purge()
+                started = await self.poll()
+            except Exception:
+                logger.exception("Job polling failed")
+                started = 0
+            if not started:
+                await asyncio.sleep(self.poll_seconds)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, grace_seconds: float = 10.0) -> None:
+        """Stop polling and give running jobs a moment to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        tasks = [task for running in self._running.values() for task in running]
+        if tasks:
+            # Jobs still running afterwards are reclaimed once their lock times out
+            _, pending = await asyncio.wait(tasks, timeout=grace_seconds)
+            for task in pending:
+                task.cancel()
+
+
+worker = JobWorker(settings.jobs_poll_seconds)
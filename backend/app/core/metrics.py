@@ -0,0 +1,315 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Only the pieces we need are implemented (counters, gauges, histograms and
+scrape-time collectors) so the backend has no extra dependencies.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Per label set: [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-2] += value
+        state[-1] += 1
+
+    def samples(self) -> List[str]:
+        lines = []
+        names = self.labelnames + ("le",)
+        for key, state in sorted(self._values.items()):
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += state[i]
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(state[-1])}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before a scrape."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    "lifeguard_http_requests_total",
+    "HTTP requests by route and status code.",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    "lifeguard_http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route"),
+))
+HTTP_IN_FLIGHT = registry.register(Gauge(
+    "lifeguard_http_requests_in_flight",
+    "HTTP requests currently being served.",
+))
+HTTP_COALESCED_REQUESTS = registry.register(Counter(
+    "lifeguard_http_coalesced_requests_total",
+    "Read requests served by joining an identical in-flight request.",
+    ("endpoint",),
+))
+HTTP_RATE_LIMITED = registry.register(Counter(
+    "lifeguard_http_rate_limited_total",
+    "Requests rejected by the rate limiter, by budget and reason (user or concurrency).",
+    ("budget", "reason"),
+))
+HTTP_REQUEST_DB_QUERIES = registry.register(Histogram(
+    "lifeguard_http_request_db_queries",
+    "Database queries issued per HTTP request.",
+    ("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+))
+HTTP_REQUEST_DB_DURATION = registry.register(Histogram(
+    "lifeguard_http_request_db_duration_seconds",
+    "Time spent in the database per HTTP request.",
+    ("method", "route"),
+))
+DB_QUERIES = registry.register(Counter(
+    "lifeguard_db_queries_total",
+    "Database statements executed.",
+))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "lifeguard_db_query_duration_seconds",
+    "Database statement latency.",
+))
+DB_POOL = registry.register(Gauge(
+    "lifeguard_db_pool_connections",
+    "Database pool connections by state.",
+    ("state",),
+))
+BOT_HANDLER_DURATION = registry.register(Histogram(
+    "lifeguard_bot_handler_duration_seconds",
+    "Telegram bot handler latency by command.",
+    ("command",),
+))
+BOT_HANDLER_DB_QUERIES = registry.register(Histogram(
+    "lifeguard_bot_handler_db_queries",
+    "Database queries issued per bot update.",
+    ("command",),
+    buckets=QUERY_COUNT_BUCKETS,
+))
+BOT_HANDLER_ERRORS = registry.register(Counter(
+    "lifeguard_bot_handler_errors_total",
+    "Telegram bot handler failures by command.",
+    ("command",),
+))
+
+
+@dataclass
+class DbStats:
+    """Database activity accumulated for one request or bot update."""
+    queries: int = 0
+    seconds: float = 0.0
+
+
+_db_stats: ContextVar[Optional[DbStats]] = ContextVar("db_stats", default=None)
+
+
+@contextmanager
+def track_db() -> Iterator[DbStats]:
+    """
+    Collect database statement counts and time for the current context.
+    
+    Nested blocks also add their totals to the enclosing block.
+    """
+    outer = _db_stats.get()
+    stats = DbStats()
+    token = _db_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _db_stats.reset(token)
+        if outer is not None:
+            outer.queries += stats.queries
+            outer.seconds += stats.seconds
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Hook statement timing and pool statistics into an async engine."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_query_start"].pop()
+        DB_QUERIES.inc()
+        DB_QUERY_DURATION.observe(elapsed)
+
+        stats = _db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+    def collect_pool_stats() -> None:
+        # Only queue-based pools expose these counters (not SQLite's)
+        pool = sync_engine.pool
+        if not hasattr(pool, "checkedout"):
+            return
+        DB_POOL.set(pool.size(), state="size")
+        DB_POOL.set(pool.checkedin(), state="idle")
+        DB_POOL.set(pool.checkedout(), state="in_use")
+        DB_POOL.set(max(pool.overflow(), 0), state="overflow")
+
+    registry.add_collector(collect_pool_stats)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status and DB usage per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            with track_db() as stats:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+
+            # Label by route template, not raw path, to keep cardinality bounded
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=route_path)
+            HTTP_REQUEST_DB_QUERIES.observe(stats.queries, method=method, route=route_path)
+            HTTP_REQUEST_DB_DURATION.observe(stats.seconds, method=method, route=route_path)
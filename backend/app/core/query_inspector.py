@@ -0,0 +1,216 @@
+"""
+Opt-in detection of N+1 query patterns and slow statements.
+
+Statements issued while an inspection is active are grouped by their
+normalized SQL shape. Shapes repeated more than the configured threshold
+(typical of per-row loads, refreshes or deletes inside a loop) and
+statements slower than the configured limit are reported.
+"""
+import json
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger("lifeguard.queries")
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_CAST = re.compile(r"::\w+(?:\[\])?")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|:\w+|\?")
+_IN_LIST = re.compile(r"\bIN \(\?(?:, ?\?)*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"VALUES (\([^()]*\))(?:, ?\([^()]*\))+", re.IGNORECASE)
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape by stripping literals and parameters."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _CAST.sub("", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _VALUES_LIST.sub(r"VALUES \1, ...", shape)
+    return shape
+
+
+@dataclass
+class StatementStats:
+    sql: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class QueryReport:
+    """Statements captured during one request, test or bot update."""
+    repeat_threshold: int
+    slow_ms: float
+    statements: Dict[str, StatementStats] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        shape = normalize_sql(statement)
+        stats = self.statements.get(shape)
+        if stats is None:
+            stats = self.statements[shape] = StatementStats(sql=shape)
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    @property
+    def total_queries(self) -> int:
+        return sum(stats.count for stats in self.statements.values())
+
+    @property
+    def repeated(self) -> List[StatementStats]:
+        return [stats for stats in self.statements.values() if stats.count > self.repeat_threshold]
+
+    @property
+    def slow(self) -> List[StatementStats]:
+        return [stats for stats in self.statements.values() if stats.max_ms >= self.slow_ms]
+
+    @property
+    def has_problems(self) -> bool:
+        return bool(self.repeated or self.slow)
+
+    def summary(self) -> dict:
+        """Compact form suitable for a response header."""
+        return {
+            "queries": self.total_queries,
+            "shapes": len(self.statements),
+            "repeated": len(self.repeated),
+            "slow": len(self.slow),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            **self.summary(),
+            "repeated_statements": [
+                {"sql": stats.sql, "count": stats.count, "total_ms": round(stats.total_ms, 2)}
+                for stats in self.repeated
+            ],
+            "slow_statements": [
+                {"sql": stats.sql, "max_ms": round(stats.max_ms, 2)}
+                for stats in self.slow
+            ],
+        }
+
+
+class QueryInspectionError(AssertionError):
+    """Raised by ``assert_query_budget`` when a block has query problems."""
+
+
+_current_report: ContextVar[Optional[QueryReport]] = ContextVar("query_report", default=None)
+
+
+@contextmanager
+def inspect_queries(
+    repeat_threshold: Optional[int] = None,
+    slow_ms: Optional[float] = None,
+) -> Iterator[QueryReport]:
+    """Capture statements executed in the current context into a report."""
+    report = QueryReport(
+        repeat_threshold=settings.query_inspector_repeat_threshold if repeat_threshold is None else repeat_threshold,
+        slow_ms=settings.query_inspector_slow_ms if slow_ms is None else slow_ms,
+    )
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        _current_report.reset(token)
+
+
+@contextmanager
+def assert_query_budget(
+    max_queries: Optional[int] = None,
+    repeat_threshold: Optional[int] = None,
+    slow_ms: Optional[float] = None,
+    engine: Optional[AsyncEngine] = None,
+) -> Iterator[QueryReport]:
+    """
+    Fail when the wrapped block has N+1 patterns, slow or too many statements.
+
+    Meant for tests and CI (see ``scripts.query_budget``): wrap an API call
+    and any regression raises ``QueryInspectionError`` with the full
+    report. Statement capture is installed on ``engine`` (the app's engine
+    by default) if it isn't already.
+    """
+    if engine is None:
+        from app.core.database import engine as app_engine
+        engine = app_engine
+    install_query_inspector(engine)
+
+    with inspect_queries(repeat_threshold, slow_ms) as report:
+        yield report
+
+    over_budget = max_queries is not None and report.total_queries > max_queries
+    if report.has_problems or over_budget:
+        raise QueryInspectionError(json.dumps(report.to_dict(), indent=2))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("inspector_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["inspector_query_start"].pop()
+    report = _current_report.get()
+    if report is not None:
+        report.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def install_query_inspector(engine: AsyncEngine) -> None:
+    """Hook statement capture into an async engine (once; later calls do nothing)."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryInspectorMiddleware:
+    """
+    ASGI middleware reporting N+1 patterns and slow statements per request.
+
+    Problems are logged as one structured line; in development every
+    response also carries an ``X-Query-Report`` summary header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.expose_header = settings.environment == "development"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with inspect_queries() as report:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start" and self.expose_header:
+                    header = json.dumps(report.summary(), separators=(",", ":"))
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-query-report", header.encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        if report.has_problems:
+            route = getattr(scope.get("route"), "path", scope["path"])
+            logger.warning(json.dumps({
+                "event": "query_inspection",
+                "method": scope["method"],
+                "route": route,
+                **report.to_dict(),
+            }))
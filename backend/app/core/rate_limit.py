@@ -0,0 +1,257 @@
+"""
+Per-user and global rate limiting for the API.
+
+Every API request takes a token from a bucket keyed on its route budget
+and the caller: the Telegram user id from verified init data (an HMAC
+check, no database access) or, without valid init data, the client
+address. Buckets refill continuously at the budget's rate up to its
+burst size; a request finding its bucket empty gets ``429`` with
+``Retry-After`` set to when the next token is due.
+
+Separately, a per-process ceiling on in-flight API requests protects the
+connection pool: by default it is what the pool can hand out (size plus
+overflow), so requests beyond it get ``503`` with ``Retry-After`` instead
+of waiting for a connection. As load approaches the ceiling every refill
+rate shrinks (to a quarter at the ceiling), so clients that keep their
+buckets drained back off first.
+
+Buckets live in process memory by default. With several API workers set
+``RATE_LIMIT_BACKEND=postgres`` to share them through the unlogged
+``rate_limit_buckets`` table, at one upsert per request. The upserts go
+through a small pool of their own with a short timeout, so they never
+compete with handlers for the app's connections.
+"""
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Pattern, Tuple
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.metrics import HTTP_RATE_LIMITED
+from app.core.security import get_telegram_user_from_init_data
+
+logger = logging.getLogger("lifeguard.rate_limit")
+
+# Only API routes are limited; live update streams are long-lived and
+# would sit on a concurrency slot for their whole lifetime
+LIMITED_PREFIX = "/api/"
+EXEMPT_PREFIXES = ("/api/events",)
+
+# Refill rates start shrinking above this share of the concurrency ceiling
+ADAPTIVE_THRESHOLD = 0.5
+MIN_RATE_FACTOR = 0.25
+
+# Ceiling when the pool has no fixed size (SQLite's NullPool, unlimited overflow)
+UNSIZED_POOL_CONCURRENCY = 64
+
+
+@dataclass(frozen=True)
+class Budget:
+    name: str
+    rate: float  # tokens per second
+    burst: int
+
+
+@dataclass(frozen=True)
+class RouteBudget:
+    method: str
+    pattern: Pattern
+    budget: Budget
+
+
+def route_budget(method: str, path: str, name: str, per_minute: float, burst: int) -> RouteBudget:
+    """Budget for one route; ``{param}`` segments of ``path`` match any value."""
+    pattern = re.compile("^" + re.sub(r"\{\w+\}", "[^/]+", path) + "/?$")
+    return RouteBudget(method, pattern, Budget(name, per_minute / 60, burst))
+
+
+# Cheap writes a client loop can hammer, and expensive ones a user rarely needs
+ROUTE_BUDGETS = (
+    route_budget("POST", "/api/nutrition/water", "water", per_minute=30, burst=10),
+    route_budget("PATCH", "/api/shopping/{item_id}/toggle", "shopping_toggle", per_minute=120, burst=30),
+    route_budget("POST", "/api/import/{kind}", "import", per_minute=2, burst=3),
+    route_budget("POST", "/api/progress/rebuild", "progress_rebuild", per_minute=2, burst=2),
+)
+
+
+def default_budget() -> Budget:
+    return Budget("default", settings.rate_limit_per_minute / 60, settings.rate_limit_burst)
+
+
+def budget_for(method: str, path: str) -> Budget:
+    for route in ROUTE_BUDGETS:
+        if route.method == method and route.pattern.match(path):
+            return route.budget
+    return default_budget()
+
+
+def is_limited(path: str) -> bool:
+    return path.startswith(LIMITED_PREFIX) and not path.startswith(EXEMPT_PREFIXES)
+
+
+def client_key(scope) -> str:
+    """The verified Telegram user id, or the client address without valid init data."""
+    for name, value in scope["headers"]:
+        if name == b"x-telegram-init-data":
+            user = get_telegram_user_from_init_data(value.decode("latin-1"))
+            if user and user.get("id"):
+                return f"user:{user['id']}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class MemoryBuckets:
+    """Token buckets of this process."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated, when the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._prune_at = max_keys
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Take a token; returns 0 if one was available, else seconds until one is."""
+        now = time.monotonic()
+        tokens, updated, _ = self._buckets.get(key, (burst, now, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+
+        if len(self._buckets) > self._prune_at:
+            self._prune(now)
+        return wait
+
+    def _prune(self, now: float) -> None:
+        # A full bucket is the same as no bucket, so dropping those loses nothing
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+        self._prune_at = max(self.max_keys, 2 * len(self._buckets))
+
+
+# The bucket refilled up to now, from its stored state
+REFILLED = (
+    "LEAST(CAST(:burst AS double precision), "
+    "b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at)::double precision * CAST(:rate AS double precision))"
+)
+
+# Refill and take in one statement; ``allowed`` records whether a token was taken
+TAKE_TOKEN = text(f"""
+    INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+    VALUES (:key, CAST(:burst AS double precision) - 1, true, now())
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = {REFILLED} - CASE WHEN {REFILLED} >= 1 THEN 1 ELSE 0 END,
+        allowed = {REFILLED} >= 1,
+        updated_at = now()
+    RETURNING b.tokens, b.allowed
+""")
+
+PURGE_BUCKETS = text("DELETE FROM rate_limit_buckets WHERE updated_at < now() - interval '1 hour'")
+
+
+class PostgresBuckets:
+    """Token buckets in the ``rate_limit_buckets`` table, shared by every worker."""
+
+    PURGE_INTERVAL = 600
+
+    def __init__(self):
+        self._last_purge = time.monotonic()
+        timeout = settings.rate_limit_timeout_ms
+        self.engine = create_async_engine(
+            settings.database_url,
+            pool_size=settings.rate_limit_pool_size,
+            max_overflow=0,
+            pool_timeout=timeout / 1000,
+            connect_args={"timeout": timeout / 1000, "server_settings": {"statement_timeout": str(timeout)}},
+        )
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        async with self.engine.begin() as conn:
+            result = await conn.execute(TAKE_TOKEN, {"key": key, "rate": rate, "burst": burst})
+            tokens, allowed = result.one()
+            if time.monotonic() - self._last_purge > self.PURGE_INTERVAL:
+                self._last_purge = time.monotonic()
+                await conn.execute(PURGE_BUCKETS)
+        return 0.0 if allowed else (1 - tokens) / rate
+
+
+def create_backend(name: str):
+    if name == "postgres":
+        return PostgresBuckets()
+    if name == "memory":
+        return MemoryBuckets()
+    raise ValueError(f"Unknown rate limit backend: {name}")
+
+
+def pool_capacity() -> int:
+    """Connections the app's pool can hand out at once."""
+    pool = engine.pool
+    if not hasattr(pool, "size") or pool._max_overflow < 0:
+        return UNSIZED_POOL_CONCURRENCY
+    return pool.size() + pool._max_overflow
+
+
+def reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimitMiddleware:
+    """ASGI middleware applying per-user token buckets and a global concurrency ceiling."""
+
+    def __init__(self, app, backend: Optional[str] = None, max_concurrency: Optional[int] = None):
+        self.app = app
+        self.buckets = create_backend(backend or settings.rate_limit_backend)
+        self.max_concurrency = max_concurrency or settings.rate_limit_max_concurrency or pool_capacity()
+        self.in_flight = 0
+
+    def rate_factor(self) -> float:
+        """Scale for refill rates, shrinking linearly above the adaptive threshold."""
+        load = self.in_flight / self.max_concurrency
+        if load <= ADAPTIVE_THRESHOLD:
+            return 1.0
+        scale = (load - ADAPTIVE_THRESHOLD) / (1 - ADAPTIVE_THRESHOLD)
+        return max(MIN_RATE_FACTOR, 1 - scale * (1 - MIN_RATE_FACTOR))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not is_limited(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        budget = budget_for(scope["method"], scope["path"])
+        if self.in_flight >= self.max_concurrency:
+            HTTP_RATE_LIMITED.inc(budget=budget.name, reason="concurrency")
+            await reject(503, "Server busy, retry shortly", 1)(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            rate = budget.rate * self.rate_factor()
+            try:
+                wait = await self.buckets.take(f"{budget.name}:{client_key(scope)}", rate, budget.burst)
+            except Exception as exc:
+                # Fail open: a broken shared backend shouldn't take the API down with it
+                logger.warning("Rate limit backend failed: %r", exc)
+                wait = 0.0
+
+            if wait > 0:
+                HTTP_RATE_LIMITED.inc(budget=budget.name, reason="user")
+                await reject(429, "Too many requests", wait)(scope, receive, send)
+                return
+
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
@@ -1,12 +1,50 @@
 import hashlib
 import hmac
 import json
-from urllib.parse import parse_qsl
+from urllib.parse import parse_qsl, urlencode
 from typing import Optional
 
 from app.core.config import settings
 
 
+def compute_init_data_hash(data: dict) -> str:
+    """Compute the Telegram Web App hash of init data fields (without ``hash``)."""
+    # Create data-check-string
+    # Sort all key-value pairs alphabetically by key
+    data_check_string = "\n".join(
+        f"{k}={v}" for k, v in sorted(data.items())
+    )
+
+    # Create secret key using HMAC-SHA256 of bot token with "WebAppData"
+    secret_key = hmac.new(
+        key=b"WebAppData",
+        msg=settings.telegram_bot_token.encode(),
+        digestmod=hashlib.sha256,
+    ).digest()
+
+    # Calculate hash of data-check-string
+    return hmac.new(
+        key=secret_key,
+        msg=data_check_string.encode(),
+        digestmod=hashlib.sha256,
+    ).hexdigest()
+
+
+def sign_telegram_data(data: dict) -> str:
+    """
+    Build a signed init data query string, as Telegram would send it.
+    
+    Used by benchmarks and local tooling to act as a Mini App client.
+    A ``user`` dict is serialized to JSON like the real payload.
+    """
+    fields = {
+        key: json.dumps(value, separators=(",", ":")) if isinstance(value, dict) else str(value)
+        for key, value in data.items()
+    }
+    fields["hash"] = compute_init_data_hash(fields)
+    return urlencode(fields)
+
+
 def validate_telegram_data(init_data: str) -> Optional[dict]:
     """
     Validate Telegram Web App init data.
@@ -28,25 +66,7 @@ def validate_telegram_data(init_data: str) -> Optional[dict]:
         if not received_hash:
             return None
 
-        # Create data-check-string
-        # Sort all key-value pairs alphabetically by key
-        data_check_string = "\n".join(
-            f"{k}={v}" for k, v in sorted(parsed_data.items())
-        )
-
-        # Create secret key using HMAC-SHA256 of bot token with "WebAppData"
-        secret_key = hmac.new(
-            key=b"WebAppData",
-            msg=settings.telegram_bot_token.encode(),
-            digestmod=hashlib.sha256,
-        ).digest()
-
-        # Calculate hash of data-check-string
-        calculated_hash = hmac.new(
-            key=secret_key,
-            msg=data_check_string.encode(),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
+        calculated_hash = compute_init_data_hash(parsed_data)
 
         # Compare hashes
         if not hmac.compare_digest(calculated_hash, received_hash):
@@ -0,0 +1,120 @@
+"""
+Database pool warm-up for new replicas.
+
+At startup a configurable number of pool connections are opened side by
+side and the hot queries are run once on each. That pays for connection
+setup, asyncpg type introspection and statement preparation (cached per
+connection), plus SQLAlchemy's statement compilation, before the
+replica reports ready instead of on its first user requests.
+"""
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from datetime import date
+from typing import Callable, List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.models.nutrition import Meal, WaterLog
+from app.models.progress import DailyRollup
+from app.models.user import User
+from app.models.workout import Workout
+
+logger = logging.getLogger("lifeguard.warmup")
+
+RETRY_MAX_SECONDS = 30
+
+# Statements shaped like the ones behind the most frequent requests; no
+# user has id -1, so they touch indexes but return nothing
+HOT_QUERIES: List[Callable[[], object]] = [
+    lambda: select(User).where(User.telegram_id == -1),
+    lambda: select(Meal).where(Meal.user_id == -1, Meal.meal_date == date.today()),
+    lambda: select(func.coalesce(func.sum(WaterLog.glasses), 0)).where(
+        WaterLog.user_id == -1, WaterLog.log_date == date.today()
+    ),
+    lambda: select(DailyRollup).where(DailyRollup.user_id == -1, DailyRollup.day.in_([date.today()])),
+    lambda: select(Workout).where(Workout.user_id == -1).order_by(Workout.workout_date.desc()).limit(1),
+]
+
+
+def pool_status(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    stats = {}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if method is not None:
+            stats[name] = method()
+    return stats
+
+
+class PoolWarmup:
+    """Opens and primes pool connections in the background; tracks readiness."""
+
+    def __init__(self):
+        self.ready = False
+        self.connections = 0
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _prime(self, conn: AsyncConnection) -> None:
+        await conn.execute(text("SELECT 1"))
+        for query in HOT_QUERIES:
+            await conn.execute(query())
+
+    async def run(self, engine: AsyncEngine, connections: int) -> None:
+        """Warm up, retrying with backoff while the database is unreachable."""
+        size = pool_status(engine).get("size")
+        connections = min(connections, size) if size else connections
+        delay = 1.0
+        while True:
+            started = time.perf_counter()
+            try:
+                # Hold all connections at once so the pool really opens that many
+                async with AsyncExitStack() as stack:
+                    opened = [await stack.enter_async_context(engine.connect()) for _ in range(connections)]
+                    await asyncio.gather(*(self._prime(conn) for conn in opened))
+            except Exception as exc:
+                self.error = repr(exc)
+                logger.warning("Pool warm-up failed, retrying in %.0fs: %r", delay, exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_MAX_SECONDS)
+                continue
+
+            self.connections = connections
+            self.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.error = None
+            self.ready = True
+            logger.info("Warmed %s pool connections in %.1fms", connections, self.duration_ms)
+            return
+
+    def start(self, engine: AsyncEngine, connections: int) -> None:
+        if connections <= 0:
+            self.ready = True
+            return
+        self._task = asyncio.create_task(self.run(engine, connections))
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+async def db_round_trip_ms(engine: AsyncEngine, timeout: float) -> float:
+    """Time a pool checkout plus ``SELECT 1``; raises on failure or timeout."""
+    async def round_trip() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    started = time.perf_counter()
+    await asyncio.wait_for(round_trip(), timeout)
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+warmup = PoolWarmup()
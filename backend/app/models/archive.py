@@ -0,0 +1,33 @@
+from datetime import datetime, date
+
+from sqlalchemy import ForeignKey, String, DateTime, Integer, Date, LargeBinary, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class HistoryArchive(Base):
+    """
+    One user's archived meals or water logs for one month.
+
+    ``payload`` is zlib-compressed JSON holding the rows column by column.
+    Archived entries are read-only; their totals stay in ``daily_rollups``.
+    """
+    __tablename__ = "history_archives"
+    __table_args__ = (
+        UniqueConstraint("user_id", "kind", "month"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    kind: Mapped[str] = mapped_column(String(20))  # "meals" or "water_logs"
+    month: Mapped[date] = mapped_column(Date)  # first day of the month
+
+    row_count: Mapped[int] = mapped_column(Integer, default=0)
+    payload: Mapped[bytes] = mapped_column(LargeBinary)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<HistoryArchive {self.user_id} {self.kind} {self.month}>"
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Float, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Food(Base):
+    __tablename__ = "foods"
+    __table_args__ = (
+        # Trigram index serving both fuzzy (%) and prefix (ILIKE 'x%') search
+        Index(
+            "ix_foods_name_trgm",
+            text("name gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    
+    name: Mapped[str] = mapped_column(String(255))
+    brand: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    barcode: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    
+    # Nutrition per 100 g
+    calories: Mapped[float] = mapped_column(Float)
+    protein: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    carbs: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fiber: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    
+    source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<Food {self.id}: {self.name}>"
@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, DateTime, Integer, Float, Text, Date, Enum
+from sqlalchemy import ForeignKey, String, DateTime, Integer, Float, Text, Date, Enum, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -19,6 +19,7 @@ class MealType(str, enum.Enum):
 
 
 class Meal(Base):
+    # Range-partitioned by month on meal_date in PostgreSQL (migration 008)
     __tablename__ = "meals"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -53,6 +54,7 @@ class Meal(Base):
 
 
 class WaterLog(Base):
+    # Range-partitioned by month on log_date in PostgreSQL (migration 008)
     __tablename__ = "water_logs"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -69,3 +71,37 @@ class WaterLog(Base):
 
     def __repr__(self) -> str:
         return f"<WaterLog {self.id}: {self.glasses} glasses>"
+
+
+class MealSuggestion(Base):
+    """
+    Per-user index of previously logged meals for one-tap re-logging.
+    
+    One row per (user, meal type, name + macros signature). ``score`` is a
+    count decayed by age, stored as of ``last_used_at``.
+    """
+    __tablename__ = "meal_suggestions"
+    __table_args__ = (
+        UniqueConstraint("user_id", "meal_type", "signature"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    meal_type: Mapped[MealType] = mapped_column(Enum(MealType))
+    signature: Mapped[str] = mapped_column(String(40))
+    
+    name: Mapped[str] = mapped_column(String(255))
+    calories: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    protein: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    carbs: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fiber: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    serving_size: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    
+    score: Mapped[float] = mapped_column(Float, default=0.0)
+    use_count: Mapped[int] = mapped_column(Integer, default=0)
+    mean_hour: Mapped[float] = mapped_column(Float, default=12.0)  # UTC hour of day
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<MealSuggestion {self.id}: {self.name}>"
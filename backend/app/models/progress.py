@@ -0,0 +1,64 @@
+from datetime import datetime, date
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, DateTime, Integer, Float, Date, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class DailyRollup(Base):
+    """
+    Per-user, per-day totals of meals, water and workouts.
+    
+    Maintained incrementally by every write path, so progress views read
+    one row per day instead of aggregating raw entries.
+    """
+    __tablename__ = "daily_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "day"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    day: Mapped[date] = mapped_column(Date)
+    
+    calories: Mapped[int] = mapped_column(Integer, default=0)
+    protein: Mapped[float] = mapped_column(Float, default=0.0)
+    carbs: Mapped[float] = mapped_column(Float, default=0.0)
+    fat: Mapped[float] = mapped_column(Float, default=0.0)
+    fiber: Mapped[float] = mapped_column(Float, default=0.0)
+    meals_count: Mapped[int] = mapped_column(Integer, default=0)
+    water_glasses: Mapped[int] = mapped_column(Integer, default=0)
+    workouts_count: Mapped[int] = mapped_column(Integer, default=0)
+    workout_minutes: Mapped[int] = mapped_column(Integer, default=0)
+
+    def __repr__(self) -> str:
+        return f"<DailyRollup {self.user_id} {self.day}>"
+
+
+class UserStreak(Base):
+    """
+    Current and longest run of consecutive periods meeting one goal.
+    
+    Periods are days, or weeks (keyed by their Monday) for workout frequency.
+    """
+    __tablename__ = "user_streaks"
+    __table_args__ = (
+        UniqueConstraint("user_id", "goal"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    goal: Mapped[str] = mapped_column(String(20))
+    
+    current_start: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    current_end: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    longest: Mapped[int] = mapped_column(Integer, default=0)
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserStreak {self.user_id} {self.goal}>"
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Float, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RateLimitBucket(Base):
+    """
+    Token bucket state shared by all API workers (``RATE_LIMIT_BACKEND=postgres``).
+
+    The migration creates it UNLOGGED: losing the buckets on a crash only
+    resets the limits.
+    """
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(String(200), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float)
+    allowed: Mapped[bool] = mapped_column(Boolean, default=True)  # outcome of the last take
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket {self.key}: {self.tokens:.1f}>"
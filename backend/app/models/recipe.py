@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Optional, List
+
+from sqlalchemy import ForeignKey, String, DateTime, Integer, Float, Text, Enum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+from app.models.nutrition import MealType
+from app.models.shopping import ShoppingCategory
+
+
+class Recipe(Base):
+    """
+    A reusable composite meal.
+    
+    Macro totals cover the whole recipe (all servings) and are kept in sync
+    with the ingredients on every write, so logging never has to sum them.
+    """
+    __tablename__ = "recipes"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    
+    name: Mapped[str] = mapped_column(String(255))
+    meal_type: Mapped[Optional[MealType]] = mapped_column(Enum(MealType), nullable=True)
+    servings: Mapped[float] = mapped_column(Float, default=1.0)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    
+    # Precomputed totals
+    calories: Mapped[int] = mapped_column(Integer, default=0)
+    protein: Mapped[float] = mapped_column(Float, default=0.0)
+    carbs: Mapped[float] = mapped_column(Float, default=0.0)
+    fat: Mapped[float] = mapped_column(Float, default=0.0)
+    fiber: Mapped[float] = mapped_column(Float, default=0.0)
+    
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    # Relationships
+    ingredients: Mapped[List["RecipeIngredient"]] = relationship(
+        "RecipeIngredient",
+        back_populates="recipe",
+        cascade="all, delete-orphan",
+        order_by="RecipeIngredient.order",
+    )
+
+    def recompute_totals(self) -> None:
+        """Refresh the macro totals from the loaded ingredients."""
+        self.calories = sum(i.calories or 0 for i in self.ingredients)
+        self.protein = sum(i.protein or 0 for i in self.ingredients)
+        self.carbs = sum(i.carbs or 0 for i in self.ingredients)
+        self.fat = sum(i.fat or 0 for i in self.ingredients)
+        self.fiber = sum(i.fiber or 0 for i in self.ingredients)
+
+    def __repr__(self) -> str:
+        return f"<Recipe {self.id}: {self.name}>"
+
+
+class RecipeIngredient(Base):
+    __tablename__ = "recipe_ingredients"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    recipe_id: Mapped[int] = mapped_column(ForeignKey("recipes.id", ondelete="CASCADE"), index=True)
+    
+    name: Mapped[str] = mapped_column(String(255))
+    quantity: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    category: Mapped[ShoppingCategory] = mapped_column(
+        Enum(ShoppingCategory), default=ShoppingCategory.OTHER
+    )
+    
+    # Macros for the amount used in the whole recipe
+    calories: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    protein: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    carbs: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    fiber: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    
+    order: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Relationships
+    recipe: Mapped["Recipe"] = relationship("Recipe", back_populates="ingredients")
+
+    def __repr__(self) -> str:
+        return f"<RecipeIngredient {self.id}: {self.name}>"
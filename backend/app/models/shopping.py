@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, DateTime, Boolean, Text, Enum
+from sqlalchemy import ForeignKey, String, DateTime, Boolean, Text, Enum, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -27,6 +27,15 @@ class ShoppingCategory(str, enum.Enum):
 
 class ShoppingItem(Base):
     __tablename__ = "shopping_items"
+    __table_args__ = (
+        # Serves de-duplication lookups against pending items
+        Index(
+            "ix_shopping_items_pending_name",
+            "user_id",
+            text("lower(name)"),
+            postgresql_where=text("NOT is_purchased"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -52,3 +61,23 @@ class ShoppingItem(Base):
 
     def __repr__(self) -> str:
         return f"<ShoppingItem {self.id}: {self.name}>"
+
+
+class ShoppingCategoryOverride(Base):
+    """Category a user picked by hand for an item name, learned from edits."""
+    __tablename__ = "shopping_category_overrides"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name_key"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    name_key: Mapped[str] = mapped_column(String(255))  # normalize_item_name() of the item
+    category: Mapped[ShoppingCategory] = mapped_column(Enum(ShoppingCategory))
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<ShoppingCategoryOverride {self.name_key}: {self.category}>"
@@ -21,6 +21,7 @@ class WorkoutType(str, enum.Enum):
 
 
 class Workout(Base):
+    # Range-partitioned by month on workout_date in PostgreSQL (migration 008)
     __tablename__ = "workouts"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -56,6 +57,7 @@ class Exercise(Base):
     __tablename__ = "exercises"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # PostgreSQL enforces the cascade with a trigger, as partitioned workouts.id is not unique on its own
     workout_id: Mapped[int] = mapped_column(ForeignKey("workouts.id", ondelete="CASCADE"))
     
     name: Mapped[str] = mapped_column(String(255))
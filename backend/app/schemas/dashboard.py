@@ -0,0 +1,18 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+from app.schemas.nutrition import DailyNutritionSummary
+from app.schemas.shopping import ShoppingListSummary
+from app.schemas.user import UserGoals
+from app.schemas.workout import WorkoutSummary
+
+
+class DashboardResponse(BaseModel):
+    """Everything the Mini App home screen shows."""
+    date: date
+    goals: UserGoals
+    nutrition: DailyNutritionSummary
+    water_glasses: int
+    weekly_workouts: WorkoutSummary
+    shopping: ShoppingListSummary
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class FoodResponse(BaseModel):
+    id: int
+    name: str
+    brand: Optional[str] = None
+    barcode: Optional[str] = None
+    
+    # Per 100 g
+    calories: float
+    protein: Optional[float] = None
+    carbs: Optional[float] = None
+    fat: Optional[float] = None
+    fiber: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+
+class FoodSearchResult(FoodResponse):
+    score: float
@@ -0,0 +1,29 @@
+from typing import List, Optional
+import enum
+
+from pydantic import BaseModel
+
+
+class ImportKind(str, enum.Enum):
+    MEALS = "meals"
+    WORKOUTS = "workouts"
+
+
+class ImportFormat(str, enum.Enum):
+    CSV = "csv"
+    JSON = "json"
+    JSONL = "jsonl"
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    kind: ImportKind
+    total_rows: int = 0
+    imported_rows: int = 0
+    failed_rows: int = 0
+    errors: List[ImportRowError] = []
+    rebuild_job_id: Optional[int] = None  # background rebuild of rollups, streaks and suggestions
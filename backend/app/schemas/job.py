@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class JobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str  # queued, running, succeeded, failed
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    result: Optional[dict] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -46,6 +46,28 @@ class MealResponse(MealBase):
         from_attributes = True
 
 
+class MealRepeat(BaseModel):
+    meal_date: Optional[date] = None
+
+
+class MealSuggestionResponse(BaseModel):
+    id: int
+    name: str
+    meal_type: MealType
+    calories: Optional[int] = None
+    protein: Optional[float] = None
+    carbs: Optional[float] = None
+    fat: Optional[float] = None
+    fiber: Optional[float] = None
+    serving_size: Optional[str] = None
+    use_count: int
+    last_used_at: datetime
+    score: float
+
+    class Config:
+        from_attributes = True
+
+
 class WaterLogBase(BaseModel):
     glasses: int = 1
     log_date: date = date.today()
@@ -87,3 +109,23 @@ class DailyNutritionSummary(BaseModel):
     carbs_progress: float
     fat_progress: float
     water_progress: float
+
+
+class NutritionTrendSeries(BaseModel):
+    metric: str
+    goal: Optional[int] = None
+    # One entry per day from start_date to end_date; None where nothing was logged
+    daily: List[Optional[float]]
+    avg_7: List[Optional[float]]
+    avg_30: List[Optional[float]]
+    delta_7_vs_goal: Optional[List[Optional[float]]] = None
+    mean: Optional[float] = None
+    mean_delta_vs_goal: Optional[float] = None
+    weekday_means: Dict[str, Optional[float]]
+
+
+class NutritionTrends(BaseModel):
+    start_date: date
+    end_date: date
+    logged_days: int
+    series: List[NutritionTrendSeries]
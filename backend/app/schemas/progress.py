@@ -0,0 +1,13 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StreakResponse(BaseModel):
+    goal: str
+    period: str  # "day" or "week"
+    current: int
+    longest: int
+    last_met: Optional[date] = None
+    adherence: float  # share of the last 30 days (or full weeks) meeting the goal
@@ -0,0 +1,78 @@
+from datetime import datetime, date
+from typing import Optional, List
+
+from pydantic import BaseModel, Field
+
+from app.models.nutrition import MealType
+from app.models.shopping import ShoppingCategory
+
+
+class RecipeIngredientBase(BaseModel):
+    name: str
+    quantity: Optional[str] = None
+    category: ShoppingCategory = ShoppingCategory.OTHER
+    calories: Optional[int] = None
+    protein: Optional[float] = None
+    carbs: Optional[float] = None
+    fat: Optional[float] = None
+    fiber: Optional[float] = None
+    order: int = 0
+
+
+class RecipeIngredientCreate(RecipeIngredientBase):
+    pass
+
+
+class RecipeIngredientResponse(RecipeIngredientBase):
+    id: int
+    recipe_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class RecipeBase(BaseModel):
+    name: str
+    meal_type: Optional[MealType] = None
+    servings: float = Field(default=1.0, gt=0)
+    notes: Optional[str] = None
+
+
+class RecipeCreate(RecipeBase):
+    ingredients: List[RecipeIngredientCreate] = []
+
+
+class RecipeUpdate(BaseModel):
+    name: Optional[str] = None
+    meal_type: Optional[MealType] = None
+    servings: Optional[float] = Field(default=None, gt=0)
+    notes: Optional[str] = None
+    # Replaces the whole ingredient list when given
+    ingredients: Optional[List[RecipeIngredientCreate]] = None
+
+
+class RecipeResponse(RecipeBase):
+    id: int
+    user_id: int
+    calories: int
+    protein: float
+    carbs: float
+    fat: float
+    fiber: float
+    ingredients: List[RecipeIngredientResponse] = []
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RecipeLog(BaseModel):
+    servings: float = Field(default=1.0, gt=0)
+    meal_type: Optional[MealType] = None
+    meal_date: date = Field(default_factory=date.today)
+
+
+class RecipeShop(BaseModel):
+    # Restrict to these ingredient ids; all ingredients by default
+    ingredient_ids: Optional[List[int]] = None
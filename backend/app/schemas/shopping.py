@@ -14,7 +14,8 @@ class ShoppingItemBase(BaseModel):
 
 
 class ShoppingItemCreate(ShoppingItemBase):
-    pass
+    # Classified from the name when omitted
+    category: Optional[ShoppingCategory] = None
 
 
 class ShoppingItemUpdate(BaseModel):
@@ -74,8 +74,59 @@ class WorkoutResponse(WorkoutBase):
         from_attributes = True
 
 
+# Workout columns a listing can be narrowed to with ``fields=``
+WORKOUT_LIST_FIELDS = (
+    "name", "workout_type", "duration_minutes", "calories_burned", "notes",
+    "workout_date", "user_id", "created_at", "updated_at",
+)
+WORKOUT_LIST_INCLUDES = ("exercises", "exercise_count")
+
+
+class WorkoutListItem(BaseModel):
+    """A listed workout; only the requested fields and includes are present."""
+    name: Optional[str] = None
+    workout_type: Optional[WorkoutType] = None
+    duration_minutes: Optional[int] = None
+    calories_burned: Optional[int] = None
+    notes: Optional[str] = None
+    workout_date: Optional[date] = None
+    id: int
+    user_id: Optional[int] = None
+    exercises: Optional[List[ExerciseResponse]] = None
+    exercise_count: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class WorkoutSummary(BaseModel):
     total_workouts: int
     total_duration_minutes: int
     total_calories_burned: int
     workouts_by_type: dict[str, int]
+
+
+class ExerciseSessionStats(BaseModel):
+    date: date
+    sets: int
+    volume: float  # sets x reps x weight, kg
+    top_weight: float
+    top_set_reps: int
+    e1rm_epley: Optional[float] = None
+    e1rm_brzycki: Optional[float] = None
+    is_weight_pr: bool
+    is_e1rm_pr: bool
+    is_volume_pr: bool
+
+
+class PersonalRecord(BaseModel):
+    value: float
+    date: date
+
+
+class ExerciseAnalytics(BaseModel):
+    name: str
+    sessions: List[ExerciseSessionStats]
+    personal_records: dict[str, PersonalRecord]
@@ -0,0 +1,250 @@
+"""
+Cold storage for old meals and water logs.
+
+Entries older than ``archive_after_days`` are moved, one user and month
+at a time, into ``history_archives`` as compressed column-wise JSON and
+deleted from the live tables, keeping their indexes (and on PostgreSQL
+the partitions scanned by everyday queries) small. Daily totals already
+live in ``daily_rollups`` and are left alone. Reads whose date range
+reaches archived months merge the archived entries back in.
+"""
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.archive import HistoryArchive
+from app.models.nutrition import Meal, WaterLog
+
+
+@dataclass(frozen=True)
+class ArchiveKind:
+    name: str
+    model: type
+    date_field: str
+    fields: Tuple[str, ...]
+
+
+ARCHIVES: Dict[str, ArchiveKind] = {
+    kind.name: kind
+    for kind in (
+        ArchiveKind(
+            "meals",
+            Meal,
+            "meal_date",
+            (
+                "id", "name", "meal_type", "calories", "protein", "carbs", "fat", "fiber",
+                "serving_size", "notes", "meal_date", "created_at", "updated_at",
+            ),
+        ),
+        ArchiveKind("water_logs", WaterLog, "log_date", ("id", "glasses", "log_date", "created_at")),
+    )
+}
+
+DATE_FIELDS = {"meal_date", "log_date"}
+DATETIME_FIELDS = {"created_at", "updated_at"}
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def archive_cutoff(today: Optional[date] = None) -> date:
+    """
+    Entries dated before this are archived; only whole months move.
+
+    Nothing on or after it is ever archived, so reads of ranges starting
+    there skip the archive (raising ``archive_after_days`` would break
+    that for months already archived).
+    """
+    today = today or date.today()
+    return month_start(today - timedelta(days=settings.archive_after_days))
+
+
+def reaches_archive(start: Optional[date]) -> bool:
+    """Whether a range starting at ``start`` can include archived entries."""
+    return start is None or start < archive_cutoff()
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return value
+
+
+def _from_json(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if field in DATE_FIELDS:
+        return date.fromisoformat(value)
+    if field in DATETIME_FIELDS:
+        return datetime.fromisoformat(value)
+    return value
+
+
+def encode_rows(kind: ArchiveKind, rows: List[Any]) -> bytes:
+    columns = {field: [_to_json(getattr(row, field)) for row in rows] for field in kind.fields}
+    return zlib.compress(json.dumps(columns, separators=(",", ":")).encode(), 9)
+
+
+def decode_rows(kind: ArchiveKind, user_id: int, payload: bytes) -> List[SimpleNamespace]:
+    """Archived entries as attribute objects shaped like the live rows."""
+    columns = json.loads(zlib.decompress(payload))
+    values = [[_from_json(field, value) for value in columns[field]] for field in kind.fields]
+    return [SimpleNamespace(user_id=user_id, **dict(zip(kind.fields, row))) for row in zip(*values)]
+
+
+def _sort_key(kind: ArchiveKind):
+    return lambda row: (getattr(row, kind.date_field), row.created_at, row.id)
+
+
+async def archive_month(db: AsyncSession, kind: ArchiveKind, user_id: int, month: date) -> int:
+    """Move one user's entries for a month into the archive. The caller commits."""
+    date_column = getattr(kind.model, kind.date_field)
+    result = await db.execute(
+        select(kind.model).where(
+            kind.model.user_id == user_id,
+            date_column >= month,
+            date_column < next_month(month),
+        )
+    )
+    live = list(result.scalars())
+    if not live:
+        return 0
+
+    result = await db.execute(
+        select(HistoryArchive).where(
+            HistoryArchive.user_id == user_id,
+            HistoryArchive.kind == kind.name,
+            HistoryArchive.month == month,
+        )
+    )
+    archive = result.scalar_one_or_none()
+
+    # Backdated entries can reach a month that was already archived
+    rows = decode_rows(kind, user_id, archive.payload) if archive else []
+    rows = sorted([*rows, *live], key=_sort_key(kind))
+    payload = encode_rows(kind, rows)
+
+    if archive is None:
+        db.add(HistoryArchive(user_id=user_id, kind=kind.name, month=month, row_count=len(rows), payload=payload))
+    else:
+        archive.row_count = len(rows)
+        archive.payload = payload
+
+    await db.execute(delete(kind.model).where(kind.model.id.in_([row.id for row in live])))
+    return len(live)
+
+
+async def archive_history(db: AsyncSession, cutoff: Optional[date] = None) -> Dict[str, int]:
+    """
+    Archive every user's entries dated before ``cutoff``.
+
+    Commits after each user and month, so a long run holds no big
+    transaction and can be interrupted and resumed.
+    """
+    # Never past the default cutoff, which reads rely on (see archive_cutoff)
+    cutoff = min(cutoff or archive_cutoff(), archive_cutoff())
+    archived = {}
+    for kind in ARCHIVES.values():
+        date_column = getattr(kind.model, kind.date_field)
+        result = await db.execute(
+            select(kind.model.user_id, date_column).where(date_column < cutoff).distinct()
+        )
+        months = sorted({(user_id, month_start(day)) for user_id, day in result})
+
+        archived[kind.name] = 0
+        for user_id, month in months:
+            archived[kind.name] += await archive_month(db, kind, user_id, month)
+            await db.commit()
+    return archived
+
+
+def _month_filters(query, start: Optional[date], end: Optional[date]):
+    if start:
+        query = query.where(HistoryArchive.month >= month_start(start))
+    if end:
+        query = query.where(HistoryArchive.month <= end)
+    return query
+
+
+async def archived_rows(
+    db: AsyncSession,
+    kind_name: str,
+    user_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> List[SimpleNamespace]:
+    """A user's archived entries dated within ``[start, end]`` (either bound optional)."""
+    if not reaches_archive(start):
+        return []
+
+    kind = ARCHIVES[kind_name]
+    query = select(HistoryArchive.payload).where(
+        HistoryArchive.user_id == user_id, HistoryArchive.kind == kind_name
+    )
+    result = await db.execute(_month_filters(query, start, end))
+
+    rows = []
+    for payload in result.scalars():
+        for row in decode_rows(kind, user_id, payload):
+            day = getattr(row, kind.date_field)
+            if (start is None or day >= start) and (end is None or day <= end):
+                rows.append(row)
+    return rows
+
+
+async def list_with_archive(
+    db: AsyncSession,
+    kind_name: str,
+    user_id: int,
+    query: Select,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Any]:
+    """
+    Run a newest-first live ``query`` and merge in archived entries in range.
+
+    ``query`` must already filter by user and by ``[start, end]``; paging
+    is applied here. The archive is skipped for ranges starting after the
+    cutoff, and payloads are only read when archived months fall in range
+    and could land on the requested page.
+    """
+    kind = ARCHIVES[kind_name]
+    months = []
+    if reaches_archive(start):
+        months_query = select(HistoryArchive.month).where(
+            HistoryArchive.user_id == user_id, HistoryArchive.kind == kind_name
+        )
+        months = list((await db.execute(_month_filters(months_query, start, end))).scalars())
+
+    if not months:
+        if limit is not None:
+            query = query.limit(limit).offset(offset)
+        return list((await db.execute(query)).scalars())
+
+    if limit is not None:
+        query = query.limit(offset + limit)
+    live = list((await db.execute(query)).scalars())
+
+    # A full page of live rows newer than every archived month can't be displaced
+    if limit is not None and len(live) == offset + limit:
+        if getattr(live[-1], kind.date_field) >= next_month(max(months)):
+            return live[offset:]
+
+    rows = sorted([*live, *await archived_rows(db, kind_name, user_id, start, end)], key=_sort_key(kind), reverse=True)
+    return rows[offset:offset + limit] if limit is not None else rows[offset:]
@@ -0,0 +1,73 @@
+from typing import List, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.nutrition import Meal
+from app.models.workout import Workout, Exercise
+from app.schemas.nutrition import MealCreate
+from app.schemas.workout import WorkoutCreate
+
+
+async def insert_meals(
+    db: AsyncSession,
+    user_id: int,
+    meals: Sequence[MealCreate],
+    returning: bool = True,
+) -> List[int]:
+    """
+    Insert meals with multi-row INSERT statements.
+    
+    Returns the new meal ids in the same order as the input, or an empty
+    list when ``returning`` is off and the caller does not need them.
+    """
+    if not meals:
+        return []
+
+    rows = [{"user_id": user_id, **meal_data.model_dump()} for meal_data in meals]
+    if not returning:
+        await db.execute(insert(Meal), rows)
+        return []
+
+    result = await db.execute(
+        insert(Meal).returning(Meal.id, sort_by_parameter_order=True),
+        rows,
+    )
+    return list(result.scalars())
+
+
+async def insert_workouts(
+    db: AsyncSession,
+    user_id: int,
+    workouts: Sequence[WorkoutCreate],
+) -> List[int]:
+    """
+    Insert workouts and their nested exercises with two multi-row INSERTs.
+    
+    Returns the new workout ids in the same order as the input.
+    """
+    if not workouts:
+        return []
+
+    result = await db.execute(
+        insert(Workout).returning(Workout.id, sort_by_parameter_order=True),
+        [
+            {"user_id": user_id, **workout_data.model_dump(exclude={"exercises"})}
+            for workout_data in workouts
+        ],
+    )
+    workout_ids = list(result.scalars())
+
+    exercise_rows = [
+        {
+            "workout_id": workout_id,
+            **exercise_data.model_dump(exclude={"order"}),
+            "order": exercise_data.order or i,
+        }
+        for workout_id, workout_data in zip(workout_ids, workouts)
+        for i, exercise_data in enumerate(workout_data.exercises)
+    ]
+    if exercise_rows:
+        await db.execute(insert(Exercise), exercise_rows)
+
+    return workout_ids
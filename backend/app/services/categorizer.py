@@ -0,0 +1,186 @@
+"""
+Shopping category classification.
+
+Item names are scanned with an Aho-Corasick automaton compiled once from
+a keyword dictionary, so classifying a name is a single pass over its
+characters. Per-user overrides, learned whenever a user recategorizes an
+item by hand, take precedence over the dictionary.
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.shopping import ShoppingCategory, ShoppingCategoryOverride
+
+KEYWORDS: Dict[ShoppingCategory, Tuple[str, ...]] = {
+    ShoppingCategory.PRODUCE: (
+        "apple", "avocado", "banana", "basil", "bean sprout", "beet", "bell pepper", "berry",
+        "blueberry", "broccoli", "cabbage", "carrot", "cauliflower", "celery", "cherry",
+        "cilantro", "cucumber", "eggplant", "garlic", "ginger", "grape", "kale", "kiwi",
+        "leek", "lemon", "lettuce", "lime", "mango", "melon", "mushroom", "onion", "orange",
+        "parsley", "peach", "pear", "pepper", "pineapple", "plum", "potato", "pumpkin",
+        "radish", "raspberry", "salad", "spinach", "strawberry", "sweet potato", "tomato",
+        "watermelon", "zucchini", "fruit", "vegetable", "veggie", "herb", "arugula",
+    ),
+    ShoppingCategory.DAIRY: (
+        "milk", "cheese", "butter", "yogurt", "yoghurt", "cream", "sour cream", "kefir",
+        "cottage cheese", "mozzarella", "parmesan", "cheddar", "feta", "ricotta", "egg",
+        "skyr", "ghee", "quark",
+    ),
+    ShoppingCategory.MEAT: (
+        "beef", "chicken", "pork", "lamb", "turkey", "bacon", "ham", "sausage", "steak",
+        "mince", "ground beef", "veal", "duck", "salami", "chorizo", "meat", "brisket",
+    ),
+    ShoppingCategory.SEAFOOD: (
+        "fish", "salmon", "tuna", "cod", "shrimp", "prawn", "crab", "lobster", "mussel",
+        "oyster", "sardine", "mackerel", "trout", "tilapia", "squid", "scallop", "seafood",
+    ),
+    ShoppingCategory.BAKERY: (
+        "bread", "bagel", "baguette", "bun", "croissant", "muffin", "roll", "tortilla",
+        "pita", "cake", "pastry", "sourdough", "brioche", "donut",
+    ),
+    ShoppingCategory.FROZEN: (
+        "frozen", "ice cream", "ice", "popsicle", "frozen pizza", "sorbet",
+    ),
+    ShoppingCategory.PANTRY: (
+        "rice", "pasta", "spaghetti", "noodle", "flour", "sugar", "salt", "oil", "olive oil",
+        "vinegar", "oat", "oatmeal", "cereal", "granola", "lentil", "chickpea", "bean",
+        "quinoa", "honey", "jam", "peanut butter", "sauce", "ketchup", "mustard", "mayo",
+        "mayonnaise", "spice", "cinnamon", "stock", "broth", "canned", "tomato paste",
+        "coconut milk", "soy sauce", "yeast", "baking powder",
+    ),
+    ShoppingCategory.BEVERAGES: (
+        "water", "sparkling water", "juice", "coffee", "tea", "soda", "cola", "beer", "wine",
+        "kombucha", "lemonade", "energy drink", "almond milk", "oat milk", "soy milk",
+    ),
+    ShoppingCategory.SNACKS: (
+        "chips", "crisps", "cracker", "cookie", "chocolate", "candy", "popcorn", "pretzel",
+        "nut", "almond", "cashew", "walnut", "peanut", "trail mix", "protein bar", "bar",
+        "biscuit", "snack",
+    ),
+    ShoppingCategory.SUPPLEMENTS: (
+        "protein powder", "whey", "creatine", "vitamin", "multivitamin", "omega", "fish oil",
+        "bcaa", "collagen", "electrolyte", "magnesium", "zinc", "supplement", "pre workout",
+        "casein",
+    ),
+}
+
+
+def _plural_forms(word: str) -> Tuple[str, ...]:
+    if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        return (word, word[:-1] + "ies")
+    if word.endswith(("s", "x", "ch", "sh", "o")):
+        return (word, word + "es")
+    return (word, word + "s")
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over keywords, matching whole words only.
+
+    Longer matches win, so "peanut butter" beats "butter" and "ice cream"
+    beats "cream".
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, ShoppingCategory]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, ShoppingCategory]]] = [[]]
+
+        for keyword, category in keywords:
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(keyword), category))
+
+        # Breadth-first failure links, merging outputs of the fallback states
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def classify(self, text: str) -> Optional[ShoppingCategory]:
+        text = text.lower()
+        best: Optional[Tuple[int, ShoppingCategory]] = None
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for length, category in self._output[state]:
+                start = end - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text) and text[end + 1].isalnum():
+                    continue
+                if best is None or length > best[0]:
+                    best = (length, category)
+
+        return best[1] if best else None
+
+
+_automaton: Optional[KeywordAutomaton] = None
+
+
+def get_automaton() -> KeywordAutomaton:
+    global _automaton
+    if _automaton is None:
+        _automaton = KeywordAutomaton(
+            (form, category)
+            for category, keywords in KEYWORDS.items()
+            for keyword in keywords
+            for form in _plural_forms(keyword)
+        )
+    return _automaton
+
+
+def classify_item(name: str) -> ShoppingCategory:
+    """Category for an item name from the keyword dictionary alone."""
+    return get_automaton().classify(name) or ShoppingCategory.OTHER
+
+
+async def load_overrides(db: AsyncSession, user_id: int, name_keys: Iterable[str]) -> Dict[str, ShoppingCategory]:
+    name_keys = set(name_keys)
+    if not name_keys:
+        return {}
+
+    result = await db.execute(
+        select(ShoppingCategoryOverride.name_key, ShoppingCategoryOverride.category).where(
+            ShoppingCategoryOverride.user_id == user_id,
+            ShoppingCategoryOverride.name_key.in_(name_keys),
+        )
+    )
+    return dict(result.all())
+
+
+async def remember_category(db: AsyncSession, user_id: int, name_key: str, category: ShoppingCategory) -> None:
+    """Record a manual recategorization so future items with this name follow it."""
+    result = await db.execute(
+        select(ShoppingCategoryOverride).where(
+            ShoppingCategoryOverride.user_id == user_id,
+            ShoppingCategoryOverride.name_key == name_key,
+        )
+    )
+    override = result.scalar_one_or_none()
+
+    if override is None:
+        db.add(ShoppingCategoryOverride(user_id=user_id, name_key=name_key, category=category))
+    else:
+        override.category = category
@@ -0,0 +1,208 @@
+"""
+Per-exercise strength progress.
+
+A user's history of one exercise is fetched as columns (date, sets, reps,
+weight) and reduced per session with NumPy: total volume, top set,
+estimated one-rep max (Epley and Brzycki) and personal records. Results
+are cached per user and exercise (see ``exercise_cache``); appending a
+set to the latest session updates the cached series in place instead of
+refetching the history.
+"""
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.workout import Exercise, Workout
+from app.services.exercise_cache import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS, CacheEntry, cache, exercise_key
+
+# Brzycki's formula diverges as reps approach 37
+BRZYCKI_MAX_REPS = 36
+
+
+def epley(weight: np.ndarray, reps: np.ndarray) -> np.ndarray:
+    return np.where(reps == 1, weight, weight * (1 + reps / 30))
+
+
+def brzycki(weight: np.ndarray, reps: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimate = weight * 36 / (37 - reps)
+    return np.where(reps <= BRZYCKI_MAX_REPS, estimate, np.nan)
+
+
+@dataclass
+class ExerciseHistory:
+    """Raw columns for one exercise, one entry per logged exercise row."""
+    days: np.ndarray  # datetime64[D], sorted
+    sets: np.ndarray
+    reps: np.ndarray
+    weight: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "ExerciseHistory":
+        return cls(
+            days=np.array([], dtype="datetime64[D]"),
+            sets=np.array([], dtype=np.int64),
+            reps=np.array([], dtype=np.int64),
+            weight=np.array([], dtype=np.float64),
+        )
+
+    def last_day(self) -> Optional[date]:
+        return self.days[-1].item() if len(self.days) else None
+
+    def append(self, day: date, sets: int, reps: int, weight: float) -> None:
+        self.days = np.append(self.days, np.datetime64(day, "D"))
+        self.sets = np.append(self.sets, sets)
+        self.reps = np.append(self.reps, reps)
+        self.weight = np.append(self.weight, weight)
+
+
+@dataclass
+class ExerciseSeries:
+    """Per-session aggregates, one entry per training day."""
+    days: np.ndarray
+    sets: np.ndarray
+    volume: np.ndarray
+    top_weight: np.ndarray
+    top_set_reps: np.ndarray
+    e1rm_epley: np.ndarray
+    e1rm_brzycki: np.ndarray
+    weight_pr: np.ndarray  # bool
+    e1rm_pr: np.ndarray  # bool
+    volume_pr: np.ndarray  # bool
+
+
+def _new_highs(values: np.ndarray) -> np.ndarray:
+    """True where a value beats every earlier one (the first session counts)."""
+    if not len(values):
+        return np.zeros(0, dtype=bool)
+    previous_best = np.concatenate(([-np.inf], np.fmax.accumulate(values)[:-1]))
+    return values > previous_best
+
+
+def compute_series(history: ExerciseHistory) -> ExerciseSeries:
+    days, first = np.unique(history.days, return_index=True)
+    if not len(days):
+        empty_float = np.array([], dtype=np.float64)
+        empty_bool = np.zeros(0, dtype=bool)
+        return ExerciseSeries(
+            days, np.array([], dtype=np.int64), empty_float, empty_float, np.array([], dtype=np.int64),
+            empty_float, empty_float, empty_bool, empty_bool, empty_bool,
+        )
+
+    epley_per_row = epley(history.weight, history.reps)
+    brzycki_per_row = brzycki(history.weight, history.reps)
+
+    # Top set of a session: heaviest weight, ties broken by reps
+    order = np.lexsort((history.reps, history.weight, history.days))
+    last = np.r_[first[1:], len(history.days)] - 1
+    top_rows = order[last]
+
+    volume = np.add.reduceat(history.sets * history.reps * history.weight, first)
+    e1rm_epley = np.maximum.reduceat(epley_per_row, first)
+    e1rm_brzycki = np.fmax.reduceat(brzycki_per_row, first)
+
+    return ExerciseSeries(
+        days=days,
+        sets=np.add.reduceat(history.sets, first),
+        volume=volume,
+        top_weight=history.weight[top_rows],
+        top_set_reps=history.reps[top_rows],
+        e1rm_epley=e1rm_epley,
+        e1rm_brzycki=e1rm_brzycki,
+        weight_pr=_new_highs(history.weight[top_rows]),
+        e1rm_pr=_new_highs(e1rm_epley),
+        volume_pr=_new_highs(volume),
+    )
+
+
+def _name_pattern(key: str) -> str:
+    """LIKE pattern matching every name with this key (and a few more)."""
+    words = [word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") for word in key.split(" ")]
+    return "%" + "%".join(words) + "%"
+
+
+async def fetch_history(db: AsyncSession, user_id: int, name: str) -> ExerciseHistory:
+    """Load one exercise's weighted sets for a user as columns."""
+    key = exercise_key(name)
+    # SQL can't collapse whitespace portably: narrow down with LIKE, then
+    # compare keys here so "Bench  press" and "bench press" match
+    result = await db.execute(
+        select(Exercise.name, Workout.workout_date, Exercise.sets, Exercise.reps, Exercise.weight)
+        .join(Exercise.workout)
+        .where(
+            Workout.user_id == user_id,
+            func.lower(Exercise.name).like(_name_pattern(key), escape="\\"),
+            Exercise.reps > 0,
+            Exercise.weight.is_not(None),
+        )
+        .order_by(Workout.workout_date, Exercise.id)
+    )
+    rows = [row[1:] for row in result.all() if exercise_key(row.name) == key]
+    if not rows:
+        return ExerciseHistory.empty()
+
+    days, sets, reps, weight = zip(*rows)
+    return ExerciseHistory(
+        days=np.array(days, dtype="datetime64[D]"),
+        sets=np.array([s or 1 for s in sets], dtype=np.int64),
+        reps=np.array(reps, dtype=np.int64),
+        weight=np.array(weight, dtype=np.float64),
+    )
+
+
+async def get_exercise_series(db: AsyncSession, user_id: int, name: str) -> ExerciseSeries:
+    key = (user_id, exercise_key(name))
+    entry = cache.get(key)
+    if entry is None or time.monotonic() - entry.loaded_at > CACHE_TTL_SECONDS:
+        if len(cache) >= CACHE_MAX_ENTRIES:
+            # Evict the oldest insertion
+            del cache[next(iter(cache))]
+        entry = cache[key] = CacheEntry(
+            history=await fetch_history(db, user_id, name),
+            series=None,
+            loaded_at=time.monotonic(),
+        )
+    if entry.series is None:
+        entry.series = compute_series(entry.history)
+    return entry.series
+
+
+def series_points(series: ExerciseSeries) -> List[dict]:
+    """Per-session dicts for the API response."""
+    def number(value: float) -> Optional[float]:
+        return None if np.isnan(value) else round(float(value), 2)
+
+    return [
+        {
+            "date": series.days[i].item(),
+            "sets": int(series.sets[i]),
+            "volume": round(float(series.volume[i]), 2),
+            "top_weight": float(series.top_weight[i]),
+            "top_set_reps": int(series.top_set_reps[i]),
+            "e1rm_epley": number(series.e1rm_epley[i]),
+            "e1rm_brzycki": number(series.e1rm_brzycki[i]),
+            "is_weight_pr": bool(series.weight_pr[i]),
+            "is_e1rm_pr": bool(series.e1rm_pr[i]),
+            "is_volume_pr": bool(series.volume_pr[i]),
+        }
+        for i in range(len(series.days))
+    ]
+
+
+def personal_records(series: ExerciseSeries) -> Dict[str, dict]:
+    records = {}
+    for record, values in (
+        ("top_weight", series.top_weight),
+        ("e1rm", series.e1rm_epley),
+        ("volume", series.volume),
+    ):
+        if len(values):
+            # Earliest session that reached the best value
+            best = int(np.argmax(values))
+            records[record] = {"value": round(float(values[best]), 2), "date": series.days[best].item()}
+    return records
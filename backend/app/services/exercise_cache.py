@@ -0,0 +1,64 @@
+"""
+Cache of per-exercise histories for the strength analytics.
+
+Kept apart from the NumPy code in ``exercise_analytics`` so that write
+paths can keep the cache current without importing NumPy; nothing is
+cached until analytics are first requested.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+from app.models.workout import Exercise
+
+if TYPE_CHECKING:
+    from app.services.exercise_analytics import ExerciseHistory, ExerciseSeries
+
+# Other workers don't see our invalidations, so entries also expire
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+
+
+def exercise_key(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+@dataclass
+class CacheEntry:
+    history: "ExerciseHistory"
+    series: Optional["ExerciseSeries"]
+    loaded_at: float
+
+
+cache: Dict[Tuple[int, str], CacheEntry] = {}
+
+
+def invalidate_exercise_analytics(user_id: int, name: Optional[str] = None) -> None:
+    """Drop cached series for one exercise, or for all of a user's exercises."""
+    if name is not None:
+        cache.pop((user_id, exercise_key(name)), None)
+        return
+    for key in [key for key in cache if key[0] == user_id]:
+        del cache[key]
+
+
+def record_exercise_set(user_id: int, workout_date: date, exercise: Exercise) -> None:
+    """
+    Fold a newly added exercise into the cached series.
+
+    Only appends at the end of the history are applied in place; a
+    backdated session drops the entry so it is refetched.
+    """
+    entry = cache.get((user_id, exercise_key(exercise.name)))
+    if entry is None:
+        return
+    if not exercise.reps or exercise.weight is None:
+        return
+
+    last_day = entry.history.last_day()
+    if last_day is not None and workout_date < last_day:
+        invalidate_exercise_analytics(user_id, exercise.name)
+        return
+
+    entry.history.append(workout_date, exercise.sets or 1, exercise.reps, exercise.weight)
+    entry.series = None
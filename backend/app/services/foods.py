@@ -0,0 +1,201 @@
+"""
+Food catalog search and bulk loading.
+
+On Postgres, search runs on the pg_trgm index of ``foods.name``. Other
+dialects (SQLite in tests and local tooling) fall back to an in-memory
+prefix trie over name tokens, built on first use and rebuilt when the
+catalog's row count or newest id changes (e.g. after ``scripts.load_foods``).
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import case, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.food import Food
+
+_TOKEN = re.compile(r"\w+")
+
+# Shortest query the trigram index can serve
+MIN_QUERY_LENGTH = 3
+
+# Candidates pulled from the trie before ranking
+TRIE_CANDIDATES = 500
+
+# Column names used by Open Food Facts CSV/TSV exports
+OPEN_FOOD_FACTS_COLUMNS = {
+    "product_name": "name",
+    "brands": "brand",
+    "code": "barcode",
+    "energy-kcal_100g": "calories",
+    "proteins_100g": "protein",
+    "carbohydrates_100g": "carbs",
+    "fat_100g": "fat",
+    "fiber_100g": "fiber",
+}
+NUMERIC_FIELDS = ("calories", "protein", "carbs", "fat", "fiber")
+CATALOG_FIELDS = ("name", "brand", "barcode") + NUMERIC_FIELDS
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, "_TrieNode"] = field(default_factory=dict)
+    food_ids: List[int] = field(default_factory=list)
+
+
+class FoodPrefixIndex:
+    """Prefix trie over lowercase name tokens, mapping to food ids."""
+
+    def __init__(self, version: Tuple[int, Optional[int]] = (0, None)):
+        self._root = _TrieNode()
+        self._names: Dict[int, str] = {}
+        # (count, max id) of the catalog it was built from
+        self.version = version
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, food_id: int, name: str) -> None:
+        self._names[food_id] = name
+        for token in set(tokenize(name)):
+            node = self._root
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+            node.food_ids.append(food_id)
+
+    def _prefix_ids(self, prefix: str, limit: int) -> List[int]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        # Breadth-first so exact and short completions come first
+        found: List[int] = []
+        level = [node]
+        while level and len(found) < limit:
+            next_level = []
+            for current in level:
+                found.extend(current.food_ids)
+                next_level.extend(current.children.values())
+            level = next_level
+        return found[:limit]
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """Return ``(food_id, score)`` pairs, best first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        matches: Dict[int, int] = {}
+        for token in tokens:
+            for food_id in set(self._prefix_ids(token, TRIE_CANDIDATES)):
+                matches[food_id] = matches.get(food_id, 0) + 1
+
+        query_lower = query.strip().lower()
+
+        def rank(item: Tuple[int, int]) -> Tuple[int, bool, int]:
+            food_id, matched = item
+            name = self._names[food_id].lower()
+            return (-matched, not name.startswith(query_lower), len(name))
+
+        ranked = sorted(matches.items(), key=rank)[:limit]
+        return [(food_id, matched / len(tokens)) for food_id, matched in ranked]
+
+
+_prefix_index: Optional[FoodPrefixIndex] = None
+
+
+async def get_prefix_index(db: AsyncSession) -> FoodPrefixIndex:
+    """The process's index, rebuilt when the catalog has changed since it was built."""
+    global _prefix_index
+    result = await db.execute(select(func.count(), func.max(Food.id)).select_from(Food))
+    version = tuple(result.one())
+    if _prefix_index is None or _prefix_index.version != version:
+        index = FoodPrefixIndex(version)
+        result = await db.execute(select(Food.id, Food.name))
+        for food_id, name in result:
+            index.add(food_id, name)
+        _prefix_index = index
+    return _prefix_index
+
+
+async def search_foods(db: AsyncSession, query: str, limit: int = 20) -> List[Tuple[Food, float]]:
+    """
+    Rank catalog foods matching a (partial, possibly misspelled) name.
+    
+    Queries shorter than three characters return nothing: pg_trgm can't
+    build index conditions from them and would scan the whole catalog.
+    """
+    query = query.strip()
+    if len(query) < MIN_QUERY_LENGTH:
+        return []
+
+    if db.bind.dialect.name != "postgresql":
+        index = await get_prefix_index(db)
+        ranked = index.search(query, limit)
+        if not ranked:
+            return []
+        result = await db.execute(select(Food).where(Food.id.in_([food_id for food_id, _ in ranked])))
+        foods_by_id = {food.id: food for food in result.scalars()}
+        return [(foods_by_id[food_id], score) for food_id, score in ranked if food_id in foods_by_id]
+
+    # Both predicates are served by the trigram index
+    prefix = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    score = func.similarity(Food.name, query)
+    result = await db.execute(
+        select(Food, score)
+        .where(or_(Food.name.op("%")(query), Food.name.ilike(prefix)))
+        .order_by(
+            case((Food.name.ilike(prefix), 0), else_=1),
+            score.desc(),
+            func.length(Food.name),
+        )
+        .limit(limit)
+    )
+    return [(food, float(food_score)) for food, food_score in result]
+
+
+def food_rows(records: Iterable[dict], source: Optional[str] = None) -> Iterator[dict]:
+    """
+    Map raw catalog records to ``foods`` rows.
+
+    Accepts our own column names or Open Food Facts export columns; rows
+    without a name or calories are skipped.
+    """
+    for record in records:
+        row = {}
+        for key, value in record.items():
+            column = OPEN_FOOD_FACTS_COLUMNS.get(key, key)
+            if column in CATALOG_FIELDS and value not in (None, ""):
+                row[column] = value
+
+        name = str(row.get("name", "")).strip()
+        if not name:
+            continue
+
+        try:
+            numbers = {key: float(row[key]) if key in row else None for key in NUMERIC_FIELDS}
+        except (TypeError, ValueError):
+            continue
+        if numbers["calories"] is None:
+            continue
+
+        yield {
+            "name": name[:255],
+            "brand": str(row["brand"])[:255] if "brand" in row else None,
+            "barcode": str(row["barcode"])[:64] if "barcode" in row else None,
+            **numbers,
+            "source": source,
+        }
+
+
+async def insert_foods(db: AsyncSession, rows: List[dict]) -> None:
+    """Insert a chunk of catalog rows with a multi-row INSERT."""
+    if rows:
+        await db.execute(insert(Food), rows)
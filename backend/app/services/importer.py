@@ -0,0 +1,151 @@
+import csv
+import io
+import json
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.importer import ImportFormat, ImportKind, ImportReport, ImportRowError
+from app.schemas.nutrition import MealCreate
+from app.schemas.workout import WorkoutCreate
+from app.services.bulk import insert_meals, insert_workouts
+from app.services.exercise_cache import invalidate_exercise_analytics
+from app.services.jobs import enqueue_progress_rebuild
+
+# Rows are validated and written in chunks so memory stays flat for large files
+CHUNK_SIZE = 1000
+
+# Keep the report small even when a whole file is malformed
+MAX_REPORTED_ERRORS = 100
+
+SCHEMAS = {
+    ImportKind.MEALS: MealCreate,
+    ImportKind.WORKOUTS: WorkoutCreate,
+}
+
+
+def detect_format(filename: Optional[str]) -> Optional[ImportFormat]:
+    """Guess the import format from a file name extension."""
+    if not filename or "." not in filename:
+        return None
+
+    extension = filename.rsplit(".", 1)[1].lower()
+    if extension == "ndjson":
+        extension = "jsonl"
+
+    try:
+        return ImportFormat(extension)
+    except ValueError:
+        return None
+
+
+def read_records(stream: BinaryIO, import_format: ImportFormat) -> Iterator[Union[dict, str]]:
+    """
+    Lazily read raw records from a binary stream.
+
+    CSV and JSON Lines are streamed row by row; a JSON document must hold
+    a top-level array and is parsed in one go. JSON Lines rows are yielded
+    as strings so malformed lines are reported per row.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    if import_format == ImportFormat.CSV:
+        for row in csv.DictReader(text):
+            # Empty cells mean "not set", not empty strings
+            yield {key: value for key, value in row.items() if key and value not in (None, "")}
+
+    elif import_format == ImportFormat.JSONL:
+        for line in text:
+            if line.strip():
+                yield line
+
+    else:
+        document = json.load(text)
+        if not isinstance(document, list):
+            raise ValueError("JSON import must contain a top-level array")
+        yield from document
+
+
+def parse_record(kind: ImportKind, raw: Union[dict, str, Any]) -> BaseModel:
+    """Validate one raw record into the create schema for the import kind."""
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    if not isinstance(raw, dict):
+        raise ValueError("Row must be an object")
+
+    # CSV cells can carry nested exercises as a JSON array
+    exercises = raw.get("exercises")
+    if kind == ImportKind.WORKOUTS and isinstance(exercises, str):
+        raw = {**raw, "exercises": json.loads(exercises)}
+
+    return SCHEMAS[kind].model_validate(raw)
+
+
+def describe_error(exc: Exception) -> str:
+    """Render a validation or parsing error as a single line."""
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in exc.errors()
+        )
+    return str(exc)
+
+
+async def write_chunk(
+    db: AsyncSession,
+    user_id: int,
+    kind: ImportKind,
+    chunk: List[BaseModel],
+) -> None:
+    """Write a chunk of validated rows with multi-row inserts."""
+    if kind == ImportKind.MEALS:
+        await insert_meals(db, user_id, chunk, returning=False)
+    else:
+        await insert_workouts(db, user_id, chunk)
+
+
+async def import_records(
+    db: AsyncSession,
+    user_id: int,
+    kind: ImportKind,
+    records: Iterable[Union[dict, str]],
+) -> ImportReport:
+    """
+    Validate and insert records for a user in chunks.
+
+    Invalid rows are skipped and reported with their 1-based row number;
+    valid rows are committed in a single transaction at the end.
+    """
+    report = ImportReport(kind=kind)
+    chunk: List[BaseModel] = []
+
+    for row_number, raw in enumerate(records, start=1):
+        report.total_rows += 1
+        try:
+            chunk.append(parse_record(kind, raw))
+        except ValueError as exc:
+            report.failed_rows += 1
+            if len(report.errors) < MAX_REPORTED_ERRORS:
+                report.errors.append(ImportRowError(row=row_number, error=describe_error(exc)))
+            continue
+
+        if len(chunk) >= CHUNK_SIZE:
+            await write_chunk(db, user_id, kind, chunk)
+            report.imported_rows += len(chunk)
+            chunk = []
+
+    if chunk:
+        await write_chunk(db, user_id, kind, chunk)
+        report.imported_rows += len(chunk)
+
+    # Derived data is rebuilt once, in the background, rather than updated row by row
+    if report.imported_rows:
+        job = await enqueue_progress_rebuild(db, user_id, meal_suggestions=kind == ImportKind.MEALS)
+        report.rebuild_job_id = job.id
+
+    await db.commit()
+    if kind == ImportKind.WORKOUTS and report.imported_rows:
+        invalidate_exercise_analytics(user_id)
+
+    return report
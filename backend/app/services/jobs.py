@@ -0,0 +1,68 @@
+"""
+Background job handlers.
+
+Importing this module registers the handlers with the job queue. The
+API imports it through the routes that enqueue jobs; ``scripts.worker``
+imports it directly.
+"""
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.jobs import enqueue, job_handler
+from app.models.job import Job
+from app.models.user import User
+from app.services.archive import archive_history
+from app.services.exercise_cache import invalidate_exercise_analytics
+from app.services.meal_suggestions import rebuild_meal_suggestions
+from app.services.rollups import rebuild_rollups
+
+
+@job_handler("rebuild_progress", concurrency=2)
+async def rebuild_progress(db: AsyncSession, job: Job) -> Optional[dict]:
+    """Recompute a user's rollups and streaks (and optionally meal suggestions)."""
+    if db.bind.dialect.name == "postgresql":
+        # One rebuild per user at a time; a second one waits and then starts from the first one's result
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"rebuild_progress:{job.user_id}"))))
+
+    user = await db.get(User, job.user_id)
+    if user is None:
+        return None
+    if job.payload.get("meal_suggestions"):
+        await rebuild_meal_suggestions(db, user.id)
+    await rebuild_rollups(db, user)
+    # Imported workouts change exercise histories too (when run in the API process)
+    invalidate_exercise_analytics(user.id)
+    return {"user_id": user.id}
+
+
+@job_handler("archive_history", concurrency=1, max_attempts=3, timeout_seconds=3600)
+async def archive_old_history(db: AsyncSession, job: Job) -> Optional[dict]:
+    cutoff = job.payload.get("cutoff")
+    return await archive_history(db, date.fromisoformat(cutoff) if cutoff else None)
+
+
+async def enqueue_progress_rebuild(db: AsyncSession, user_id: int, meal_suggestions: bool = False) -> Job:
+    """Queue a rebuild, or fold this request into the user's rebuild that hasn't started yet."""
+    result = await db.execute(
+        select(Job)
+        # Not one waiting to retry, which could be a backoff away
+        .where(
+            Job.job_type == "rebuild_progress",
+            Job.user_id == user_id,
+            Job.status == "queued",
+            Job.attempts == 0,
+        )
+        .order_by(Job.run_at)
+        .limit(1)
+        .with_for_update()
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        return await enqueue(db, "rebuild_progress", {"meal_suggestions": meal_suggestions}, user_id=user_id)
+
+    if meal_suggestions and not job.payload.get("meal_suggestions"):
+        job.payload = {**job.payload, "meal_suggestions": True}
+    return job
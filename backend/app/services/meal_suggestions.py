@@ -0,0 +1,216 @@
+"""
+Recent and frequent meals for one-tap re-logging.
+
+Every logged meal bumps a per-user entry keyed by meal type and a
+name + macros signature. Scores decay exponentially with age, so the
+suggestions follow what a user eats *now*, and a running circular mean
+of the hour of day favours entries usually logged around the current time.
+"""
+import hashlib
+import math
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import upsert_insert
+from app.models.nutrition import Meal, MealSuggestion, MealType
+
+# Score halves every two weeks without use
+HALF_LIFE_SECONDS = 14 * 24 * 3600
+
+# Entries considered when ranking; older ones have decayed to nothing anyway
+RANKING_WINDOW = 200
+
+# Usual hour of each meal, for meals whose logging time says nothing about
+# when they were eaten (imported or backdated)
+DEFAULT_MEAL_HOURS = {
+    MealType.BREAKFAST: 8,
+    MealType.LUNCH: 13,
+    MealType.DINNER: 19,
+    MealType.SNACK: 16,
+}
+
+SUGGESTION_FIELDS = ("name", "calories", "protein", "carbs", "fat", "fiber", "serving_size")
+
+
+def meal_signature(meal) -> str:
+    """Identify a meal by its normalized name and macros."""
+    def number(value) -> str:
+        return "" if value is None else f"{float(value):.1f}"
+
+    key = "|".join([
+        " ".join(meal.name.lower().split()),
+        number(meal.calories),
+        number(meal.protein),
+        number(meal.carbs),
+        number(meal.fat),
+    ])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def decay(score: float, since: datetime, now: datetime) -> float:
+    elapsed = max((now - since).total_seconds(), 0)
+    return score * 0.5 ** (elapsed / HALF_LIFE_SECONDS)
+
+
+def hour_of_day(moment: datetime) -> float:
+    return moment.hour + moment.minute / 60
+
+
+def eaten_at(meal_type: MealType, meal_date: date, created_at: datetime) -> datetime:
+    """When a meal was likely eaten: when it was logged if that was the same day."""
+    if created_at.date() == meal_date:
+        return created_at
+    return datetime.combine(meal_date, time(DEFAULT_MEAL_HOURS[meal_type]))
+
+
+def hour_affinity(mean_hour: float, hour: float) -> float:
+    """1.0 when logged at the same hour, 0.0 twelve hours apart."""
+    distance = abs(mean_hour - hour) % 24
+    return 1 - min(distance, 24 - distance) / 12
+
+
+def mean_hour(mean: float, count: int, hour: float) -> float:
+    """
+    Fold one more hour into a mean of ``count`` hours, as angles on the clock.
+    
+    The previous hours weigh in as ``count`` unit vectors at their mean, so
+    23:30 and 00:30 average to midnight rather than noon.
+    """
+    previous, added = mean / 24 * 2 * math.pi, hour / 24 * 2 * math.pi
+    x = count * math.cos(previous) + math.cos(added)
+    y = count * math.sin(previous) + math.sin(added)
+    if abs(x) < 1e-9 and abs(y) < 1e-9:
+        # Opposite hours with equal weight have no mean direction; keep the latest
+        return hour
+    hour = math.atan2(y, x) / (2 * math.pi) * 24 % 24
+    # -0.0000001 % 24 rounds to 24.0
+    return 0.0 if hour >= 24 else hour
+
+
+def _bump(suggestion: MealSuggestion, used_at: datetime, weight: float = 1.0) -> None:
+    suggestion.score = decay(suggestion.score, suggestion.last_used_at, used_at) + weight
+    suggestion.mean_hour = mean_hour(suggestion.mean_hour, suggestion.use_count, hour_of_day(used_at))
+    suggestion.use_count += 1
+    suggestion.last_used_at = max(suggestion.last_used_at, used_at)
+
+
+async def record_meals(
+    db: AsyncSession,
+    user_id: int,
+    meals: Iterable,
+    used_at: Optional[datetime] = None,
+) -> None:
+    """
+    Update the suggestion index for newly logged meals.
+
+    Accepts ``Meal`` rows or ``MealCreate`` payloads. Existing entries are
+    fetched with one query, so bulk logging stays a constant number of
+    statements.
+    """
+    used_at = used_at or datetime.utcnow()
+    keyed: Dict[Tuple[MealType, str], object] = {}
+    counts: Dict[Tuple[MealType, str], int] = {}
+    for meal in meals:
+        key = (meal.meal_type, meal_signature(meal))
+        keyed[key] = meal
+        counts[key] = counts.get(key, 0) + 1
+
+    if not keyed:
+        return
+
+    # Create missing entries without racing a concurrent log of the same meal.
+    # The no-op update on conflict still locks existing rows until commit, so
+    # concurrent bumps below are serialized instead of overwriting each other.
+    keys = sorted(keyed, key=lambda key: (key[0].value, key[1]))
+    stmt = upsert_insert(db, MealSuggestion).values([
+        {
+            "user_id": user_id,
+            "meal_type": key[0],
+            "signature": key[1],
+            "score": 0.0,
+            "use_count": 0,
+            "mean_hour": hour_of_day(used_at),
+            "last_used_at": used_at,
+            **{field: getattr(keyed[key], field) for field in SUGGESTION_FIELDS},
+        }
+        for key in keys
+    ])
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["user_id", "meal_type", "signature"],
+        set_={"user_id": stmt.excluded.user_id},
+    ))
+
+    result = await db.execute(
+        select(MealSuggestion)
+        .where(
+            MealSuggestion.user_id == user_id,
+            MealSuggestion.signature.in_({signature for _, signature in keyed}),
+        )
+        .execution_options(populate_existing=True)
+    )
+    existing = {(s.meal_type, s.signature): s for s in result.scalars()}
+
+    for key in keys:
+        for _ in range(counts[key]):
+            _bump(existing[key], used_at)
+
+
+async def rebuild_meal_suggestions(db: AsyncSession, user_id: int) -> None:
+    """Recompute a user's suggestion index from their full meal history."""
+    await db.execute(delete(MealSuggestion).where(MealSuggestion.user_id == user_id))
+
+    result = await db.execute(
+        select(Meal.meal_type, Meal.meal_date, Meal.created_at, *(getattr(Meal, f) for f in SUGGESTION_FIELDS))
+        .where(Meal.user_id == user_id)
+        .order_by(Meal.meal_date, Meal.created_at)
+    )
+
+    suggestions: Dict[Tuple[MealType, str], MealSuggestion] = {}
+    for row in result:
+        # Historic meals count from the day they were eaten
+        used_at = eaten_at(row.meal_type, row.meal_date, row.created_at)
+        key = (row.meal_type, meal_signature(row))
+        suggestion = suggestions.get(key)
+        if suggestion is None:
+            suggestion = suggestions[key] = MealSuggestion(
+                user_id=user_id,
+                meal_type=row.meal_type,
+                signature=key[1],
+                score=0.0,
+                use_count=0,
+                mean_hour=hour_of_day(used_at),
+                last_used_at=used_at,
+                **{field: getattr(row, field) for field in SUGGESTION_FIELDS},
+            )
+        _bump(suggestion, used_at)
+
+    db.add_all(suggestions.values())
+
+
+async def top_suggestions(
+    db: AsyncSession,
+    user_id: int,
+    meal_type: MealType,
+    hour: Optional[float] = None,
+    limit: int = 10,
+) -> List[Tuple[MealSuggestion, float]]:
+    """Rank a user's entries for a meal type by decayed score and hour affinity."""
+    now = datetime.utcnow()
+    hour = hour_of_day(now) if hour is None else hour
+
+    result = await db.execute(
+        select(MealSuggestion)
+        .where(MealSuggestion.user_id == user_id, MealSuggestion.meal_type == meal_type)
+        .order_by(MealSuggestion.last_used_at.desc())
+        .limit(RANKING_WINDOW)
+    )
+
+    ranked = [
+        (suggestion, decay(suggestion.score, suggestion.last_used_at, now) * (0.5 + hour_affinity(suggestion.mean_hour, hour)))
+        for suggestion in result.scalars()
+    ]
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked[:limit]
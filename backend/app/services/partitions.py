@@ -0,0 +1,203 @@
+"""
+Monthly range partitions for history tables.
+
+On PostgreSQL, migration 008 turns ``meals``, ``water_logs`` and
+``workouts`` into tables partitioned by month on their date column, with
+a default partition catching anything outside the created months. This
+module keeps partitions created ahead of time, detaches old months and
+checks with EXPLAIN that date-filtered queries only touch the months
+they ask for. Other dialects have no partitions and everything here is a
+no-op.
+"""
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Table -> partition key column
+PARTITIONED_TABLES: Dict[str, str] = {
+    "meals": "meal_date",
+    "water_logs": "log_date",
+    "workouts": "workout_date",
+}
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND c.relnamespace = current_schema()::regnamespace"
+        ),
+        {"table": table},
+    )
+    return result.scalar() is not None
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> List[str]:
+    result = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :table AND p.relnamespace = current_schema()::regnamespace "
+            "ORDER BY c.relname"
+        ),
+        {"table": table},
+    )
+    return list(result.scalars())
+
+
+async def create_partition(conn: AsyncConnection, table: str, month: date) -> bool:
+    """
+    Create one month's partition; False if it already exists.
+
+    Rows for that month that landed in the default partition are moved
+    into the new partition, since PostgreSQL refuses to create a partition
+    whose range overlaps rows in the default one.
+    """
+    column = PARTITIONED_TABLES[table]
+    name = partition_name(table, month)
+    default = default_partition_name(table)
+    start, end = month_start(month), add_months(month_start(month), 1)
+    bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    in_range = f"{column} >= '{start.isoformat()}' AND {column} < '{end.isoformat()}'"
+
+    if name in await list_partitions(conn, table):
+        return False
+
+    stranded = await conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})"))
+    if not stranded.scalar():
+        await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"))
+        return True
+
+    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES {bounds}"))
+    await conn.execute(text(f"INSERT INTO {name} SELECT * FROM {default} WHERE {in_range}"))
+    await conn.execute(text(f"DELETE FROM {default} WHERE {in_range}"))
+    await conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+    return True
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, months_ahead: int, today: Optional[date] = None
+) -> List[str]:
+    """Create partitions from the current month up to ``months_ahead`` months out."""
+    current = month_start(today or date.today())
+    created = []
+    if conn.dialect.name == "postgresql":
+        # Workers starting together would race on the same CREATE TABLE
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('ensure_partitions'))"))
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(conn, table):
+            continue
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if await create_partition(conn, table, month):
+                created.append(partition_name(table, month))
+    return created
+
+
+async def detach_partition(conn: AsyncConnection, table: str, month: date, drop: bool = False) -> bool:
+    """
+    Detach a month from its table, optionally dropping it; False if it doesn't exist.
+
+    A detached partition is a plain table that can be archived or dropped
+    without touching the rest of the history. Exercises have no foreign
+    key to partitioned workouts, so dropping a workouts month also deletes
+    its exercises.
+    """
+    name = partition_name(table, month)
+    if not await is_partitioned(conn, table) or name not in await list_partitions(conn, table):
+        return False
+
+    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    if drop:
+        if table == "workouts":
+            await conn.execute(text(f"DELETE FROM exercises WHERE workout_id IN (SELECT id FROM {name})"))
+        await conn.execute(text(f"DROP TABLE {name}"))
+    return True
+
+
+@dataclass
+class PruningCheck:
+    table: str
+    query: str
+    expected: List[str]
+    scanned: List[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.scanned == self.expected
+
+
+def _scanned_relations(plan: dict) -> List[str]:
+    relations = [plan["Relation Name"]] if "Relation Name" in plan else []
+    for child in plan.get("Plans", []):
+        relations.extend(_scanned_relations(child))
+    return relations
+
+
+async def check_pruning(conn: AsyncConnection, today: Optional[date] = None) -> List[PruningCheck]:
+    """
+    EXPLAIN the app's date-filtered reads and report which partitions they scan.
+
+    Each query is expected to touch only the partitions for the months in
+    its range (the default partition too, for months without their own).
+    Literal dates are used so the planner prunes at plan time.
+    """
+    today = today or date.today()
+    week_ago = date.fromordinal(today.toordinal() - 6)
+    ranges = {
+        "meals": (today, today),  # daily summary and meal list
+        "water_logs": (today, today),  # today's water
+        "workouts": (week_ago, today),  # weekly stats
+    }
+
+    checks = []
+    for table, column in PARTITIONED_TABLES.items():
+        if not await is_partitioned(conn, table):
+            continue
+        start, end = ranges[table]
+        query = (
+            f"SELECT * FROM {table} WHERE user_id = 1 "
+            f"AND {column} >= '{start.isoformat()}' AND {column} <= '{end.isoformat()}'"
+        )
+        result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}"))
+        explained = result.scalar()
+        # asyncpg hands json back as text
+        if isinstance(explained, str):
+            explained = json.loads(explained)
+        plan = explained[0]["Plan"]
+
+        partitions = set(await list_partitions(conn, table))
+        expected = set()
+        month = month_start(start)
+        while month <= end:
+            name = partition_name(table, month)
+            expected.add(name if name in partitions else default_partition_name(table))
+            month = add_months(month, 1)
+
+        checks.append(PruningCheck(table, query, sorted(expected), sorted(set(_scanned_relations(plan)))))
+    return checks
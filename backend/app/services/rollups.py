@@ -0,0 +1,187 @@
+"""
+Incremental per-day totals.
+
+Write paths describe their effect as ``(day, delta)`` pairs; deltas are
+added to ``daily_rollups`` with one atomic upsert for the affected days,
+so concurrent writes for the same day neither lose updates nor race to
+create the row. Any goal whose met/unmet status flips is forwarded to
+the streaks.
+"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import upsert_insert
+from app.models.nutrition import Meal, WaterLog
+from app.models.progress import DailyRollup
+from app.models.user import User
+from app.models.workout import Workout
+from app.services.archive import archived_rows
+from app.services.streaks import WEEKLY_GOALS, daily_status, rebuild_streaks, update_streaks, week_start
+
+ROLLUP_FIELDS = (
+    "calories", "protein", "carbs", "fat", "fiber",
+    "meals_count", "water_glasses", "workouts_count", "workout_minutes",
+)
+
+RollupDelta = Dict[str, float]
+
+
+def meal_delta(meal, sign: int = 1) -> Tuple[date, RollupDelta]:
+    """Rollup change for adding (or with ``sign=-1`` removing) a meal."""
+    return meal.meal_date, {
+        "calories": sign * (meal.calories or 0),
+        "protein": sign * (meal.protein or 0),
+        "carbs": sign * (meal.carbs or 0),
+        "fat": sign * (meal.fat or 0),
+        "fiber": sign * (meal.fiber or 0),
+        "meals_count": sign,
+    }
+
+
+def water_delta(log_date: date, glasses: int) -> Tuple[date, RollupDelta]:
+    return log_date, {"water_glasses": glasses}
+
+
+def workout_delta(workout, sign: int = 1) -> Tuple[date, RollupDelta]:
+    return workout.workout_date, {
+        "workouts_count": sign,
+        "workout_minutes": sign * (workout.duration_minutes or 0),
+    }
+
+
+def _day_status(totals: Optional[SimpleNamespace], user: User) -> Dict[str, bool]:
+    # A day whose totals are all zero (nothing logged, or everything deleted) is empty
+    if totals is not None and not any(getattr(totals, field) for field in ROLLUP_FIELDS):
+        totals = None
+    return daily_status(totals, user)
+
+
+async def _week_workouts(db: AsyncSession, user_id: int, weeks: Iterable[date]) -> Dict[date, int]:
+    weeks = sorted(weeks)
+    result = await db.execute(
+        select(DailyRollup.day, DailyRollup.workouts_count).where(
+            DailyRollup.user_id == user_id,
+            DailyRollup.day >= weeks[0],
+            DailyRollup.day < weeks[-1] + timedelta(days=7),
+        )
+    )
+    totals = {week: 0 for week in weeks}
+    for day, workouts in result:
+        if week_start(day) in totals:
+            totals[week_start(day)] += workouts
+    return totals
+
+
+async def apply_rollup_deltas(db: AsyncSession, user: User, deltas: Iterable[Tuple[date, RollupDelta]]) -> None:
+    """Add per-day deltas to the user's rollups and update streaks. The caller commits."""
+    merged: Dict[date, RollupDelta] = {}
+    for day, delta in deltas:
+        day_delta = merged.setdefault(day, {})
+        for field, value in delta.items():
+            day_delta[field] = day_delta.get(field, 0) + value
+    merged = {day: delta for day, delta in merged.items() if any(delta.values())}
+    if not merged:
+        return
+
+    # Sorted so concurrent upserts lock the rows in the same order
+    days = sorted(merged)
+    stmt = upsert_insert(db, DailyRollup).values([
+        {"user_id": user.id, "day": day, **{field: merged[day].get(field, 0) for field in ROLLUP_FIELDS}}
+        for day in days
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "day"],
+        set_={field: getattr(DailyRollup, field) + stmt.excluded[field] for field in ROLLUP_FIELDS},
+    ).returning(DailyRollup.day, *(getattr(DailyRollup, field) for field in ROLLUP_FIELDS))
+    result = await db.execute(stmt)
+
+    changes: Dict[str, Dict[date, bool]] = {}
+    for row in result:
+        day = row.day
+        after = SimpleNamespace(**{field: getattr(row, field) for field in ROLLUP_FIELDS})
+        before = SimpleNamespace(**{
+            field: getattr(after, field) - merged[day].get(field, 0) for field in ROLLUP_FIELDS
+        })
+        before_status = _day_status(before, user)
+        for goal, met in _day_status(after, user).items():
+            if met != before_status[goal]:
+                changes.setdefault(goal, {})[day] = met
+
+    week_deltas: Dict[date, int] = {}
+    for day, delta in merged.items():
+        if delta.get("workouts_count"):
+            week = week_start(day)
+            week_deltas[week] = week_deltas.get(week, 0) + delta["workouts_count"]
+
+    if week_deltas:
+        totals = await _week_workouts(db, user.id, week_deltas)
+        for goal in WEEKLY_GOALS:
+            for week, added in week_deltas.items():
+                met_before = goal.is_met(totals[week] - added, user)
+                met_after = goal.is_met(totals[week], user)
+                if met_before != met_after:
+                    changes.setdefault(goal.name, {})[week] = met_after
+
+    await update_streaks(db, user, changes)
+
+
+async def rebuild_rollups(db: AsyncSession, user: User) -> None:
+    """Recompute a user's rollups and streaks from raw history, e.g. after an import."""
+    await db.execute(delete(DailyRollup).where(DailyRollup.user_id == user.id))
+
+    rows: Dict[date, dict] = {}
+
+    def row(day: date) -> dict:
+        if day not in rows:
+            rows[day] = {"user_id": user.id, "day": day, **{field: 0 for field in ROLLUP_FIELDS}}
+        return rows[day]
+
+    meals = await db.execute(
+        select(
+            Meal.meal_date,
+            func.coalesce(func.sum(Meal.calories), 0),
+            func.coalesce(func.sum(Meal.protein), 0),
+            func.coalesce(func.sum(Meal.carbs), 0),
+            func.coalesce(func.sum(Meal.fat), 0),
+            func.coalesce(func.sum(Meal.fiber), 0),
+            func.count(),
+        )
+        .where(Meal.user_id == user.id)
+        .group_by(Meal.meal_date)
+    )
+    for day, calories, protein, carbs, fat, fiber, count in meals:
+        row(day).update(calories=calories, protein=protein, carbs=carbs, fat=fat, fiber=fiber, meals_count=count)
+
+    water = await db.execute(
+        select(WaterLog.log_date, func.sum(WaterLog.glasses))
+        .where(WaterLog.user_id == user.id)
+        .group_by(WaterLog.log_date)
+    )
+    for day, glasses in water:
+        row(day)["water_glasses"] = glasses
+
+    workouts = await db.execute(
+        select(Workout.workout_date, func.count(), func.coalesce(func.sum(Workout.duration_minutes), 0))
+        .where(Workout.user_id == user.id)
+        .group_by(Workout.workout_date)
+    )
+    for day, count, minutes in workouts:
+        row(day).update(workouts_count=count, workout_minutes=minutes)
+
+    # Archived entries still count towards their days
+    for meal in await archived_rows(db, "meals", user.id):
+        totals = row(meal.meal_date)
+        for field in ("calories", "protein", "carbs", "fat", "fiber"):
+            totals[field] += getattr(meal, field) or 0
+        totals["meals_count"] += 1
+    for log in await archived_rows(db, "water_logs", user.id):
+        row(log.log_date)["water_glasses"] += log.glasses
+
+    if rows:
+        await db.execute(insert(DailyRollup), list(rows.values()))
+
+    await rebuild_streaks(db, user)
@@ -0,0 +1,209 @@
+"""
+Shopping list de-duplication.
+
+New items are matched against the user's pending items by a normalized
+name (case, whitespace and simple plural folding), and quantities are
+merged where both sides parse as ``<number> [unit]``. Candidates are
+looked up by ``lower(name)`` so the partial functional index on pending
+items serves the query.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.events import publish_event
+from app.models.shopping import ShoppingCategory, ShoppingItem
+from app.services.categorizer import classify_item, load_overrides
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_QUANTITY = re.compile(r"^\s*(\d+(?:[.,]\d+)?)\s*([^\d\s].*)?$")
+
+# Words that end in "s" but are not plurals
+_SINGULAR_S = {"molasses", "news", "swiss"}
+
+
+def _singular(word: str) -> str:
+    """
+    Fold a word to a plural-insensitive key.
+
+    "berry" and "berries" both become "berrie", "tomatoes" becomes "tomato".
+    """
+    if len(word) <= 2 or word in _SINGULAR_S or word.endswith(("ss", "us", "is")):
+        return word
+    if word.endswith("y") and word[-2] not in "aeiou":
+        return word[:-1] + "ie"
+    if word.endswith(("ches", "shes", "xes", "oes", "sses")):
+        return word[:-2]
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+
+def normalize_item_name(name: str) -> str:
+    """Matching key for an item name: "  Fresh  Tomatoes!" -> "fresh tomato"."""
+    words = _NON_WORD.sub(" ", name.lower()).split()
+    if not words:
+        return ""
+    words[-1] = _singular(words[-1])
+    return " ".join(words)
+
+
+def clean_item_name(name: str) -> str:
+    """Display form stored for new items: trimmed with single spaces."""
+    return " ".join(name.split())
+
+
+def _lookup_forms(name: str) -> Set[str]:
+    """``lower(name)`` spellings that can normalize to the same key as ``name``."""
+    cleaned = clean_item_name(name).lower()
+    key = normalize_item_name(name)
+    forms = {cleaned, key}
+    if key:
+        forms.update({key + "s", key + "es"})
+        if key.endswith("ie"):
+            forms.add(key[:-2] + "y")
+    return forms
+
+
+def parse_quantity(quantity: Optional[str]) -> Optional[Tuple[float, str]]:
+    """Parse "2", "1.5 kg" or "3 packs" into ``(amount, unit)``."""
+    if not quantity:
+        return None
+    match = _QUANTITY.match(quantity)
+    if not match:
+        return None
+    amount = float(match.group(1).replace(",", "."))
+    unit = " ".join((match.group(2) or "").lower().split())
+    return amount, _singular(unit) if unit else unit
+
+
+def merge_quantities(current: Optional[str], added: Optional[str]) -> Optional[str]:
+    """
+    Combine two quantities of the same item.
+
+    Same-unit amounts are summed ("1 l" + "2 l" -> "3 l"); anything else
+    is kept side by side. A missing quantity adds nothing.
+    """
+    if not current:
+        return added
+    if not added:
+        return current
+
+    left, right = parse_quantity(current), parse_quantity(added)
+    if left and right and left[1] == right[1]:
+        amount = f"{left[0] + right[0]:g}"
+        return f"{amount} {left[1]}" if left[1] else amount
+
+    return f"{current} + {added}"[:100]
+
+
+@dataclass
+class ShoppingMerge:
+    """Outcome of adding items: one row per distinct name, in input order."""
+    items: List[ShoppingItem] = field(default_factory=list)
+    created_ids: List[int] = field(default_factory=list)
+    merged_ids: List[int] = field(default_factory=list)
+
+
+def _fold_into(item: dict, other: dict) -> None:
+    item["quantity"] = merge_quantities(item.get("quantity"), other.get("quantity"))
+    if item.get("category", ShoppingCategory.OTHER) == ShoppingCategory.OTHER and other.get("category"):
+        item["category"] = other["category"]
+    if not item.get("notes") and other.get("notes"):
+        item["notes"] = other["notes"]
+
+
+async def add_shopping_items(
+    db: AsyncSession,
+    user_id: int,
+    items: Iterable[dict],
+) -> ShoppingMerge:
+    """
+    Add items to a user's list, merging into matching pending items.
+
+    ``items`` are dicts of ``ShoppingItem`` columns (name, quantity,
+    category, notes); a missing category is classified from the name.
+    Duplicates within the batch are folded first; then
+    one SELECT finds pending matches, their updates are flushed together
+    and the remaining items go in with one multi-row INSERT. The caller
+    commits.
+    """
+    incoming: Dict[str, dict] = {}
+    for raw in items:
+        key = normalize_item_name(raw["name"])
+        if not key:
+            continue
+        item = {**raw, "name": clean_item_name(raw["name"])}
+        if key in incoming:
+            _fold_into(incoming[key], item)
+        else:
+            incoming[key] = item
+
+    merge = ShoppingMerge()
+    if not incoming:
+        return merge
+
+    # Fill in missing categories: the user's own past choices first, then the dictionary
+    uncategorized = [key for key, item in incoming.items() if not item.get("category")]
+    if uncategorized:
+        overrides = await load_overrides(db, user_id, uncategorized)
+        for key in uncategorized:
+            incoming[key]["category"] = overrides.get(key) or classify_item(incoming[key]["name"])
+
+    forms = set()
+    for item in incoming.values():
+        forms.update(_lookup_forms(item["name"]))
+
+    result = await db.execute(
+        select(ShoppingItem)
+        .where(
+            ShoppingItem.user_id == user_id,
+            ShoppingItem.is_purchased == False,
+            func.lower(ShoppingItem.name).in_(forms),
+        )
+        .order_by(ShoppingItem.created_at)
+    )
+    pending: Dict[str, ShoppingItem] = {}
+    for existing in result.scalars():
+        pending.setdefault(normalize_item_name(existing.name), existing)
+
+    by_key: Dict[str, ShoppingItem] = {}
+    new_rows = []
+    for key, item in incoming.items():
+        existing = pending.get(key)
+        if existing is None:
+            new_rows.append((key, {"user_id": user_id, **item}))
+            continue
+
+        existing.quantity = merge_quantities(existing.quantity, item.get("quantity"))
+        if existing.category == ShoppingCategory.OTHER and item.get("category"):
+            existing.category = item["category"]
+        if not existing.notes and item.get("notes"):
+            existing.notes = item["notes"]
+        by_key[key] = existing
+        merge.merged_ids.append(existing.id)
+
+    await db.flush()
+
+    if new_rows:
+        created = await db.scalars(
+            insert(ShoppingItem).returning(ShoppingItem, sort_by_parameter_order=True),
+            [row for _, row in new_rows],
+        )
+        for (key, _), item in zip(new_rows, created.all()):
+            by_key[key] = item
+            merge.created_ids.append(item.id)
+
+    merge.items = [by_key[key] for key in incoming]
+    return merge
+
+
+async def publish_shopping_merge(user_id: int, merge: ShoppingMerge) -> None:
+    """Announce created and merged items to the user's live sessions."""
+    if merge.created_ids:
+        await publish_event(user_id, "shopping.created", ids=merge.created_ids)
+    if merge.merged_ids:
+        await publish_event(user_id, "shopping.updated", ids=merge.merged_ids)
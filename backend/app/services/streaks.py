@@ -0,0 +1,251 @@
+"""
+Goal streaks and adherence.
+
+Each goal keeps its current run (first and last period) and its longest
+run in ``user_streaks``. When a day's rollup changes whether a goal is
+met, the stored run is extended or shortened in place; only edits that
+split or join runs in the past fall back to rescanning that goal's
+rollups. Raw meals, water logs and workouts are never scanned here.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.progress import DailyRollup, UserStreak
+from app.models.user import User
+
+# Calories count as on target within this fraction of the goal
+CALORIE_TOLERANCE = 0.1
+
+# Workouts per week that keep the weekly streak going
+WEEKLY_WORKOUT_TARGET = 3
+
+ADHERENCE_WINDOW_DAYS = 30
+
+
+@dataclass(frozen=True)
+class Goal:
+    name: str
+    period_days: int
+    # Daily goals test a day's rollup; weekly goals test the week's workout count
+    is_met: Callable[..., bool]
+
+
+GOALS: Dict[str, Goal] = {
+    goal.name: goal
+    for goal in (
+        Goal(
+            "calories",
+            1,
+            lambda rollup, user: user.daily_calorie_goal > 0
+            and abs(rollup.calories - user.daily_calorie_goal) <= CALORIE_TOLERANCE * user.daily_calorie_goal,
+        ),
+        Goal("protein", 1, lambda rollup, user: rollup.protein >= user.daily_protein_goal),
+        Goal("water", 1, lambda rollup, user: rollup.water_glasses >= user.daily_water_goal),
+        Goal("logging", 1, lambda rollup, user: rollup.meals_count > 0),
+        Goal("workouts", 7, lambda workouts, user: workouts >= WEEKLY_WORKOUT_TARGET),
+    )
+}
+DAILY_GOALS = [goal for goal in GOALS.values() if goal.period_days == 1]
+WEEKLY_GOALS = [goal for goal in GOALS.values() if goal.period_days == 7]
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def period_of(goal: Goal, day: date) -> date:
+    return week_start(day) if goal.period_days == 7 else day
+
+
+def daily_status(rollup: Optional[DailyRollup], user: User) -> Dict[str, bool]:
+    """Which daily goals a day's rollup meets (an empty day meets none)."""
+    return {goal.name: rollup is not None and goal.is_met(rollup, user) for goal in DAILY_GOALS}
+
+
+def streak_length(streak: UserStreak, goal: Goal) -> int:
+    if streak.current_end is None:
+        return 0
+    return (streak.current_end - streak.current_start).days // goal.period_days + 1
+
+
+def current_length(streak: UserStreak, goal: Goal, today: Optional[date] = None) -> int:
+    """
+    Length of the run that is still alive.
+
+    The current period is still in progress, so a run ending in the previous
+    period has not been broken yet.
+    """
+    today = today or date.today()
+    step = timedelta(days=goal.period_days)
+    if streak.current_end is None or streak.current_end < period_of(goal, today) - step:
+        return 0
+    return streak_length(streak, goal)
+
+
+def _advance(streak: UserStreak, goal: Goal, period: date, met: bool) -> bool:
+    """
+    Apply one period flipping its status; False when a rescan is needed.
+
+    Handles the common cases: extending the latest run, starting a new run,
+    and un-meeting the last period of the latest run.
+    """
+    step = timedelta(days=goal.period_days)
+    start, end = streak.current_start, streak.current_end
+
+    if met:
+        if end is None or period > end + step:
+            streak.current_start = streak.current_end = period
+        elif period == end + step:
+            streak.current_end = period
+        else:
+            # Backdated: may join or extend an earlier run
+            return False
+        streak.longest = max(streak.longest, streak_length(streak, goal))
+        return True
+
+    if end is None or period > end:
+        return True
+    if period == end and streak_length(streak, goal) < streak.longest:
+        if period == start:
+            streak.current_start = streak.current_end = None
+        else:
+            streak.current_end = end - step
+        return True
+    # Splits a run, or shortens the one that may be the longest
+    return False
+
+
+async def _period_statuses(db: AsyncSession, user: User, goal: Goal) -> Dict[date, bool]:
+    """Met/unmet per period for a goal, from the user's rollups."""
+    if goal.period_days == 1:
+        result = await db.execute(
+            select(DailyRollup).where(DailyRollup.user_id == user.id).order_by(DailyRollup.day)
+        )
+        return {rollup.day: goal.is_met(rollup, user) for rollup in result.scalars()}
+
+    result = await db.execute(
+        select(DailyRollup.day, DailyRollup.workouts_count)
+        .where(DailyRollup.user_id == user.id, DailyRollup.workouts_count > 0)
+        .order_by(DailyRollup.day)
+    )
+    weeks: Dict[date, int] = {}
+    for day, workouts in result:
+        weeks[week_start(day)] = weeks.get(week_start(day), 0) + workouts
+    return {week: goal.is_met(workouts, user) for week, workouts in weeks.items()}
+
+
+async def rescan_streak(db: AsyncSession, user: User, goal: Goal, streak: UserStreak) -> None:
+    """Recompute a goal's runs from its rollups."""
+    step = timedelta(days=goal.period_days)
+    streak.current_start = streak.current_end = None
+    streak.longest = 0
+
+    statuses = await _period_statuses(db, user, goal)
+    for period in sorted(statuses):
+        if not statuses[period]:
+            continue
+        if streak.current_end is not None and period == streak.current_end + step:
+            streak.current_end = period
+        else:
+            streak.current_start = streak.current_end = period
+        streak.longest = max(streak.longest, streak_length(streak, goal))
+
+
+async def load_streaks(db: AsyncSession, user: User) -> Dict[str, UserStreak]:
+    """The user's streak rows, creating and scanning any that are missing."""
+    query = select(UserStreak).where(UserStreak.user_id == user.id)
+    streaks = {streak.goal: streak for streak in (await db.execute(query)).scalars()}
+
+    missing = [goal for goal in GOALS.values() if goal.name not in streaks]
+    if not missing:
+        return streaks
+
+    try:
+        async with db.begin_nested():
+            for goal in missing:
+                streak = streaks[goal.name] = UserStreak(user_id=user.id, goal=goal.name, longest=0)
+                db.add(streak)
+                await rescan_streak(db, user, goal, streak)
+    except IntegrityError:
+        # Another request created them first
+        streaks = {streak.goal: streak for streak in (await db.execute(query)).scalars()}
+
+    return streaks
+
+
+async def update_streaks(db: AsyncSession, user: User, changes: Dict[str, Dict[date, bool]]) -> None:
+    """
+    Apply goal status flips: ``{goal: {period: now_met}}``.
+
+    Only periods whose status actually changed should be passed.
+    """
+    changes = {name: periods for name, periods in changes.items() if periods}
+    if not changes:
+        return
+
+    streaks = await load_streaks(db, user)
+    for name, periods in changes.items():
+        goal, streak = GOALS[name], streaks[name]
+        for period in sorted(periods):
+            if not _advance(streak, goal, period, periods[period]):
+                await rescan_streak(db, user, goal, streak)
+                break
+
+
+async def rebuild_streaks(db: AsyncSession, user: User) -> None:
+    """Rescan every goal, e.g. after goals change or history is imported."""
+    streaks = await load_streaks(db, user)
+    for goal in GOALS.values():
+        await rescan_streak(db, user, goal, streaks[goal.name])
+
+
+async def get_streaks(db: AsyncSession, user: User, today: Optional[date] = None) -> List[dict]:
+    """Current and longest streak plus recent adherence for every goal."""
+    today = today or date.today()
+    streaks = await load_streaks(db, user)
+
+    # Adherence over the last full days, from at most ADHERENCE_WINDOW_DAYS rollups
+    window_start = today - timedelta(days=ADHERENCE_WINDOW_DAYS)
+    result = await db.execute(
+        select(DailyRollup).where(
+            DailyRollup.user_id == user.id,
+            DailyRollup.day >= window_start,
+            DailyRollup.day < today,
+        )
+    )
+    met_days = {goal.name: 0 for goal in DAILY_GOALS}
+    weeks: Dict[date, int] = {}
+    for rollup in result.scalars():
+        for name, met in daily_status(rollup, user).items():
+            met_days[name] += met
+        weeks[week_start(rollup.day)] = weeks.get(week_start(rollup.day), 0) + rollup.workouts_count
+
+    # Only whole weeks inside the window count towards weekly adherence
+    full_weeks = [
+        week_start(window_start) + timedelta(days=7 * i)
+        for i in range(1, ADHERENCE_WINDOW_DAYS // 7 + 1)
+        if week_start(window_start) + timedelta(days=7 * i + 6) < today
+    ]
+
+    summary = []
+    for goal in GOALS.values():
+        streak = streaks[goal.name]
+        if goal.period_days == 1:
+            adherence = met_days[goal.name] / ADHERENCE_WINDOW_DAYS
+        else:
+            met_weeks = sum(goal.is_met(weeks.get(week, 0), user) for week in full_weeks)
+            adherence = met_weeks / len(full_weeks) if full_weeks else 0.0
+        summary.append({
+            "goal": goal.name,
+            "period": "week" if goal.period_days == 7 else "day",
+            "current": current_length(streak, goal, today),
+            "longest": streak.longest,
+            "last_met": streak.current_end,
+            "adherence": round(adherence, 3),
+        })
+    return summary
@@ -0,0 +1,143 @@
+"""
+Aggregates behind the summary endpoints and the dashboard.
+
+Each takes its own session argument so the dashboard can run them side by
+side on separate connections.
+"""
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.nutrition import Meal, WaterLog
+from app.models.shopping import ShoppingItem
+from app.models.user import User
+from app.models.workout import Workout
+from app.schemas.nutrition import DailyNutritionSummary
+from app.schemas.shopping import ShoppingListSummary
+from app.schemas.user import UserGoals
+from app.schemas.workout import WorkoutSummary
+from app.services.archive import archived_rows
+
+
+def user_goals(user: User) -> UserGoals:
+    return UserGoals(
+        daily_calorie_goal=user.daily_calorie_goal,
+        daily_protein_goal=user.daily_protein_goal,
+        daily_carbs_goal=user.daily_carbs_goal,
+        daily_fat_goal=user.daily_fat_goal,
+        daily_water_goal=user.daily_water_goal,
+    )
+
+
+async def water_glasses(db: AsyncSession, user_id: int, day: date) -> int:
+    """Glasses logged on ``day`` (live table only, enough for recent days)."""
+    result = await db.execute(
+        select(func.coalesce(func.sum(WaterLog.glasses), 0))
+        .where(WaterLog.user_id == user_id, WaterLog.log_date == day)
+    )
+    return result.scalar()
+
+
+async def daily_nutrition_summary(db: AsyncSession, user: User, summary_date: date) -> DailyNutritionSummary:
+    # Get meals for the day
+    result = await db.execute(
+        select(Meal).where(Meal.user_id == user.id, Meal.meal_date == summary_date)
+    )
+    meals = [*result.scalars(), *await archived_rows(db, "meals", user.id, summary_date, summary_date)]
+
+    # Calculate totals
+    total_calories = sum(m.calories or 0 for m in meals)
+    total_protein = sum(m.protein or 0 for m in meals)
+    total_carbs = sum(m.carbs or 0 for m in meals)
+    total_fat = sum(m.fat or 0 for m in meals)
+    total_fiber = sum(m.fiber or 0 for m in meals)
+
+    # Get water intake
+    water = await water_glasses(db, user.id, summary_date) + sum(
+        log.glasses for log in await archived_rows(db, "water_logs", user.id, summary_date, summary_date)
+    )
+
+    # Calculate progress percentages
+    def calc_progress(current: float, goal: float) -> float:
+        if goal <= 0:
+            return 0
+        return min(round((current / goal) * 100, 1), 100)
+
+    return DailyNutritionSummary(
+        date=summary_date,
+        total_calories=total_calories,
+        total_protein=total_protein,
+        total_carbs=total_carbs,
+        total_fat=total_fat,
+        total_fiber=total_fiber,
+        water_glasses=water,
+        meals_count=len(meals),
+        calorie_goal=user.daily_calorie_goal,
+        protein_goal=user.daily_protein_goal,
+        carbs_goal=user.daily_carbs_goal,
+        fat_goal=user.daily_fat_goal,
+        water_goal=user.daily_water_goal,
+        calorie_progress=calc_progress(total_calories, user.daily_calorie_goal),
+        protein_progress=calc_progress(total_protein, user.daily_protein_goal),
+        carbs_progress=calc_progress(total_carbs, user.daily_carbs_goal),
+        fat_progress=calc_progress(total_fat, user.daily_fat_goal),
+        water_progress=calc_progress(water, user.daily_water_goal),
+    )
+
+
+async def weekly_workout_summary(db: AsyncSession, user_id: int, today: Optional[date] = None) -> WorkoutSummary:
+    """Workouts of the week up to ``today`` (from Monday; the server's today by default)."""
+    today = today or date.today()
+    week_start = today - timedelta(days=today.weekday())
+
+    result = await db.execute(
+        select(Workout)
+        .where(
+            Workout.user_id == user_id,
+            Workout.workout_date >= week_start,
+            Workout.workout_date <= today,
+        )
+    )
+    workouts = result.scalars().all()
+
+    workouts_by_type = {}
+    total_duration = 0
+    total_calories = 0
+
+    for workout in workouts:
+        workout_type = workout.workout_type.value
+        workouts_by_type[workout_type] = workouts_by_type.get(workout_type, 0) + 1
+        total_duration += workout.duration_minutes
+        total_calories += workout.calories_burned or 0
+
+    return WorkoutSummary(
+        total_workouts=len(workouts),
+        total_duration_minutes=total_duration,
+        total_calories_burned=total_calories,
+        workouts_by_type=workouts_by_type,
+    )
+
+
+async def shopping_list_summary(db: AsyncSession, user_id: int) -> ShoppingListSummary:
+    result = await db.execute(
+        select(ShoppingItem).where(ShoppingItem.user_id == user_id)
+    )
+    items = result.scalars().all()
+
+    purchased = sum(1 for item in items if item.is_purchased)
+    pending = len(items) - purchased
+
+    items_by_category = {}
+    for item in items:
+        if not item.is_purchased:
+            cat = item.category.value
+            items_by_category[cat] = items_by_category.get(cat, 0) + 1
+
+    return ShoppingListSummary(
+        total_items=len(items),
+        purchased_items=purchased,
+        pending_items=pending,
+        items_by_category=items_by_category,
+    )
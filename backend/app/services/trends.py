@@ -0,0 +1,114 @@
+"""
+Nutrition trends over daily rollups.
+
+One columnar fetch of ``daily_rollups`` is laid out on a dense day axis
+and reduced with NumPy: rolling averages over logged days (cumulative
+sums, so any window length costs the same), deltas against the user's
+goals and weekday patterns.
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.progress import DailyRollup
+from app.models.user import User
+
+WINDOWS = (7, 30)
+
+# Metric -> User goal attribute (None when there is no goal)
+METRICS: Dict[str, Optional[str]] = {
+    "calories": "daily_calorie_goal",
+    "protein": "daily_protein_goal",
+    "carbs": "daily_carbs_goal",
+    "fat": "daily_fat_goal",
+    "fiber": None,
+}
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def _as_list(values: np.ndarray) -> List[Optional[float]]:
+    rounded = np.round(values, 1)
+    return [None if value != value else value for value in rounded.tolist()]
+
+
+def rolling_mean(values: np.ndarray, logged: np.ndarray, window: int) -> np.ndarray:
+    """Mean over the logged days among the last ``window`` days (NaN if none)."""
+    sums = np.concatenate(([0.0], np.cumsum(np.where(logged, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(logged)))
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    window_counts = counts[end] - counts[start]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(window_counts > 0, (sums[end] - sums[start]) / window_counts, np.nan)
+
+
+async def nutrition_trends(db: AsyncSession, user: User, start_date: date, end_date: date) -> dict:
+    # Fetch extra history so the first days of the range get full windows
+    fetch_start = start_date - timedelta(days=max(WINDOWS) - 1)
+    result = await db.execute(
+        select(
+            DailyRollup.day,
+            DailyRollup.meals_count,
+            *(getattr(DailyRollup, metric) for metric in METRICS),
+        )
+        .where(
+            DailyRollup.user_id == user.id,
+            DailyRollup.day >= fetch_start,
+            DailyRollup.day <= end_date,
+            DailyRollup.meals_count > 0,
+        )
+        .order_by(DailyRollup.day)
+    )
+    rows = result.all()
+
+    total_days = (end_date - fetch_start).days + 1
+    offset = (start_date - fetch_start).days
+    logged = np.zeros(total_days, dtype=bool)
+    columns = {metric: np.zeros(total_days) for metric in METRICS}
+
+    if rows:
+        day_column, _, *metric_columns = zip(*rows)
+        index = (np.array(day_column, dtype="datetime64[D]") - np.datetime64(fetch_start, "D")).astype(int)
+        logged[index] = True
+        for metric, values in zip(METRICS, metric_columns):
+            columns[metric][index] = np.array(values, dtype=float)
+
+    in_range = logged[offset:]
+    weekdays = (np.arange(offset, total_days) + fetch_start.weekday()) % 7
+
+    series = []
+    for metric, goal_attr in METRICS.items():
+        values = columns[metric]
+        goal = getattr(user, goal_attr) if goal_attr else None
+        averages = {window: rolling_mean(values, logged, window)[offset:] for window in WINDOWS}
+        daily = np.where(in_range, values[offset:], np.nan)
+
+        logged_values = daily[in_range]
+        weekday_means = {}
+        for weekday, name in enumerate(WEEKDAYS):
+            selected = daily[(weekdays == weekday) & in_range]
+            weekday_means[name] = round(float(selected.mean()), 1) if len(selected) else None
+
+        mean = float(logged_values.mean()) if len(logged_values) else None
+        series.append({
+            "metric": metric,
+            "goal": goal,
+            "daily": _as_list(daily),
+            "avg_7": _as_list(averages[7]),
+            "avg_30": _as_list(averages[30]),
+            "delta_7_vs_goal": _as_list(averages[7] - goal) if goal else None,
+            "mean": round(mean, 1) if mean is not None else None,
+            "mean_delta_vs_goal": round(mean - goal, 1) if mean is not None and goal else None,
+            "weekday_means": weekday_means,
+        })
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "logged_days": int(in_range.sum()),
+        "series": series,
+    }
@@ -0,0 +1,144 @@
+"""
+Bot handler benchmark over a fake Telegram transport.
+
+Replays a synthetic stream of commands and callback queries through the
+real handlers at a target rate and reports per-handler latency, database
+queries per update and throughput. No network access is needed.
+
+    python -m benchmarks.bot --users 20 --updates 5000 --rate 200
+"""
+import argparse
+import asyncio
+import random
+import time
+from itertools import count
+from typing import List, Tuple
+
+from telegram import Update
+
+from app.bot.handlers import create_bot_application
+from app.core.database import engine
+from app.core.metrics import instrument_engine, track_db
+from benchmarks.fake_telegram import BOT_USER, FakeTelegramRequest
+from benchmarks.report import LatencyReport
+from benchmarks.seed import benchmark_telegram_ids
+
+# (label, weight, command text or callback data, is callback)
+UPDATE_MIX: List[Tuple[str, int, str, bool]] = [
+    ("/start", 5, "/start", False),
+    ("/help", 5, "/help", False),
+    ("/today", 15, "/today", False),
+    ("/shop", 15, "/shop", False),
+    ("/add", 10, "/add milk, eggs, bread", False),
+    ("/water", 20, "/water 1", False),
+    ("/streaks", 5, "/streaks", False),
+    ("callback:water_add", 20, "water_add", True),
+    ("callback:menu", 5, "menu", True),
+    ("callback:settings", 5, "settings", True),
+]
+
+
+class UpdateFactory:
+    """Builds raw Bot API update payloads for synthetic users."""
+
+    def __init__(self):
+        self._update_ids = count(1)
+
+    def _user(self, telegram_id: int) -> dict:
+        return {"id": telegram_id, "is_bot": False, "first_name": "Bench"}
+
+    def _message(self, telegram_id: int, text: str, sender: dict) -> dict:
+        return {
+            "message_id": next(self._update_ids),
+            "date": int(time.time()),
+            "chat": {"id": telegram_id, "type": "private"},
+            "from": sender,
+            "text": text,
+        }
+
+    def command(self, telegram_id: int, text: str) -> dict:
+        message = self._message(telegram_id, text, self._user(telegram_id))
+        command_length = len(text.split()[0])
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": command_length}]
+        return {"update_id": next(self._update_ids), "message": message}
+
+    def callback(self, telegram_id: int, data: str) -> dict:
+        return {
+            "update_id": next(self._update_ids),
+            "callback_query": {
+                "id": str(next(self._update_ids)),
+                "from": self._user(telegram_id),
+                "chat_instance": str(telegram_id),
+                "data": data,
+                "message": self._message(telegram_id, "menu", BOT_USER),
+            },
+        }
+
+
+async def run(users: int, total_updates: int, rate: float, latency: float, seed_value: int) -> Tuple[LatencyReport, FakeTelegramRequest]:
+    instrument_engine(engine)
+
+    transport = FakeTelegramRequest(latency=latency)
+    application = create_bot_application(request=transport)
+    await application.initialize()
+
+    rng = random.Random(seed_value)
+    factory = UpdateFactory()
+    telegram_ids = benchmark_telegram_ids(users)
+    weights = [entry[1] for entry in UPDATE_MIX]
+
+    plan = []
+    for _ in range(total_updates):
+        label, _, payload, is_callback = rng.choices(UPDATE_MIX, weights)[0]
+        telegram_id = rng.choice(telegram_ids)
+        raw = factory.callback(telegram_id, payload) if is_callback else factory.command(telegram_id, payload)
+        plan.append((label, Update.de_json(raw, application.bot)))
+
+    report = LatencyReport()
+    failed_updates = set()
+
+    async def record_error(update: object, context) -> None:
+        # The application swallows handler exceptions and routes them here
+        if isinstance(update, Update):
+            failed_updates.add(update.update_id)
+
+    application.add_error_handler(record_error)
+
+    async def process(label: str, update: Update) -> None:
+        start = time.perf_counter()
+        with track_db() as stats:
+            await application.process_update(update)
+        ok = update.update_id not in failed_updates
+        report.record(label, time.perf_counter() - start, ok=ok, queries=stats.queries)
+
+    # Open-loop arrival at the target rate, so slow handlers queue up like in production
+    tasks = []
+    start = time.perf_counter()
+    for i, (label, update) in enumerate(plan):
+        delay = start + i / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(process(label, update)))
+    await asyncio.gather(*tasks)
+    report.elapsed = time.perf_counter() - start
+
+    await application.shutdown()
+    return report, transport
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bot handler benchmark")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=100.0, help="target updates per second")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated Bot API latency in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    report, transport = asyncio.run(run(args.users, args.updates, args.rate, args.latency, args.seed))
+    print(report.render())
+    print("\nBot API calls: " + ", ".join(f"{name}={n}" for name, n in sorted(transport.calls.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+CPU cost vs bytes saved of response compression on realistic payloads.
+
+Builds workout lists (with nested exercises) and shopping lists shaped
+like the API's responses, then times every available encoder at a few
+levels. Encoders come from ``app.core.compression``; brotli and zstd are
+skipped unless their optional packages are installed. No database needed.
+
+    python -m benchmarks.compression
+    python -m benchmarks.compression --workouts 20 100 500 --repeat 50
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Tuple
+
+from pydantic import TypeAdapter
+
+from app.core import compression
+from app.schemas.shopping import ShoppingItemResponse
+from app.schemas.workout import WorkoutResponse
+from benchmarks.seed import SHOPPING, generate_workout
+
+# (label, compressor factory); defaults first, then faster and denser settings
+ENCODERS: List[Tuple[str, Callable[[], object]]] = [
+    ("gzip-1", lambda: compression.GzipCompressor(1)),
+    (f"gzip-{compression.GZIP_LEVEL}", compression.GzipCompressor),
+    ("gzip-9", lambda: compression.GzipCompressor(9)),
+]
+if compression.brotli is not None:
+    ENCODERS += [
+        ("br-1", lambda: compression.BrotliCompressor(1)),
+        (f"br-{compression.BROTLI_QUALITY}", compression.BrotliCompressor),
+        ("br-11", lambda: compression.BrotliCompressor(11)),
+    ]
+if compression.zstandard is not None:
+    ENCODERS += [
+        ("zstd-1", lambda: compression.ZstdCompressor(1)),
+        (f"zstd-{compression.ZSTD_LEVEL}", compression.ZstdCompressor),
+        ("zstd-9", lambda: compression.ZstdCompressor(9)),
+    ]
+
+
+def workouts_payload(rng: random.Random, count: int) -> bytes:
+    """``GET /workouts`` body: newest first, nested exercises included."""
+    created = datetime(2026, 1, 1, 18, 30)
+    workouts = []
+    exercise_ids = iter(range(1, 10 * count + 1))
+    for i in range(count):
+        day = date.today() - timedelta(days=2 * i)
+        workout = generate_workout(rng, day).model_dump()
+        workout.update(id=count - i, user_id=1, created_at=created, updated_at=created)
+        workout["exercises"] = [
+            {**exercise, "id": next(exercise_ids), "workout_id": count - i, "created_at": created}
+            for exercise in workout["exercises"]
+        ]
+        workouts.append(workout)
+    adapter = TypeAdapter(List[WorkoutResponse])
+    return adapter.dump_json(adapter.validate_python(workouts))
+
+
+def shopping_payload(rng: random.Random, count: int) -> bytes:
+    """``GET /shopping`` body; the endpoint has no limit, so lists grow over time."""
+    created = datetime(2026, 1, 1, 9, 0)
+    items = []
+    for i in range(count):
+        name, category = rng.choice(SHOPPING)
+        items.append({
+            "id": i + 1,
+            "user_id": 1,
+            "name": name,
+            "quantity": str(rng.randint(1, 3)),
+            "category": category,
+            "notes": None,
+            "is_purchased": rng.random() < 0.3,
+            "created_at": created,
+            "updated_at": created,
+        })
+    adapter = TypeAdapter(List[ShoppingItemResponse])
+    return adapter.dump_json(adapter.validate_python(items))
+
+
+def measure(factory: Callable[[], object], body: bytes, repeat: int) -> Tuple[int, float]:
+    """Compressed size and best time in seconds of compressing ``body`` in one go."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(factory().compress(body, final=True))
+        best = min(best, time.perf_counter() - start)
+    return size, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Response compression benchmark")
+    parser.add_argument("--workouts", type=int, nargs="+", default=[20, 100, 500], help="workout list sizes")
+    parser.add_argument("--shopping", type=int, nargs="+", default=[30, 200], help="shopping list sizes")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [(f"workouts x{count}", workouts_payload(rng, count)) for count in args.workouts]
+    payloads += [(f"shopping x{count}", shopping_payload(rng, count)) for count in args.shopping]
+
+    header = f"{'payload':<16} {'encoder':<9} {'bytes':>9} {'compressed':>11} {'ratio':>7} {'ms':>8} {'MB/s':>8} {'KB saved/ms':>12}"
+    print(header)
+    print("-" * len(header))
+    for label, body in payloads:
+        for name, factory in ENCODERS:
+            size, seconds = measure(factory, body, args.repeat)
+            saved_per_ms = (len(body) - size) / 1024 / (seconds * 1000)
+            print(
+                f"{label:<16} {name:<9} {len(body):>9} {size:>11} {len(body) / size:>6.1f}x "
+                f"{seconds * 1000:>8.3f} {len(body) / seconds / 1e6:>8.1f} {saved_per_ms:>12.1f}"
+            )
+        print()
+
+    if compression.brotli is None or compression.zstandard is None:
+        print("ℹ️ Install brotli and zstandard to include br and zstd")
+
+
+if __name__ == "__main__":
+    main()
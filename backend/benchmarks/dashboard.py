@@ -0,0 +1,123 @@
+"""
+Home screen latency: one ``/dashboard`` call vs the separate summary calls.
+
+For each iteration a random synthetic user loads the home screen three
+ways: the five summary endpoints one after another, the same five calls
+issued concurrently (as the Mini App's queries do), and a single
+``/dashboard`` call. Each sample is the time until the whole screen's
+data is in.
+
+    python -m benchmarks.dashboard --seed-users 20 --iterations 500
+    python -m benchmarks.dashboard --iterations 500 --concurrency 10 --save dashboard.json
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date
+from typing import Dict, List
+
+import httpx
+
+from benchmarks import seed as seeding
+from benchmarks.load import init_data_headers, make_client
+from benchmarks.report import LatencyReport, load_baseline
+
+
+def home_screen_paths() -> List[str]:
+    today = date.today().isoformat()
+    return [
+        "/api/users/me/goals",
+        f"/api/nutrition/summary/{today}",
+        "/api/nutrition/water/today",
+        "/api/workouts/summary/weekly",
+        "/api/shopping/summary",
+    ]
+
+
+async def load_sequential(client: httpx.AsyncClient, headers: Dict[str, str]) -> bool:
+    responses = [await client.get(path, headers=headers) for path in home_screen_paths()]
+    return all(response.status_code < 400 for response in responses)
+
+
+async def load_concurrent(client: httpx.AsyncClient, headers: Dict[str, str]) -> bool:
+    responses = await asyncio.gather(*(client.get(path, headers=headers) for path in home_screen_paths()))
+    return all(response.status_code < 400 for response in responses)
+
+
+async def load_dashboard(client: httpx.AsyncClient, headers: Dict[str, str]) -> bool:
+    response = await client.get(f"/api/dashboard?summary_date={date.today().isoformat()}", headers=headers)
+    return response.status_code < 400
+
+
+STRATEGIES = {
+    "sequential (5 calls)": load_sequential,
+    "concurrent (5 calls)": load_concurrent,
+    "dashboard (1 call)": load_dashboard,
+}
+
+
+async def run_strategies(
+    client: httpx.AsyncClient,
+    headers: List[Dict[str, str]],
+    iterations: int,
+    concurrency: int,
+    seed_value: int = 42,
+) -> LatencyReport:
+    """Load the home screen ``iterations`` times per strategy from ``concurrency`` workers."""
+    rng = random.Random(seed_value)
+    plan = [(label, rng.choice(headers)) for _ in range(iterations) for label in STRATEGIES]
+    rng.shuffle(plan)
+    report = LatencyReport()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in plan:
+        queue.put_nowait(item)
+
+    async def worker():
+        while not queue.empty():
+            label, user_headers = queue.get_nowait()
+            start = time.perf_counter()
+            ok = await STRATEGIES[label](client, user_headers)
+            report.record(label, time.perf_counter() - start, ok=ok)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def run(args) -> LatencyReport:
+    if args.seed_users:
+        telegram_ids = await seeding.seed(args.seed_users, args.days, args.seed)
+    else:
+        telegram_ids = seeding.benchmark_telegram_ids(args.users)
+
+    async with make_client(args.base_url) as client:
+        headers = init_data_headers(telegram_ids)
+
+        # Warm up connection pools before measuring
+        await run_strategies(client, headers, min(args.iterations, 20), args.concurrency, args.seed)
+        return await run_strategies(client, headers, args.iterations, args.concurrency, args.seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dashboard vs separate calls benchmark")
+    parser.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--users", type=int, default=20, help="number of already seeded users to use")
+    parser.add_argument("--seed-users", type=int, default=0, help="seed this many users before running")
+    parser.add_argument("--days", type=int, default=180, help="days of history when seeding")
+    parser.add_argument("--iterations", type=int, default=300, help="home screen loads per strategy")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="write the summary as JSON (use as a baseline later)")
+    parser.add_argument("--baseline", help="compare against a previously saved summary")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(report.render(load_baseline(args.baseline)))
+    if args.save:
+        report.save(args.save)
+
+
+if __name__ == "__main__":
+    main()
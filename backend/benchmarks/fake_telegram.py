@@ -0,0 +1,76 @@
+"""
+In-process stand-in for the Telegram Bot API.
+
+``FakeTelegramRequest`` plugs into ``create_bot_application(request=...)``
+and answers Bot API calls locally with minimal valid payloads, so bot
+handlers can run without network access.
+"""
+import asyncio
+import json
+import time
+from collections import Counter
+from itertools import count
+from typing import Optional, Tuple
+
+from telegram.request import BaseRequest, RequestData
+
+BOT_USER = {
+    "id": 1,
+    "is_bot": True,
+    "first_name": "Lifeguard",
+    "username": "lifeguard_bench_bot",
+    "can_join_groups": False,
+    "can_read_all_group_messages": False,
+    "supports_inline_queries": False,
+}
+
+
+class FakeTelegramRequest(BaseRequest):
+    """Bot API transport that answers locally, optionally with simulated latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._message_ids = count(1)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def _message(self, parameters: dict) -> dict:
+        chat_id = int(parameters.get("chat_id", 0))
+        return {
+            "message_id": int(parameters.get("message_id") or next(self._message_ids)),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": BOT_USER,
+            "text": parameters.get("text", ""),
+        }
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        *args,
+        **kwargs,
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        self.calls[endpoint] += 1
+        parameters = request_data.parameters if request_data else {}
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if endpoint == "getMe":
+            result = BOT_USER
+        elif endpoint in ("sendMessage", "editMessageText"):
+            result = self._message(parameters)
+        elif endpoint == "getUpdates":
+            result = []
+        else:
+            result = True
+
+        return 200, json.dumps({"ok": True, "result": result}).encode()
@@ -0,0 +1,153 @@
+"""
+HTTP load benchmark for the API with signed synthetic users.
+
+Drives the FastAPI app in-process through the ASGI transport by default,
+or a running server with ``--base-url``. The database is whatever
+``DATABASE_URL`` points at, normally a local Postgres.
+
+    python -m benchmarks.load --seed-users 20 --requests 5000 --save baseline.json
+    python -m benchmarks.load --requests 5000 --baseline baseline.json
+
+A running server should be started with ``RATE_LIMIT_ENABLED=false``;
+synthetic users send far more requests than their budgets allow.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.security import sign_telegram_data
+from benchmarks.report import LatencyReport, load_baseline
+from benchmarks import seed as seeding
+
+# (label, weight, method, path builder, JSON body builder)
+Scenario = Tuple[str, int, str, Callable[[], str], Optional[Callable[[], dict]]]
+
+
+def build_scenarios() -> List[Scenario]:
+    today = date.today().isoformat()
+    return [
+        ("GET /users/me", 10, "GET", lambda: "/api/users/me", None),
+        ("GET /nutrition/summary/{date}", 15, "GET", lambda: f"/api/nutrition/summary/{today}", None),
+        ("GET /nutrition/meals", 10, "GET", lambda: f"/api/nutrition/meals?meal_date={today}", None),
+        ("GET /nutrition/water/today", 10, "GET", lambda: "/api/nutrition/water/today", None),
+        ("POST /nutrition/water", 5, "POST", lambda: "/api/nutrition/water", lambda: {"glasses": 1}),
+        ("POST /nutrition/meals", 5, "POST", lambda: "/api/nutrition/meals",
+         lambda: {"name": "Benchmark snack", "meal_type": "snack", "calories": 150}),
+        ("GET /workouts", 10, "GET", lambda: "/api/workouts?limit=20", None),
+        ("GET /workouts (history fields)", 5, "GET",
+         lambda: "/api/workouts?limit=20&fields=name,workout_type,workout_date,duration_minutes&include=exercise_count",
+         None),
+        ("GET /workouts/summary/weekly", 10, "GET", lambda: "/api/workouts/summary/weekly", None),
+        ("GET /shopping", 10, "GET", lambda: "/api/shopping", None),
+        ("GET /shopping/summary", 10, "GET", lambda: "/api/shopping/summary", None),
+    ]
+
+
+def init_data_headers(telegram_ids: List[int]) -> List[Dict[str, str]]:
+    """Signed ``X-Telegram-Init-Data`` headers, one per synthetic user."""
+    auth_date = int(time.time())
+    return [
+        {
+            "X-Telegram-Init-Data": sign_telegram_data({
+                "auth_date": auth_date,
+                "user": {"id": telegram_id, "first_name": "Bench"},
+            })
+        }
+        for telegram_id in telegram_ids
+    ]
+
+
+def make_client(base_url: Optional[str]) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=30)
+
+    from app.core.config import settings
+
+    # Measure the API, not the rate limiter's 429s
+    settings.rate_limit_enabled = False
+    from main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+        timeout=30,
+    )
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    headers: List[Dict[str, str]],
+    scenarios: List[Scenario],
+    total_requests: int,
+    concurrency: int,
+    seed_value: int = 42,
+) -> LatencyReport:
+    """Issue weighted random requests from ``concurrency`` workers."""
+    rng = random.Random(seed_value)
+    weights = [scenario[1] for scenario in scenarios]
+    plan = [
+        (rng.choice(headers), rng.choices(scenarios, weights)[0])
+        for _ in range(total_requests)
+    ]
+    report = LatencyReport()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in plan:
+        queue.put_nowait(item)
+
+    async def worker():
+        while not queue.empty():
+            user_headers, (label, _, method, path, body) = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.request(
+                method, path(), headers=user_headers, json=body() if body else None,
+            )
+            report.record(label, time.perf_counter() - start, ok=response.status_code < 400)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report.elapsed = time.perf_counter() - start
+
+    return report
+
+
+async def run(args) -> LatencyReport:
+    if args.seed_users:
+        telegram_ids = await seeding.seed(args.seed_users, args.days, args.seed)
+    else:
+        telegram_ids = seeding.benchmark_telegram_ids(args.users)
+
+    async with make_client(args.base_url) as client:
+        headers = init_data_headers(telegram_ids)
+        scenarios = build_scenarios()
+
+        # Warm up connection pools and caches before measuring
+        await run_load(client, headers, scenarios, min(args.requests, 200), args.concurrency, args.seed)
+        return await run_load(client, headers, scenarios, args.requests, args.concurrency, args.seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP load benchmark")
+    parser.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--users", type=int, default=20, help="number of already seeded users to use")
+    parser.add_argument("--seed-users", type=int, default=0, help="seed this many users before running")
+    parser.add_argument("--days", type=int, default=180, help="days of history when seeding")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="write the summary as JSON (use as a baseline later)")
+    parser.add_argument("--baseline", help="compare against a previously saved summary")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(report.render(load_baseline(args.baseline)))
+    if args.save:
+        report.save(args.save)
+
+
+if __name__ == "__main__":
+    main()
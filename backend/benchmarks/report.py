@@ -0,0 +1,82 @@
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class LatencyReport:
+    """Latency samples grouped by label (endpoint, handler, ...)."""
+    samples: Dict[str, List[float]] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    queries: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def record(self, label: str, seconds: float, ok: bool = True, queries: Optional[int] = None) -> None:
+        self.samples.setdefault(label, []).append(seconds)
+        if not ok:
+            self.errors[label] = self.errors.get(label, 0) + 1
+        if queries is not None:
+            self.queries[label] = self.queries.get(label, 0) + queries
+
+    def summary(self) -> Dict[str, dict]:
+        total_elapsed = self.elapsed or 1e-9
+        summary = {}
+        for label, values in sorted(self.samples.items()):
+            row = {
+                "count": len(values),
+                "errors": self.errors.get(label, 0),
+                "p50_ms": round(percentile(values, 50) * 1000, 2),
+                "p95_ms": round(percentile(values, 95) * 1000, 2),
+                "p99_ms": round(percentile(values, 99) * 1000, 2),
+                "throughput_rps": round(len(values) / total_elapsed, 1),
+            }
+            if label in self.queries:
+                row["db_queries_avg"] = round(self.queries[label] / len(values), 2)
+            summary[label] = row
+        return summary
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def render(self, baseline: Optional[Dict[str, dict]] = None) -> str:
+        """Format the summary as a table, with p95 deltas against a baseline."""
+        header = f"{'label':<45} {'count':>7} {'err':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'rps':>8}"
+        if self.queries:
+            header += f" {'q/op':>6}"
+        if baseline:
+            header += f" {'Δp95':>8}"
+        lines = [header, "-" * len(header)]
+
+        for label, row in self.summary().items():
+            line = (
+                f"{label:<45} {row['count']:>7} {row['errors']:>5} {row['p50_ms']:>9} "
+                f"{row['p95_ms']:>9} {row['p99_ms']:>9} {row['throughput_rps']:>8}"
+            )
+            if self.queries:
+                line += f" {row.get('db_queries_avg', 0):>6}"
+            if baseline and label in baseline and baseline[label]["p95_ms"]:
+                change = (row["p95_ms"] / baseline[label]["p95_ms"] - 1) * 100
+                line += f" {change:>+7.1f}%"
+            lines.append(line)
+
+        total = sum(len(values) for values in self.samples.values())
+        lines.append(f"\n{total} operations in {self.elapsed:.2f}s ({total / (self.elapsed or 1e-9):.1f}/s)")
+        return "\n".join(lines)
+
+
+def load_baseline(path: Optional[str]) -> Optional[Dict[str, dict]]:
+    if not path:
+        return None
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,157 @@
+"""
+Seed synthetic users with realistic histories for benchmarking.
+
+Benchmark users live in a reserved Telegram id range and are replaced on
+every run, so seeding is reproducible for a given ``--seed``.
+
+    python -m benchmarks.seed --users 50 --days 365
+"""
+import argparse
+import asyncio
+import random
+from datetime import date, timedelta
+from typing import List
+
+from sqlalchemy import delete, insert
+
+from app.core.database import async_session_maker
+from app.models.nutrition import MealType, WaterLog
+from app.models.shopping import ShoppingCategory, ShoppingItem
+from app.models.user import User
+from app.models.workout import WorkoutType
+from app.schemas.nutrition import MealCreate
+from app.schemas.workout import ExerciseCreate, WorkoutCreate
+from app.services.bulk import insert_meals, insert_workouts
+from app.services.meal_suggestions import rebuild_meal_suggestions
+from app.services.rollups import rebuild_rollups
+
+# Reserved range so benchmark data never collides with real Telegram users
+BENCHMARK_TELEGRAM_ID_BASE = 9_000_000_000
+
+MEALS = {
+    MealType.BREAKFAST: [("Oatmeal with berries", 350, 12, 60, 7), ("Scrambled eggs", 300, 20, 2, 22), ("Greek yogurt", 180, 17, 9, 8)],
+    MealType.LUNCH: [("Chicken rice bowl", 650, 45, 75, 15), ("Tuna salad", 420, 35, 12, 25), ("Lentil soup", 380, 22, 55, 6)],
+    MealType.DINNER: [("Salmon with potatoes", 700, 42, 55, 30), ("Beef stir fry", 620, 40, 45, 28), ("Pasta bolognese", 750, 35, 90, 22)],
+    MealType.SNACK: [("Protein shake", 200, 30, 8, 3), ("Apple", 95, 0.5, 25, 0.3), ("Almonds", 170, 6, 6, 15)],
+}
+EXERCISES = [
+    ("Squat", 5, 5, 100.0), ("Bench press", 5, 5, 80.0), ("Deadlift", 3, 5, 140.0),
+    ("Overhead press", 4, 8, 50.0), ("Barbell row", 4, 8, 70.0), ("Pull-up", 4, 10, None),
+]
+SHOPPING = [
+    ("Milk", ShoppingCategory.DAIRY), ("Eggs", ShoppingCategory.DAIRY), ("Bananas", ShoppingCategory.PRODUCE),
+    ("Spinach", ShoppingCategory.PRODUCE), ("Chicken breast", ShoppingCategory.MEAT), ("Salmon", ShoppingCategory.SEAFOOD),
+    ("Bread", ShoppingCategory.BAKERY), ("Rice", ShoppingCategory.PANTRY), ("Coffee", ShoppingCategory.BEVERAGES),
+    ("Whey protein", ShoppingCategory.SUPPLEMENTS), ("Frozen berries", ShoppingCategory.FROZEN),
+]
+
+
+def benchmark_telegram_ids(users: int) -> List[int]:
+    return [BENCHMARK_TELEGRAM_ID_BASE + i for i in range(users)]
+
+
+def generate_meals(rng: random.Random, day: date) -> List[MealCreate]:
+    meal_types = [MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER]
+    meal_types += [MealType.SNACK] * rng.randint(0, 2)
+    meals = []
+    for meal_type in meal_types:
+        name, calories, protein, carbs, fat = rng.choice(MEALS[meal_type])
+        scale = rng.uniform(0.8, 1.2)
+        meals.append(MealCreate(
+            name=name,
+            meal_type=meal_type,
+            calories=int(calories * scale),
+            protein=round(protein * scale, 1),
+            carbs=round(carbs * scale, 1),
+            fat=round(fat * scale, 1),
+            meal_date=day,
+        ))
+    return meals
+
+
+def generate_workout(rng: random.Random, day: date) -> WorkoutCreate:
+    exercises = [
+        ExerciseCreate(
+            name=name,
+            sets=sets,
+            reps=reps,
+            weight=round(weight * rng.uniform(0.9, 1.1), 1) if weight else None,
+            order=i,
+        )
+        for i, (name, sets, reps, weight) in enumerate(rng.sample(EXERCISES, rng.randint(3, 6)))
+    ]
+    return WorkoutCreate(
+        name="Strength session",
+        workout_type=WorkoutType.STRENGTH,
+        duration_minutes=rng.randint(40, 90),
+        calories_burned=rng.randint(250, 600),
+        workout_date=day,
+        exercises=exercises,
+    )
+
+
+async def seed_user(session, rng: random.Random, telegram_id: int, days: int) -> None:
+    user = User(telegram_id=telegram_id, first_name=f"Bench {telegram_id - BENCHMARK_TELEGRAM_ID_BASE}")
+    session.add(user)
+    await session.flush()
+
+    today = date.today()
+    history = [today - timedelta(days=offset) for offset in range(days)]
+
+    meals = [meal for day in history for meal in generate_meals(rng, day)]
+    workouts = [generate_workout(rng, day) for day in history if rng.random() < 0.45]
+    water_rows = [
+        {"user_id": user.id, "glasses": rng.randint(1, 3), "log_date": day}
+        for day in history
+        for _ in range(rng.randint(1, 4))
+    ]
+    shopping_rows = [
+        {
+            "user_id": user.id,
+            "name": name,
+            "category": category,
+            "quantity": str(rng.randint(1, 3)),
+            "is_purchased": rng.random() < 0.3,
+        }
+        for name, category in rng.sample(SHOPPING, rng.randint(4, len(SHOPPING)))
+    ]
+
+    await insert_meals(session, user.id, meals, returning=False)
+    await insert_workouts(session, user.id, workouts)
+    await session.execute(insert(WaterLog), water_rows)
+    await session.execute(insert(ShoppingItem), shopping_rows)
+
+    # Derived tables, as the import job builds them, so reads see real data
+    await rebuild_meal_suggestions(session, user.id)
+    await rebuild_rollups(session, user)
+
+
+async def seed(users: int, days: int, seed_value: int = 42) -> List[int]:
+    """Replace benchmark users with freshly generated histories."""
+    rng = random.Random(seed_value)
+    telegram_ids = benchmark_telegram_ids(users)
+
+    async with async_session_maker() as session:
+        await session.execute(
+            delete(User).where(User.telegram_id >= BENCHMARK_TELEGRAM_ID_BASE)
+        )
+        for telegram_id in telegram_ids:
+            await seed_user(session, rng, telegram_id, days)
+        await session.commit()
+
+    return telegram_ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed synthetic benchmark users")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--days", type=int, default=180, help="days of history per user")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    telegram_ids = asyncio.run(seed(args.users, args.days, args.seed))
+    print(f"🌱 Seeded {len(telegram_ids)} users with {args.days} days of history")
+
+
+if __name__ == "__main__":
+    main()
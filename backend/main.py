@@ -3,10 +3,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.api.router import api_router
-from app.bot.handlers import create_bot_application
+from app.core.database import engine
+from app.core.events import broker
+from app.core.jobs import worker
+from app.core.metrics import MetricsMiddleware, instrument_engine, registry
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.query_inspector import QueryInspectorMiddleware, install_query_inspector
+from app.core.warmup import db_round_trip_ms, pool_status, warmup
+from app.api.router import include_api_routers
+from app.services.partitions import ensure_partitions
 
 
 bot_app = None
@@ -19,6 +28,9 @@ async def start_bot():
         print("⚠️ No Telegram bot token provided, bot not started")
         return
     
+    # python-telegram-bot is only imported by processes that run the bot
+    from app.bot.handlers import create_bot_application
+    
     bot_app = create_bot_application()
     await bot_app.initialize()
     await bot_app.start()
@@ -36,12 +48,36 @@ async def stop_bot():
         print("🤖 Telegram bot stopped")
 
 
+def bot_status() -> str:
+    if bot_app is not None:
+        return "running" if bot_app.running else "stopped"
+    if settings.environment != "development":
+        return "webhook"
+    return "disabled" if not settings.telegram_bot_token else "stopped"
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     print(f"🚀 Starting {settings.app_name}...")
     
+    # Open and prime pool connections in the background; /ready fails until done
+    warmup.start(engine, settings.db_warmup_connections)
+    
+    # Monthly partitions for meals, water logs and workouts (PostgreSQL only)
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, settings.partition_months_ahead)
+    if created:
+        print(f"🗂️ Created partitions: {', '.join(created)}")
+    
+    # Live update fan-out (LISTEN/NOTIFY connection for the postgres backend)
+    await broker.start()
+    
+    # Background jobs (or run scripts.worker separately with JOBS_WORKER_ENABLED=false)
+    if settings.jobs_worker_enabled:
+        await worker.start()
+    
     # Initialize bot if token is provided
     if settings.environment == "development":
         await start_bot()
@@ -54,6 +90,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     await stop_bot()
+    await warmup.stop()
+    await worker.stop()
+    await broker.stop()
     print(f"👋 Shutting down {settings.app_name}...")
 
 
@@ -64,6 +103,11 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Per-user token buckets and a concurrency ceiling; added before CORS so
+# CORS wraps it and 429/503 responses stay readable by the webapp
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
+
 # CORS middleware for webapp
 app.add_middleware(
     CORSMiddleware,
@@ -78,8 +122,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip (or brotli/zstd when installed) for large bodies and event streams
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_bytes)
+
+# Request latency, status and DB usage metrics
+if settings.metrics_enabled:
+    instrument_engine(engine)
+    app.add_middleware(MetricsMiddleware)
+
+# N+1 and slow query detection for development and staging
+if settings.query_inspector_enabled:
+    install_query_inspector(engine)
+    app.add_middleware(QueryInspectorMiddleware)
+
 # Include API routes
-app.include_router(api_router, prefix="/api")
+include_api_routers(app)
 
 
 @app.get("/")
@@ -98,6 +156,41 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness check: fails until the DB pool is warmed up and while the DB is unreachable."""
+    body = {
+        "status": "ready",
+        "warmup": {
+            "done": warmup.ready,
+            "connections": warmup.connections,
+            "duration_ms": warmup.duration_ms,
+            "error": warmup.error,
+        },
+        "pool": pool_status(engine),
+        "bot": bot_status(),
+    }
+    
+    try:
+        body["db_ms"] = await db_round_trip_ms(engine, settings.ready_db_timeout_seconds)
+    except Exception as exc:
+        body["db_ms"] = None
+        body["db_error"] = repr(exc)
+    
+    if not warmup.ready or body["db_ms"] is None:
+        body["status"] = "not_ready"
+        return JSONResponse(body, status_code=503)
+    return body
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Metrics in the Prometheus text exposition format."""
+    if not settings.metrics_enabled:
+        return PlainTextResponse("Metrics disabled\n", status_code=404)
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
     
@@ -0,0 +1,36 @@
+"""
+Move old meals and water logs into the history archive.
+
+Run from the backend directory (e.g. monthly from cron):
+
+    python -m scripts.archive_history --older-than-days 730
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.services.archive import archive_history, month_start
+
+
+async def run(older_than_days: int) -> int:
+    cutoff = month_start(date.today() - timedelta(days=older_than_days))
+    async with async_session_maker() as session:
+        archived = await archive_history(session, cutoff)
+
+    for kind, count in archived.items():
+        print(f"📦 Archived {count} {kind.replace('_', ' ')} dated before {cutoff}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--older-than-days", type=int, default=settings.archive_after_days)
+    args = parser.parse_args()
+    return asyncio.run(run(args.older_than_days))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
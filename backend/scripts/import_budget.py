@@ -0,0 +1,101 @@
+"""
+Check import time of each entry point against a budget.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime``
+(best of several runs) and must stay under its budget without pulling in
+modules it doesn't need, such as python-telegram-bot in the HTTP app or
+FastAPI in migrations. Run from the backend directory, e.g. in CI:
+
+    python -m scripts.import_budget
+    python -m scripts.import_budget --runs 5 --scale 2.0
+"""
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    name: str
+    code: str
+    budget_ms: float
+    forbidden: Tuple[str, ...] = ()
+
+
+ENTRY_POINTS = (
+    # HTTP replicas: the app without the bot stack or NumPy
+    EntryPoint("api", "import main", 2000, ("telegram", "numpy")),
+    # alembic/env.py imports every model and nothing else
+    EntryPoint(
+        "migrations",
+        "import importlib, pkgutil, app.models\n"
+        "for module in pkgutil.iter_modules(app.models.__path__):\n"
+        "    importlib.import_module('app.models.' + module.name)",
+        800,
+        ("fastapi", "telegram", "numpy"),
+    ),
+    EntryPoint("worker", "import scripts.worker", 1000, ("fastapi", "telegram")),
+    EntryPoint("bot", "import app.bot.handlers", 1500, ("numpy",)),
+)
+
+
+def measure(code: str) -> Tuple[float, Dict[str, float]]:
+    """Total import time in ms and the cumulative ms of every top-level package imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            package = match.group(4).split(".")[0]
+            packages[package] = max(packages.get(package, 0.0), int(match.group(2)) / 1000)
+
+    # Top-level statements of the -c code aren't imports; sum the root imports instead
+    total = sum(
+        int(match.group(2)) / 1000
+        for match in map(IMPORTTIME_LINE.match, result.stderr.splitlines())
+        if match and len(match.group(3)) == 1
+    )
+    return total, packages
+
+
+def check(entry: EntryPoint, runs: int, scale: float) -> Optional[str]:
+    best_total, packages = min((measure(entry.code) for _ in range(runs)), key=lambda measured: measured[0])
+    budget = entry.budget_ms * scale
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:3]
+    summary = ", ".join(f"{package} {ms:.0f}ms" for package, ms in heaviest)
+
+    problems = [f"imports {package}" for package in entry.forbidden if package in packages]
+    if best_total > budget:
+        problems.append(f"over budget ({budget:.0f}ms)")
+
+    status = "❌" if problems else "✅"
+    print(f"{status} {entry.name}: {best_total:.0f}ms [{summary}]" + (f" — {'; '.join(problems)}" if problems else ""))
+    return "; ".join(problems) or None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply budgets, e.g. for slow CI runners")
+    parser.add_argument("entry_points", nargs="*", help=", ".join(entry.name for entry in ENTRY_POINTS))
+    args = parser.parse_args()
+
+    unknown = set(args.entry_points) - {entry.name for entry in ENTRY_POINTS}
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+
+    selected = [entry for entry in ENTRY_POINTS if not args.entry_points or entry.name in args.entry_points]
+    failures = [entry.name for entry in selected if check(entry, args.runs, args.scale)]
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Import meal or workout history from a local file.
+
+Run from the backend directory:
+
+    python -m scripts.import_history --telegram-id 123456 meals history.csv
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from app.core.database import async_session_maker
+from app.models.user import User
+from app.schemas.importer import ImportFormat, ImportKind
+from app.services.importer import detect_format, import_records, read_records
+
+
+async def run(telegram_id: int, kind: ImportKind, path: str, import_format: ImportFormat) -> int:
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(User).where(User.telegram_id == telegram_id)
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            print(f"❌ No user with Telegram id {telegram_id}", file=sys.stderr)
+            return 1
+
+        with open(path, "rb") as stream:
+            report = await import_records(session, user.id, kind, read_records(stream, import_format))
+
+    print(f"✅ Imported {report.imported_rows} of {report.total_rows} {kind.value}")
+    for error in report.errors:
+        print(f"  row {error.row}: {error.error}", file=sys.stderr)
+    if report.failed_rows > len(report.errors):
+        print(f"  ... and {report.failed_rows - len(report.errors)} more", file=sys.stderr)
+
+    return 0 if not report.failed_rows else 2
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--telegram-id", type=int, required=True)
+    parser.add_argument("--format", type=ImportFormat, choices=list(ImportFormat))
+    parser.add_argument("kind", type=ImportKind, choices=list(ImportKind))
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    import_format = args.format or detect_format(args.path)
+    if not import_format:
+        parser.error("cannot detect file format, pass --format")
+
+    return asyncio.run(run(args.telegram_id, args.kind, args.path, import_format))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
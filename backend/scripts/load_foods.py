@@ -0,0 +1,74 @@
+"""
+Bulk load a food catalog from a local file.
+
+Accepts CSV/TSV (including Open Food Facts exports) or JSON Lines. Run
+from the backend directory:
+
+    python -m scripts.load_foods --source off en.openfoodfacts.org.products.csv
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from itertools import islice
+from typing import Iterator
+
+from sqlalchemy import delete
+
+from app.core.database import async_session_maker
+from app.models.food import Food
+from app.services.foods import food_rows, insert_foods
+
+CHUNK_SIZE = 5000
+
+
+def read_catalog(path: str) -> Iterator[dict]:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        # Open Food Facts ships tab-separated data with a .csv extension
+        header = f.readline()
+        f.seek(0)
+        delimiter = "\t" if "\t" in header else ","
+        csv.field_size_limit(sys.maxsize)
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+
+async def load(path: str, source: str, truncate: bool) -> int:
+    loaded = 0
+    rows = food_rows(read_catalog(path), source=source)
+
+    async with async_session_maker() as session:
+        if truncate:
+            await session.execute(delete(Food))
+
+        while True:
+            chunk = list(islice(rows, CHUNK_SIZE))
+            if not chunk:
+                break
+            await insert_foods(session, chunk)
+            await session.commit()
+            loaded += len(chunk)
+            print(f"  {loaded} foods loaded", end="\r", file=sys.stderr)
+
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk load the food catalog")
+    parser.add_argument("path")
+    parser.add_argument("--source", help="label stored with each row, e.g. 'off'")
+    parser.add_argument("--truncate", action="store_true", help="replace the existing catalog")
+    args = parser.parse_args()
+
+    loaded = asyncio.run(load(args.path, args.source, args.truncate))
+    print(f"✅ Loaded {loaded} foods")
+
+
+if __name__ == "__main__":
+    main()
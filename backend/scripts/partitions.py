@@ -0,0 +1,88 @@
+"""
+Maintain monthly partitions of meals, water logs and workouts.
+
+Run from the backend directory (e.g. monthly from cron):
+
+    python -m scripts.partitions ensure --months-ahead 3
+    python -m scripts.partitions detach workouts 2023-01 --drop
+    python -m scripts.partitions check-pruning
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date, datetime
+
+from app.core.config import settings
+from app.core.database import engine
+from app.services.partitions import (
+    PARTITIONED_TABLES,
+    check_pruning,
+    detach_partition,
+    ensure_partitions,
+    partition_name,
+)
+
+
+async def ensure(months_ahead: int) -> int:
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, months_ahead)
+    if created:
+        print(f"🗂️ Created partitions: {', '.join(created)}")
+    else:
+        print("✅ Partitions already in place")
+    return 0
+
+
+async def detach(table: str, month: date, drop: bool) -> int:
+    async with engine.begin() as conn:
+        detached = await detach_partition(conn, table, month, drop=drop)
+    name = partition_name(table, month)
+    if not detached:
+        print(f"❌ No partition {name}", file=sys.stderr)
+        return 1
+    print(f"🗑️ Dropped {name}" if drop else f"📦 Detached {name}")
+    return 0
+
+
+async def pruning() -> int:
+    async with engine.connect() as conn:
+        checks = await check_pruning(conn)
+    if not checks:
+        print("⚠️ No partitioned tables (not PostgreSQL, or migration 008 not applied)")
+        return 0
+
+    failed = 0
+    for check in checks:
+        if check.ok:
+            print(f"✅ {check.table}: scans {', '.join(check.scanned)}")
+        else:
+            failed += 1
+            print(f"❌ {check.table}: scans {', '.join(check.scanned)}, expected {', '.join(check.expected)}")
+            print(f"   {check.query}")
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ensure_parser = commands.add_parser("ensure", help="create partitions up to N months ahead")
+    ensure_parser.add_argument("--months-ahead", type=int, default=settings.partition_months_ahead)
+
+    detach_parser = commands.add_parser("detach", help="detach (or drop) one month")
+    detach_parser.add_argument("table", choices=list(PARTITIONED_TABLES))
+    detach_parser.add_argument("month", type=lambda value: datetime.strptime(value, "%Y-%m").date())
+    detach_parser.add_argument("--drop", action="store_true")
+
+    commands.add_parser("check-pruning", help="EXPLAIN date-filtered reads and verify pruning")
+
+    args = parser.parse_args()
+    if args.command == "ensure":
+        return asyncio.run(ensure(args.months_ahead))
+    if args.command == "detach":
+        return asyncio.run(detach(args.table, args.month, args.drop))
+    return asyncio.run(pruning())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
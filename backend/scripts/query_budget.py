@@ -0,0 +1,84 @@
+"""
+Check API endpoints against query budgets.
+
+Seeds one synthetic user (in the benchmark id range, replaced on every
+run), then calls each endpoint in-process under ``assert_query_budget``:
+N+1 patterns, slow statements or more statements than budgeted fail the
+run. Budgets are for warm requests (each endpoint is called once first,
+which also builds lazily created rollups) and include the statement that
+resolves the user. Point
+``DATABASE_URL`` at a migrated scratch database, e.g. in CI:
+
+    python -m scripts.query_budget
+    python -m scripts.query_budget --slow-ms 500
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+from typing import List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.query_inspector import QueryInspectionError, assert_query_budget
+from benchmarks import seed as seeding
+from benchmarks.load import init_data_headers
+
+# (path, max statements)
+def budgets() -> List[Tuple[str, int]]:
+    today = date.today().isoformat()
+    return [
+        ("/api/users/me", 1),
+        (f"/api/nutrition/summary/{today}", 3),
+        (f"/api/nutrition/meals?meal_date={today}", 2),
+        ("/api/nutrition/water/today", 2),
+        ("/api/workouts?limit=50", 3),
+        ("/api/workouts?limit=50&fields=name,workout_date&include=exercise_count", 2),
+        ("/api/workouts/summary/weekly", 2),
+        ("/api/shopping", 2),
+        ("/api/shopping/summary", 2),
+        ("/api/progress/streaks", 3),
+        ("/api/dashboard", 5),
+    ]
+
+
+async def check(slow_ms: Optional[float]) -> List[str]:
+    telegram_ids = await seeding.seed(1, 90)
+    headers = init_data_headers(telegram_ids)[0]
+
+    # Budgets are about the endpoints, not the rate limiter
+    settings.rate_limit_enabled = False
+    from main import app
+
+    failures = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://query-budget", headers=headers) as client:
+        paths = budgets()
+        for path, _ in paths:
+            await client.get(path)
+
+        for path, max_queries in paths:
+            try:
+                with assert_query_budget(max_queries, slow_ms=slow_ms) as report:
+                    response = await client.get(path)
+                    response.raise_for_status()
+            except QueryInspectionError as exc:
+                print(f"❌ {path}: {report.total_queries} queries (budget {max_queries})\n{exc}")
+                failures.append(path)
+                continue
+            print(f"✅ {path}: {report.total_queries} queries (budget {max_queries})")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slow-ms", type=float, help="slow statement limit (default from settings)")
+    args = parser.parse_args()
+
+    failures = asyncio.run(check(args.slow_ms))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Run a background job worker outside the API process.
+
+Run from the backend directory, and set JOBS_WORKER_ENABLED=false for
+the API if all jobs should run here:
+
+    python -m scripts.worker
+"""
+import asyncio
+import signal
+import sys
+
+import app.services.jobs  # noqa: F401 (registers job handlers)
+from app.core.jobs import worker
+
+
+async def run() -> int:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await worker.start()
+    print(f"👷 Job worker {worker.worker_id} started")
+    await stop.wait()
+    await worker.stop()
+    print("👋 Job worker stopped")
+    return 0
+
+
+def main() -> int:
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())